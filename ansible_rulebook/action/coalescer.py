@@ -0,0 +1,126 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def coalesce_key(*parts: Any) -> str:
+    """Build a coalescing key from the parts that must match to share a
+    launch. Dictionaries are compared by content, not by key order.
+    """
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+def strip_eda_vars(extra_vars: Dict) -> Dict:
+    """Drop the per match ansible_eda data, it differs for every firing."""
+    return {k: v for k, v in (extra_vars or {}).items() if k != "ansible_eda"}
+
+
+class _Batch:
+    def __init__(self):
+        self.hosts: List[str] = []
+        self.all_hosts = False
+        self.members = 0
+        self.task: asyncio.Task = None
+
+    def add(self, hosts: List[str]) -> None:
+        self.members += 1
+        if not hosts:
+            # No limit means every host, nothing can widen it
+            self.all_hosts = True
+        for host in hosts:
+            if host not in self.hosts:
+                self.hosts.append(host)
+
+    @property
+    def limit(self) -> str:
+        if self.all_hosts:
+            return ""
+        return ",".join(self.hosts)
+
+
+class LaunchCoalescer:
+    """Merge launches of the same job into one.
+
+    The first caller for a key opens a batch and the launch happens once
+    the coalescing window has passed. Callers joining the batch in the
+    meantime add their hosts to the limit and get the result of the
+    shared launch. The launch runs in its own task so cancelling any one
+    of the callers doesn't affect the others.
+    """
+
+    def __init__(self):
+        self._batches: Dict[Hashable, _Batch] = {}
+
+    async def join(
+        self,
+        key: Hashable,
+        hosts: List[str],
+        launch: Callable[[str], Awaitable[Any]],
+        window: float,
+        opened: Optional[Callable[[asyncio.Task], None]] = None,
+    ) -> Any:
+        """Join the open batch for key or open a new one.
+
+        Args:
+            key: Launches with the same key are merged
+            hosts: The hosts this caller wants the job limited to, an
+                empty list means all hosts
+            launch: Coroutine function called with the merged host limit,
+                only the first caller's launch is used
+            window: Seconds to wait for other callers before launching
+            opened: Called with the task of the shared launch when this
+                caller opens the batch, the launch may outlive the caller
+
+        Returns:
+            The result of the shared launch
+        """
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = _Batch()
+            self._batches[key] = batch
+            batch.task = asyncio.create_task(
+                self._launch(key, batch, launch, window)
+            )
+            if opened is not None:
+                opened(batch.task)
+        batch.add(hosts)
+        return await asyncio.shield(batch.task)
+
+    async def _launch(
+        self,
+        key: Hashable,
+        batch: _Batch,
+        launch: Callable[[str], Awaitable[Any]],
+        window: float,
+    ) -> Any:
+        try:
+            await asyncio.sleep(window)
+        finally:
+            del self._batches[key]
+        if batch.members > 1:
+            logger.info(
+                "Coalesced %d launches into one, limit: %s",
+                batch.members,
+                batch.limit or "all hosts",
+            )
+        return await launch(batch.limit)
+
+
+launch_coalescer = LaunchCoalescer()
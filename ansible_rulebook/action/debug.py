@@ -72,7 +72,7 @@ class Debug:
                 {
                     "inventory": self.helper.control.inventory,
                     "hosts": self.helper.control.hosts,
-                    "variables": self.helper.control.variables,
+                    "variables": dict(self.helper.control.variables),
                     "project_data_file": project_data_file,
                 }
             )
@@ -167,7 +167,8 @@ class Helper:
 
         This method persists action execution state to the database when
         persistence is enabled, allowing actions to be tracked and recovered
-        across rulebook restarts or failover scenarios.
+        across rulebook restarts or failover scenarios. The state is written
+        right away, it is what a recovering instance resumes from.
 
         Args:
             info: Dictionary containing action state information to persist
@@ -181,6 +182,7 @@ class Helper:
                 self.metadata.persistent_info.matching_uuid,
                 self.metadata.persistent_info.action_index,
                 info,
+                flush=True,
             )
 
     def get_event_uuid_label(self) -> str:
@@ -31,6 +31,7 @@ from ansible_rulebook.job_template_runner import (
 )
 from ansible_rulebook.util import process_controller_host_limit, run_at
 
+from .coalescer import coalesce_key, launch_coalescer, strip_eda_vars
 from .control import Control
 from .helper import Helper
 from .metadata import Metadata
@@ -60,6 +61,8 @@ class RunJobTemplate:
             self.helper.control.hosts,
         )
         self.controller_job = {}
+        # False while a coalesced launch of another match is shared
+        self.launched = True
         self.display = terminal.Display()
 
     async def __call__(self):
@@ -128,12 +131,7 @@ class RunJobTemplate:
                 )
 
             if not job_url:
-                job_url = await job_template_runner.launch_job_template(
-                    self.name,
-                    self.organization,
-                    self.job_args,
-                    job_labels,
-                )
+                job_url = await self._launch(job_labels)
                 logger.info(f"Job Launched, url: {job_url}")
                 self.helper.update_action_state({"job_url": job_url})
 
@@ -148,6 +146,47 @@ class RunJobTemplate:
 
         return last_job
 
+    async def _launch(self, job_labels: list) -> str:
+        window = self.action_args.get("coalesce_window", 0)
+        if window <= 0:
+            return await job_template_runner.launch_job_template(
+                self.name,
+                self.organization,
+                self.job_args,
+                job_labels,
+            )
+
+        async def _launch_with_limit(limit: str) -> str:
+            self.launched = True
+            return await job_template_runner.launch_job_template(
+                self.name,
+                self.organization,
+                {**self.job_args, "limit": limit},
+                job_labels,
+            )
+
+        # Only the match whose launch is shared sets its facts
+        self.launched = False
+
+        job_args = dict(self.job_args)
+        limit = job_args.pop("limit")
+        job_args["extra_vars"] = strip_eda_vars(job_args.get("extra_vars"))
+        return await launch_coalescer.join(
+            coalesce_key(
+                JOB_TEMPLATE_TYPE,
+                self.name,
+                self.organization,
+                job_args,
+                sorted(job_labels),
+                self.action_args.get("set_facts", False),
+                self.action_args.get("post_events", False),
+                self.action_args.get("ruleset", self.helper.metadata.rule_set),
+            ),
+            limit.split(",") if limit else [],
+            _launch_with_limit,
+            window,
+        )
+
     async def _post_process(self) -> None:
         a_log = {
             "job_template_name": self.name,
@@ -169,6 +208,13 @@ class RunJobTemplate:
         await self.helper.send_status(a_log)
         set_facts = self.action_args.get("set_facts", False)
         post_events = self.action_args.get("post_events", False)
+        if not self.launched and (set_facts or post_events):
+            logger.debug(
+                "Facts of controller job %s are set by the match that "
+                "launched it",
+                a_log["controller_job_id"],
+            )
+            return
 
         if set_facts or post_events:
             # Default to output events at debug level.
@@ -44,7 +44,7 @@ class RunModule(RunPlaybook):
         self.playbook = os.path.join(self.private_data_dir, "wrapper.yml")
         self._wrap_module_in_playbook()
 
-    def _copy_playbook_files(self, project_dir):
+    async def _copy_playbook_files(self, project_dir):
         pass
 
     def _runner_args(self):
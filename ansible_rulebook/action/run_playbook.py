@@ -13,7 +13,6 @@
 #  limitations under the License.
 
 import asyncio
-import glob
 import logging
 import os
 import shutil
@@ -35,17 +34,17 @@ from ansible_rulebook.exception import (
     PlaybookNotFoundException,
     PlaybookStatusNotFoundException,
 )
-from ansible_rulebook.util import create_inventory, run_at
+from ansible_rulebook.util import run_at
 
+from .coalescer import coalesce_key, launch_coalescer, strip_eda_vars
 from .control import Control
 from .helper import Helper
 from .metadata import Metadata
 from .runner import Runner
+from .workspace import workspace_cache
 
 logger = logging.getLogger(__name__)
 
-tar = shutil.which("tar")
-
 
 class RunPlaybook:
     """run_playbook action runs an ansible playbook using the
@@ -72,6 +71,9 @@ class RunPlaybook:
         self.inventory = None
         self.display = terminal.Display()
         self.artifacts_from_runner = None
+        self.run_result = {}
+        # Launch of a coalesced run that uses the private data dir
+        self._shared_launch = None
 
     async def __call__(self):
         try:
@@ -85,8 +87,22 @@ class RunPlaybook:
             logger.debug("Calling Ansible runner")
             await self._run()
         finally:
-            if os.path.exists(self.private_data_dir):
-                shutil.rmtree(self.private_data_dir)
+            self._remove_private_data_dir()
+
+    def _remove_private_data_dir(self) -> None:
+        launch = self._shared_launch
+        if launch is not None and not launch.done():
+            # The matches coalesced with this one still run from it
+            launch.add_done_callback(
+                lambda _: shutil.rmtree(
+                    self.private_data_dir, ignore_errors=True
+                )
+            )
+        elif os.path.exists(self.private_data_dir):
+            shutil.rmtree(self.private_data_dir)
+
+    def _share_private_data_dir(self, launch: asyncio.Task) -> None:
+        self._shared_launch = launch
 
     async def _job_start_event(self):
         await self.helper.send_status(
@@ -117,24 +133,65 @@ class RunPlaybook:
                     "Previous run_playbook failed. Retry %d of %d", i, retries
                 )
 
-            runner = Runner(
-                self.private_data_dir,
-                self.host_limit,
-                self.verbosity,
-                self.job_id,
-                self.json_mode,
-                self.helper,
-                self._runner_args(),
-            )
-            await runner()
+            self.run_result = await self._launch()
+            self.artifacts_from_runner = self.run_result["artifacts"]
 
-            self.artifacts_from_runner = runner.get_artifacts()
-
-            if self._get_latest_artifact("status") != "failed":
+            if self.run_result["status"] != "failed":
                 break
 
         await self._post_process()
 
+    async def _launch(self) -> dict:
+        window = self.action_args.get("coalesce_window", 0)
+        if window <= 0:
+            return await self._run_runner(self.host_limit)
+        return await launch_coalescer.join(
+            coalesce_key(
+                self.helper.action,
+                self.name,
+                strip_eda_vars(self.action_args.get("extra_vars")),
+                self.action_args.get("module_args"),
+                self.verbosity,
+                self.json_mode,
+                self.action_args.get("event_forwarding"),
+                self.action_args.get("set_facts", False),
+                self.action_args.get("post_events", False),
+                self.action_args.get("ruleset", self.helper.metadata.rule_set),
+            ),
+            self.helper.control.hosts,
+            self._run_runner,
+            window,
+            opened=self._share_private_data_dir,
+        )
+
+    async def _run_runner(self, host_limit: str) -> dict:
+        runner = Runner(
+            self.private_data_dir,
+            host_limit,
+            self.verbosity,
+            self.job_id,
+            self.json_mode,
+            self.helper,
+            self._runner_args(),
+            self.action_args.get("event_forwarding"),
+        )
+        await runner()
+
+        if runner.rc is None or runner.status is None:
+            raise PlaybookStatusNotFoundException(
+                f"No rc or status found for {self.name}"
+            )
+        result = {
+            "job_id": self.job_id,
+            "rc": runner.rc,
+            "status": runner.status,
+            "artifacts": runner.get_artifacts(),
+            "dropped_events": runner.get_dropped_events(),
+        }
+        if result["rc"] != 0:
+            result["error"] = runner.get_error_output()
+        return result
+
     def _runner_args(self):
         return {"playbook": self.name, "inventory": self.inventory}
 
@@ -153,7 +210,7 @@ class RunPlaybook:
         os.mkdir(inventory_dir)
 
         if self.helper.control.inventory:
-            self.inventory = create_inventory(
+            self.inventory = await workspace_cache.create_inventory(
                 inventory_dir, self.helper.control.inventory
             )
         os.mkdir(project_dir)
@@ -163,22 +220,26 @@ class RunPlaybook:
         )
         if self.helper.control.project_data_file:
             if os.path.exists(self.helper.control.project_data_file):
-                await self._untar_project(
-                    project_dir, self.helper.control.project_data_file
+                await workspace_cache.populate(
+                    project_dir,
+                    self.helper.control.project_data_file,
+                    extract=True,
                 )
                 return
-        self._copy_playbook_files(project_dir)
+        await self._copy_playbook_files(project_dir)
 
-    def _copy_playbook_files(self, project_dir):
+    async def _copy_playbook_files(self, project_dir):
         if self.action_args.get("check_files", self.default_check_files):
             if os.path.exists(self.name):
                 tail_name = os.path.basename(self.name)
-                shutil.copy(self.name, os.path.join(project_dir, tail_name))
                 if self.action_args.get("copy_files", self.default_copy_files):
-                    shutil.copytree(
-                        os.path.dirname(os.path.abspath(self.name)),
+                    await workspace_cache.populate(
                         project_dir,
-                        dirs_exist_ok=True,
+                        os.path.dirname(os.path.abspath(self.name)),
+                    )
+                else:
+                    shutil.copy(
+                        self.name, os.path.join(project_dir, tail_name)
                     )
                 self.name = tail_name
             elif has_playbook(*split_collection_name(self.name)):
@@ -195,27 +256,33 @@ class RunPlaybook:
                 raise PlaybookNotFoundException(msg)
 
     async def _post_process(self):
-        rc = int(self._get_latest_artifact("rc"))
-        status = self._get_latest_artifact("status")
+        rc = self.run_result["rc"]
+        status = self.run_result["status"]
         logger.debug("Ansible runner rc: %d, status: %s", rc, status)
         if rc != 0:
-            error_message = self._get_latest_artifact("stderr")
-            if not error_message:
-                error_message = self._get_latest_artifact("stdout")
-            logger.error(error_message)
-
-        await self.helper.send_status(
-            {
-                "playbook_name": self.name,
-                "job_id": self.job_id,
-                "rc": rc,
-                "status": status,
-                "run_at": run_at(),
-                "matching_events": self.helper.get_events(),
-            }
-        )
+            logger.error(self.run_result["error"])
+
+        a_log = {
+            "playbook_name": self.name,
+            "job_id": self.job_id,
+            "rc": rc,
+            "status": status,
+            "run_at": run_at(),
+            "matching_events": self.helper.get_events(),
+        }
+        if self.run_result["job_id"] != self.job_id:
+            a_log["coalesced_job_id"] = self.run_result["job_id"]
+        if self.run_result.get("dropped_events"):
+            a_log["dropped_events"] = self.run_result["dropped_events"]
+        await self.helper.send_status(a_log)
         set_facts = self.action_args.get("set_facts", False)
         post_events = self.action_args.get("post_events", False)
+        if "coalesced_job_id" in a_log and (set_facts or post_events):
+            logger.debug(
+                "Facts of run %s are set by the match that launched it",
+                self.run_result["job_id"],
+            )
+            return
 
         if rc == 0 and (set_facts or post_events):
             # Default to output events at debug level.
@@ -257,32 +324,3 @@ class RunPlaybook:
                 lang.post(ruleset, fact)
 
             self.display.banner(level=level)
-
-    def _get_latest_artifact(self, component: str, content: bool = True):
-        files = glob.glob(
-            os.path.join(self.private_data_dir, "artifacts", "*", component)
-        )
-        files.sort(key=os.path.getmtime, reverse=True)
-        if not files:
-            raise PlaybookStatusNotFoundException(f"No {component} file found")
-        if content:
-            with open(files[0], "r") as file_handle:
-                content = file_handle.read()
-            return content
-        return files[0]
-
-    async def _untar_project(self, output_dir, project_data_file):
-        cmd = [tar, "zxvf", project_data_file]
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=output_dir,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-
-        stdout, stderr = await proc.communicate()
-
-        if stdout:
-            logger.debug("stdout of %s: %s", cmd, stdout.decode())
-        if stderr:
-            logger.debug("stderr of %s: %s", cmd, stderr.decode())
@@ -13,21 +13,51 @@
 #  limitations under the License.
 
 import asyncio
-import concurrent.futures
 import logging
+import os
+import shutil
+import tempfile
 from asyncio.exceptions import CancelledError
+from collections import deque
 from functools import partial
 
 import ansible_runner
-import janus
+from ansible_runner.exceptions import AnsibleRunnerException
 
 from ansible_rulebook.conf import settings
 
+from .runner_pool import runner_pool
+
 logger = logging.getLogger(__name__)
 
 SET_FACT_ACTIONS = ("set_fact", "ansible.builtin.set_fact")
 SET_STATS_ACTIONS = ("set_stats", "ansible.builtin.set_stats")
 
+# Policies deciding which ansible-runner events are sent as audit records
+FORWARD_ALL = "all"
+FORWARD_SUMMARY = "summary"
+FORWARD_FAILURES = "failures"
+FORWARD_SAMPLED = "sampled"
+FORWARDING_POLICIES = (
+    FORWARD_ALL,
+    FORWARD_SUMMARY,
+    FORWARD_FAILURES,
+    FORWARD_SAMPLED,
+)
+SUMMARY_EVENTS = ("playbook_on_start", "playbook_on_stats")
+
+# Where ansible-runner's stdout and stderr are kept, the memory mode
+# only keeps the last STDOUT_TAIL_LINES lines to report failures
+ARTIFACTS_DISK = "disk"
+ARTIFACTS_MEMORY = "memory"
+STDOUT_TAIL_LINES = 100
+FAILURE_EVENTS = (
+    "runner_on_failed",
+    "runner_on_unreachable",
+    "runner_item_on_failed",
+    "runner_on_async_failed",
+)
+
 
 class Runner:
     """calls ansible-runner to launch either playbooks/modules
@@ -43,6 +73,7 @@ class Runner:
         json_mode,
         helper,
         runner_args,
+        event_forwarding=None,
     ):
         self.private_data_dir = data_dir
         self.host_limit = host_limit
@@ -52,13 +83,18 @@ class Runner:
         self.runner_args = runner_args
         self.json_mode = json_mode
         self.artifacts = None
+        self.event_forwarding = self._forwarding_policy(event_forwarding)
+        self.events_seen = 0
+        self.dropped_events = {}
+        self.rc = None
+        self.status = None
+        self.error_output = ""
+        self._stdout_tail = deque(maxlen=STDOUT_TAIL_LINES)
 
     async def __call__(self):
         shutdown = False
 
-        loop = asyncio.get_running_loop()
-
-        queue = janus.Queue()
+        queue = runner_pool.get_queue()
 
         # The event_callback is called from the ansible-runner thread
         # It needs a thread-safe synchronous queue.
@@ -66,6 +102,8 @@ class Runner:
         # Here we push the event into the sync side of janus
         def event_callback(event, *_args, **_kwargs):
             event["job_id"] = self.job_id
+            if event.get("stdout"):
+                self._stdout_tail.extend(event["stdout"].splitlines())
             event["ansible_rulebook_id"] = settings.identifier
             if event.get("event") == "runner_on_ok":
                 if (
@@ -89,7 +127,8 @@ class Runner:
                         .get("data")
                     )
 
-            queue.sync_q.put({"type": "AnsibleEvent", "event": event})
+            if self._should_forward(event):
+                queue.sync_q.put({"type": "AnsibleEvent", "event": event})
 
         # Here we read the async side and push it into the event queue
         # which is also async.
@@ -108,39 +147,121 @@ class Runner:
         def cancel_callback():
             return shutdown
 
+        def cancel():
+            nonlocal shutdown
+            shutdown = True
+
         tasks = []
 
         tasks.append(asyncio.create_task(read_queue()))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as task_pool:
-            try:
-                await loop.run_in_executor(
-                    task_pool,
-                    partial(
-                        ansible_runner.run,
-                        private_data_dir=self.private_data_dir,
-                        limit=self.host_limit,
-                        verbosity=self.verbosity,
-                        event_handler=event_callback,
-                        cancel_callback=cancel_callback,
-                        json_mode=self.json_mode,
-                        **self.runner_args,
-                    ),
-                )
-            except CancelledError:
-                logger.debug(
-                    "Ansible Runner Thread Pool executor task cancelled"
-                )
-                shutdown = True
-                raise
-            finally:
-                # Cancel the queue reading task
-                for task in tasks:
-                    if not task.done():
-                        logger.debug("Cancel Queue reading task")
-                        task.cancel()
+        artifact_args = self._artifact_args()
+        try:
+            result = await runner_pool.run(
+                partial(
+                    ansible_runner.run,
+                    private_data_dir=self.private_data_dir,
+                    limit=self.host_limit,
+                    verbosity=self.verbosity,
+                    event_handler=event_callback,
+                    cancel_callback=cancel_callback,
+                    json_mode=self.json_mode,
+                    **artifact_args,
+                    **self.runner_args,
+                ),
+                cancel,
+            )
+            self.rc = result.rc
+            self.status = result.status
+            if self.rc != 0:
+                self.error_output = self._read_error_output(result)
+        except CancelledError:
+            logger.debug("Ansible Runner pool task cancelled")
+            shutdown = True
+            raise
+        finally:
+            # Cancel the queue reading task
+            for task in tasks:
+                if not task.done():
+                    logger.debug("Cancel Queue reading task")
+                    task.cancel()
 
-                await asyncio.gather(*tasks)
+            await asyncio.gather(*tasks)
+            # A cancelled run may still be writing to the queue
+            if not shutdown:
+                runner_pool.put_queue(queue)
+            if "artifact_dir" in artifact_args:
+                shutil.rmtree(
+                    artifact_args["artifact_dir"], ignore_errors=True
+                )
 
     def get_artifacts(self):
         return self.artifacts
+
+    def get_dropped_events(self):
+        return self.dropped_events
+
+    def get_error_output(self):
+        return self.error_output
+
+    @staticmethod
+    def _artifact_args():
+        args = {}
+        if settings.runner_artifacts == ARTIFACTS_MEMORY:
+            args["suppress_output_file"] = True
+        if settings.runner_artifact_dir:
+            os.makedirs(settings.runner_artifact_dir, exist_ok=True)
+            args["artifact_dir"] = tempfile.mkdtemp(
+                prefix="eda", dir=settings.runner_artifact_dir
+            )
+        return args
+
+    def _read_error_output(self, result):
+        if settings.runner_artifacts != ARTIFACTS_MEMORY:
+            try:
+                for component in ("stderr", "stdout"):
+                    with getattr(result, component) as file_handle:
+                        content = file_handle.read()
+                    if content:
+                        return content
+            except (AnsibleRunnerException, OSError):
+                logger.debug("No stdout or stderr artifact found")
+        return "\n".join(self._stdout_tail)
+
+    @staticmethod
+    def _forwarding_policy(event_forwarding):
+        policy = event_forwarding or settings.runner_event_forwarding
+        if policy not in FORWARDING_POLICIES:
+            logger.warning(
+                "Unknown runner event forwarding %s, forwarding all events",
+                policy,
+            )
+            return FORWARD_ALL
+        return policy
+
+    def _should_forward(self, event):
+        """Apply the forwarding policy, counting the dropped events per
+        host and event type so the final status can summarize them.
+        """
+        if self.event_forwarding == FORWARD_ALL:
+            return True
+        self.events_seen += 1
+        name = event.get("event")
+        if name in SUMMARY_EVENTS:
+            return True
+        if self.event_forwarding != FORWARD_SUMMARY and name in FAILURE_EVENTS:
+            return True
+        if (
+            self.event_forwarding == FORWARD_SAMPLED
+            and self.events_seen % settings.runner_event_sample_rate == 0
+        ):
+            return True
+
+        self.dropped_events["total"] = self.dropped_events.get("total", 0) + 1
+        host = event.get("event_data", {}).get("host")
+        if host:
+            counters = self.dropped_events.setdefault("hosts", {}).setdefault(
+                host, {}
+            )
+            counters[name] = counters.get(name, 0) + 1
+        return False
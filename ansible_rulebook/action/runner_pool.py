@@ -0,0 +1,177 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import janus
+
+from ansible_rulebook.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cancelled run is given to stop before its caller moves on
+CANCEL_TIMEOUT = 30
+
+
+class RunnerPool:
+    """Shared, bounded set of threads running ansible-runner.
+
+    Threads are created on demand and kept for the next run instead of
+    creating an executor per playbook. At most settings.runner_pool_size
+    runs happen at the same time, independent of the number of actions
+    allowed by max_concurrent_actions. A slot is only given back once
+    ansible-runner returns, so a cancelled run keeps its slot until its
+    thread is actually free. A cancelled caller waits up to
+    CANCEL_TIMEOUT seconds for the run to stop before cleaning up the
+    directories ansible-runner uses.
+
+    The janus queues carrying runner events to the event loop are reused
+    as well. Both queues and the semaphore belong to an event loop, they
+    are recreated when the pool is used from another loop.
+    """
+
+    def __init__(self):
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._size = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._queues: List[janus.Queue] = []
+        self._active = 0
+        self._waiting = 0
+        self._runs = 0
+        self._max_active = 0
+
+    def _bind(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        size = settings.runner_pool_size
+        if self._executor is None or size != self._size:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix="ansible-runner"
+            )
+            self._size = size
+            self._loop = None
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(size)
+            self._queues = []
+            self._active = 0
+            self._waiting = 0
+        return loop
+
+    def get_queue(self) -> janus.Queue:
+        """Return an empty janus queue bound to the running loop."""
+        self._bind()
+        if self._queues:
+            return self._queues.pop()
+        return janus.Queue()
+
+    def put_queue(self, queue: janus.Queue) -> None:
+        """Give a queue back for the next run, it's dropped if not empty."""
+        if (
+            asyncio.get_running_loop() is self._loop
+            and not queue.closed
+            and queue.async_q.empty()
+            and len(self._queues) < self._size
+        ):
+            self._queues.append(queue)
+        else:
+            queue.close()
+
+    async def run(
+        self,
+        func: Callable[[], Any],
+        cancel: Optional[Callable[[], None]] = None,
+    ) -> Any:
+        """Run func in a pool thread once a slot is free.
+
+        Args:
+            func: Blocking callable, usually a partial of ansible_runner.run
+            cancel: Called when the caller is cancelled to make func return
+
+        Returns:
+            The return value of func
+        """
+        loop = self._bind()
+        semaphore = self._semaphore
+        if semaphore.locked():
+            logger.debug(
+                "Runner pool is busy, %d runs active, %d waiting",
+                self._active,
+                self._waiting + 1,
+            )
+        self._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        self._max_active = max(self._max_active, self._active)
+
+        def _release() -> None:
+            if self._loop is loop:
+                self._active -= 1
+            self._runs += 1
+            semaphore.release()
+
+        def _done(_future: concurrent.futures.Future) -> None:
+            try:
+                loop.call_soon_threadsafe(_release)
+            except RuntimeError:
+                # The event loop is already closed
+                pass
+
+        future = self._executor.submit(func)
+        future.add_done_callback(_done)
+        result = asyncio.wrap_future(future)
+        try:
+            return await asyncio.shield(result)
+        except asyncio.CancelledError:
+            if not future.cancel():
+                if cancel:
+                    cancel()
+                await self._stopped(result)
+            raise
+
+    @staticmethod
+    async def _stopped(result: asyncio.Future) -> None:
+        """Wait for a cancelled run to return, at most CANCEL_TIMEOUT."""
+        try:
+            await asyncio.wait_for(asyncio.shield(result), CANCEL_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "ansible-runner didn't stop %d seconds after being cancelled",
+                CANCEL_TIMEOUT,
+            )
+        except Exception:
+            # The run failed while stopping, the caller is cancelled anyway
+            pass
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "size": self._size,
+            "active": self._active,
+            "waiting": self._waiting,
+            "runs": self._runs,
+            "max_active": self._max_active,
+            "utilization": self._active / self._size if self._size else 0.0,
+        }
+
+
+runner_pool = RunnerPool()
@@ -0,0 +1,247 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import atexit
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Optional, Tuple
+
+from ansible_rulebook.conf import settings
+from ansible_rulebook.exception import (
+    InventoryNotFound,
+    ProjectExtractException,
+)
+
+logger = logging.getLogger(__name__)
+
+tar = shutil.which("tar")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Another file system or links not supported, fall back to a copy
+        shutil.copy2(src, dst)
+
+
+def _link_tree(staged_dir: str, dest_dir: str) -> None:
+    shutil.copytree(
+        staged_dir, dest_dir, copy_function=_link_or_copy, dirs_exist_ok=True
+    )
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _tree_digest(path: str) -> str:
+    """Fingerprint a directory by the name, size and mtime of its files.
+
+    Only the inodes are read, the content of a large project is never
+    hashed.
+    """
+    digest = hashlib.sha256(os.path.abspath(path).encode())
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            digest.update(
+                f"{os.path.relpath(file_path, path)}\0"
+                f"{stat.st_size}\0{stat.st_mtime_ns}\0".encode()
+            )
+    return digest.hexdigest()
+
+
+class WorkspaceCache:
+    """Content addressed cache for the files a playbook run needs.
+
+    Project tarballs, playbook directories and inventories are extracted
+    or copied once into a cache directory. Every run populates its
+    private data dir with hard links to the cached files, falling back to
+    copies when the private data dir is on another file system. Ansible
+    doesn't modify its project files, new files a run creates stay in its
+    own private data dir.
+
+    At most settings.project_cache_size sources are kept, the least
+    recently used one is removed when another one is added. A size of 0
+    disables the cache and every run gets its own copy as before.
+    """
+
+    def __init__(self):
+        self._root: Optional[str] = None
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._in_use: Counter = Counter()
+        self._tarball_digests: Dict[Tuple[str, int, int], str] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def populate(
+        self, dest_dir: str, source: str, extract: bool = False
+    ) -> None:
+        """Make the content of source available in dest_dir.
+
+        Args:
+            dest_dir: Existing directory to populate
+            source: A directory, a file or a tarball
+            extract: Whether source is a tarball to be extracted
+        """
+        if settings.project_cache_size <= 0:
+            await self._stage(source, dest_dir, extract)
+            return
+
+        digest = await asyncio.to_thread(self._digest, source, extract)
+        self._in_use[digest] += 1
+        try:
+            staged_dir = await self._staged_dir(digest, source, extract)
+            await asyncio.to_thread(_link_tree, staged_dir, dest_dir)
+        finally:
+            self._in_use[digest] -= 1
+            if not self._in_use[digest]:
+                del self._in_use[digest]
+            self._evict()
+
+    async def create_inventory(
+        self, inventory_dir: str, inventory: str
+    ) -> str:
+        """Cached version of util.create_inventory."""
+        if not os.path.exists(inventory):
+            raise InventoryNotFound(f"Inventory {inventory} not found")
+        await self.populate(inventory_dir, inventory)
+        if os.path.isfile(inventory):
+            return os.path.join(inventory_dir, os.path.basename(inventory))
+        return inventory_dir
+
+    def _digest(self, source: str, extract: bool) -> str:
+        stat = os.stat(source)
+        if extract:
+            # Hashing a large tarball is expensive, only do it again when
+            # the file changed
+            key = (os.path.abspath(source), stat.st_size, stat.st_mtime_ns)
+            if key not in self._tarball_digests:
+                self._tarball_digests[key] = "tar-" + _file_digest(source)
+            return self._tarball_digests[key]
+        if os.path.isdir(source):
+            return "dir-" + _tree_digest(source)
+        return (
+            "file-"
+            + hashlib.sha256(
+                f"{os.path.abspath(source)}\0{stat.st_size}\0"
+                f"{stat.st_mtime_ns}".encode()
+            ).hexdigest()
+        )
+
+    async def _staged_dir(
+        self, digest: str, source: str, extract: bool
+    ) -> str:
+        async with self._locks[digest]:
+            staged_dir = self._entries.get(digest)
+            if staged_dir is not None:
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return staged_dir
+
+            self._misses += 1
+            staged_dir = os.path.join(self._cache_root(), digest)
+            tmp_dir = tempfile.mkdtemp(
+                prefix=f"{digest}.", dir=self._cache_root()
+            )
+            try:
+                await self._stage(source, tmp_dir, extract)
+                os.rename(tmp_dir, staged_dir)
+            except BaseException:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                raise
+            logger.debug("Cached %s in %s", source, staged_dir)
+            self._entries[digest] = staged_dir
+            return staged_dir
+
+    async def _stage(
+        self, source: str, target_dir: str, extract: bool
+    ) -> None:
+        if extract:
+            await self._untar(source, target_dir)
+        elif os.path.isdir(source):
+            await asyncio.to_thread(
+                shutil.copytree,
+                os.path.abspath(source),
+                target_dir,
+                dirs_exist_ok=True,
+            )
+        else:
+            await asyncio.to_thread(shutil.copy, source, target_dir)
+
+    async def _untar(self, tarball: str, output_dir: str) -> None:
+        cmd = [tar, "zxvf", os.path.abspath(tarball)]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=output_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        stdout, stderr = await proc.communicate()
+
+        if stdout:
+            logger.debug("stdout of %s: %s", cmd, stdout.decode())
+        if stderr:
+            logger.debug("stderr of %s: %s", cmd, stderr.decode())
+        # A partly extracted project must not be cached
+        if proc.returncode != 0:
+            raise ProjectExtractException(
+                f"Extracting {tarball} failed with rc={proc.returncode}: "
+                f"{stderr.decode().strip()}"
+            )
+
+    def _cache_root(self) -> str:
+        if self._root is None:
+            self._root = tempfile.mkdtemp(prefix="eda-workspace")
+            atexit.register(shutil.rmtree, self._root, True)
+        return self._root
+
+    def _evict(self) -> None:
+        size = max(settings.project_cache_size, 0)
+        for digest in list(self._entries):
+            if len(self._entries) <= size:
+                break
+            if self._in_use[digest] or self._locks[digest].locked():
+                continue
+            shutil.rmtree(self._entries.pop(digest), ignore_errors=True)
+            self._locks.pop(digest, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+workspace_cache = WorkspaceCache()
@@ -0,0 +1,202 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Named pools bounding the actions running at the same time.
+
+Every action shares the max_concurrent_actions pool unless a pool of its
+own is configured for its action type, for all rulesets or for one. The
+pools are given as a comma separated list of action=size or
+ruleset:action=size entries, e.g.
+
+    run_playbook=5,run_job_template=20,Remediation:run_playbook=2
+
+so slow playbooks don't take the slots of controller launches.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL = "default"
+
+PoolKey = Tuple[Optional[str], str]
+
+
+def parse_action_pools(value: str) -> Dict[PoolKey, int]:
+    """Sizes of the pools in an action pools setting.
+
+    Raises:
+        ValueError: If an entry isn't action=size with a size >= 1
+    """
+    sizes = {}
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        key, separator, size = entry.rpartition("=")
+        ruleset, _, action = key.rpartition(":")
+        if not separator or not action.strip():
+            raise ValueError(f"Invalid action pool {entry.strip()!r}")
+        try:
+            size = int(size)
+        except ValueError:
+            size = 0
+        if size < 1:
+            raise ValueError(
+                f"Size of action pool {key.strip()!r} must be >= 1"
+            )
+        sizes[(ruleset.strip() or None, action.strip())] = size
+    return sizes
+
+
+class ActionPool:
+    """A bound on the actions running at the same time.
+
+    Keeps count of the actions running and waiting for a slot, and of
+    the time event intake was held back because the pool was full.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ):
+        self.name = name
+        self.size = size
+        self.semaphore = semaphore or asyncio.Semaphore(size)
+        self._active = 0
+        self._waiting = 0
+        self._runs = 0
+        self._max_active = 0
+        self._back_pressure_count = 0
+        self._back_pressure_seconds = 0.0
+        self._slot_waiters: List[asyncio.Future] = []
+
+    @property
+    def exhausted(self) -> bool:
+        return self.semaphore._value <= 0
+
+    @property
+    def available(self) -> int:
+        return self.semaphore._value
+
+    async def __aenter__(self) -> "ActionPool":
+        if self.semaphore.locked():
+            logger.debug(
+                "Action pool %s is busy, %d actions active, %d waiting",
+                self.name,
+                self._active,
+                self._waiting + 1,
+            )
+        self._waiting += 1
+        try:
+            await self.semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        self._active += 1
+        self._max_active = max(self._max_active, self._active)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._active -= 1
+        self._runs += 1
+        self.semaphore.release()
+        waiters, self._slot_waiters = self._slot_waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def free_slot(self) -> None:
+        """Wait until the pool has a free slot, without taking it."""
+        while self.exhausted:
+            waiter = asyncio.get_running_loop().create_future()
+            self._slot_waiters.append(waiter)
+            await waiter
+
+    def record_back_pressure(self, started: float) -> None:
+        """Account for event intake held back since started."""
+        self._back_pressure_count += 1
+        self._back_pressure_seconds += time.monotonic() - started
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "size": self.size,
+            "active": self._active,
+            "waiting": self._waiting,
+            "runs": self._runs,
+            "max_active": self._max_active,
+            "back_pressure_count": self._back_pressure_count,
+            "back_pressure_seconds": round(self._back_pressure_seconds, 3),
+        }
+
+
+class ActionPools:
+    """The pools of the actions of an activation.
+
+    Pools are created the first time an action needs them. Without a
+    default pool, before setup_semaphores runs, actions aren't bounded.
+    """
+
+    def __init__(self):
+        self.default: Optional[ActionPool] = None
+        self._sizes: Dict[PoolKey, int] = {}
+        self._pools: Dict[PoolKey, ActionPool] = {}
+
+    def configure(
+        self, default: Optional[ActionPool], sizes: Dict[PoolKey, int]
+    ) -> None:
+        self.default = default
+        self._sizes = sizes
+        self._pools = {}
+        for (ruleset, action), size in sizes.items():
+            logger.info(
+                "Action pool %s size=%d",
+                f"{ruleset}:{action}" if ruleset else action,
+                size,
+            )
+
+    def get(self, ruleset: str, action: str) -> Optional[ActionPool]:
+        """The pool an action of a ruleset runs in, if any."""
+        for key in ((ruleset, action), (None, action)):
+            if key in self._sizes:
+                pool = self._pools.get(key)
+                if pool is None:
+                    name = f"{ruleset}:{action}" if key[0] else action
+                    pool = ActionPool(name, self._sizes[key])
+                    self._pools[key] = pool
+                return pool
+        return self.default
+
+    def for_actions(
+        self, ruleset: str, actions: List[str]
+    ) -> List[ActionPool]:
+        """The distinct pools the actions of a ruleset run in."""
+        pools = []
+        for action in actions:
+            pool = self.get(ruleset, action)
+            if pool is not None and pool not in pools:
+                pools.append(pool)
+        return pools
+
+    def get_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        pools = list(self._pools.values())
+        if self.default is not None:
+            pools.insert(0, self.default)
+        return {pool.name: pool.get_stats() for pool in pools}
+
+
+action_pools = ActionPools()
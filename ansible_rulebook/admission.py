@@ -0,0 +1,262 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Drop events no rule of a ruleset can match before they reach Drools.
+
+Each condition of a rule is evaluated against a single event, so an event
+that can't satisfy any condition of any rule can't change the outcome of
+the ruleset. The condition AST tells which event attributes a condition
+needs and, for == and in, which literal values. Those requirements are
+checked here in Python. Anything the analysis doesn't understand is
+assumed to match, so the index only ever drops events Drools would have
+rejected.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Nodes of the compiled prefilters
+PRESENT = "present"
+EQUALS = "equals"
+AND = "and"
+OR = "or"
+
+Keys = Tuple[str, ...]
+Node = Tuple
+
+_MISSING = object()
+_UNKNOWN = object()
+
+LITERALS = ("Integer", "Float", "String", "Boolean")
+
+# Expressions that can't be true when an event attribute they compare
+# is missing
+REQUIRE_OPERANDS = (
+    "EqualsExpression",
+    "GreaterThanExpression",
+    "LessThanExpression",
+    "GreaterThanOrEqualToExpression",
+    "LessThanOrEqualToExpression",
+    "ItemInListExpression",
+    "ListContainsItemExpression",
+    "SearchMatchesExpression",
+    "SelectAttrExpression",
+    "SelectExpression",
+)
+
+
+def _kind(value: Any) -> Optional[str]:
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    return None
+
+
+def _keys(operand: Any) -> Optional[Keys]:
+    """Keys of the event attribute an operand refers to, if any."""
+    if not isinstance(operand, dict) or len(operand) != 1:
+        return None
+    kind, path = next(iter(operand.items()))
+    # Events and facts share the working memory, fact.x can match an
+    # event. Bracket paths are left to Drools.
+    if kind not in ("Event", "Fact") or "[" in path:
+        return None
+    return tuple(path.split("."))
+
+
+class _Literals:
+    """Literal values tested by one or more conditions on an attribute."""
+
+    def __init__(self, kinds: Optional[Dict[str, Set]] = None):
+        self.kinds: Dict[str, Set] = kinds or {}
+
+    def add(self, other: "_Literals") -> None:
+        for kind, values in other.kinds.items():
+            self.kinds.setdefault(kind, set()).update(values)
+
+    def matches(self, value: Any) -> bool:
+        if value is _MISSING:
+            return False
+        # Only values of the one kind all the literals have are compared,
+        # the others are left to Drools
+        kind = _kind(value)
+        if kind is None or len(self.kinds) != 1 or kind not in self.kinds:
+            return True
+        return value in self.kinds[kind]
+
+
+def _literals(operand: Any) -> Optional[_Literals]:
+    """Literal values of an operand, if it only has those."""
+    operands = operand if isinstance(operand, list) else [operand]
+    kinds = defaultdict(set)
+    for item in operands:
+        if not isinstance(item, dict) or len(item) != 1:
+            return None
+        kind, value = next(iter(item.items()))
+        if kind not in LITERALS:
+            return None
+        kinds[_kind(value)].add(value)
+    return _Literals(dict(kinds)) if kinds else None
+
+
+def _has_null(operand: Any) -> bool:
+    operands = operand if isinstance(operand, list) else [operand]
+    return any(
+        isinstance(item, dict) and "NullType" in item for item in operands
+    )
+
+
+def _and(nodes: List[Optional[Node]]) -> Optional[Node]:
+    known = [node for node in nodes if node is not None]
+    if not known:
+        return None
+    return known[0] if len(known) == 1 else (AND, known)
+
+
+def _or(nodes: List[Optional[Node]]) -> Optional[Node]:
+    if any(node is None for node in nodes):
+        return None
+    return nodes[0] if len(nodes) == 1 else (OR, nodes)
+
+
+def compile_expression(expression: Dict) -> Optional[Node]:
+    """Requirements an event must meet to satisfy an expression.
+
+    None means the expression can't be analyzed and may match anything.
+    """
+    # Operands of and, or are grouped in a list
+    if isinstance(expression, list) and len(expression) == 1:
+        expression = expression[0]
+    if not isinstance(expression, dict) or len(expression) != 1:
+        return None
+    name, body = next(iter(expression.items()))
+
+    if name == "AndExpression":
+        return _and(
+            [compile_expression(body["lhs"]), compile_expression(body["rhs"])]
+        )
+    if name == "OrExpression":
+        return _or(
+            [compile_expression(body["lhs"]), compile_expression(body["rhs"])]
+        )
+    if name == "AssignmentExpression":
+        return compile_expression(body["rhs"])
+    if name == "IsDefinedExpression":
+        keys = _keys(body)
+        return (PRESENT, keys) if keys else None
+    if name not in REQUIRE_OPERANDS:
+        return None
+
+    lhs, rhs = body["lhs"], body["rhs"]
+    if _has_null(lhs) or _has_null(rhs):
+        return None
+    if name in ("EqualsExpression", "ItemInListExpression"):
+        keys, literals = _keys(lhs), _literals(rhs)
+        if name == "EqualsExpression" and not keys:
+            keys, literals = _keys(rhs), _literals(lhs)
+        if keys and literals:
+            return (EQUALS, keys, literals)
+    return _and(
+        [
+            (PRESENT, keys) if keys else None
+            for keys in (_keys(lhs), _keys(rhs))
+        ]
+    )
+
+
+def _lookup(event: Dict, keys: Keys) -> Any:
+    value = event
+    for key in keys:
+        if not isinstance(value, dict):
+            return _UNKNOWN
+        if key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _evaluate(node: Node, event: Dict) -> bool:
+    if node[0] == PRESENT:
+        return _lookup(event, node[1]) is not _MISSING
+    if node[0] == EQUALS:
+        return node[2].matches(_lookup(event, node[1]))
+    if node[0] == AND:
+        return all(_evaluate(child, event) for child in node[1])
+    return any(_evaluate(child, event) for child in node[1])
+
+
+class AdmissionIndex:
+    """Conservative prefilter of the events a ruleset can match.
+
+    Conditions that only compare one attribute with literals are grouped
+    in a per attribute index of their values, the other conditions are
+    checked one by one. When a condition can't be analyzed every event is
+    admitted.
+    """
+
+    def __init__(self, conditions: List[Optional[Node]]):
+        self.enabled = bool(conditions) and all(
+            condition is not None for condition in conditions
+        )
+        self.dropped = 0
+        self._literals: Dict[Keys, _Literals] = {}
+        self._conditions: List[Node] = []
+        if not self.enabled:
+            return
+
+        for condition in conditions:
+            if condition[0] == EQUALS:
+                self._literals.setdefault(condition[1], _Literals()).add(
+                    condition[2]
+                )
+            else:
+                self._conditions.append(condition)
+
+    @classmethod
+    def from_ruleset_ast(cls, ruleset_ast: Dict) -> "AdmissionIndex":
+        conditions = []
+        for rule in ruleset_ast["rules"]:
+            condition = rule["Rule"]["condition"]
+            for when, expressions in condition.items():
+                if when == "timeout":
+                    continue
+                conditions.extend(
+                    compile_expression(expression)
+                    for expression in expressions
+                )
+        index = cls(conditions)
+        if not index.enabled:
+            logger.debug(
+                "Ruleset %s admits every event", ruleset_ast.get("name")
+            )
+        return index
+
+    def admits(self, event: Dict) -> bool:
+        """Return False if no rule of the ruleset can match the event."""
+        if not self.enabled:
+            return True
+        for keys, literals in self._literals.items():
+            if literals.matches(_lookup(event, keys)):
+                return True
+        for condition in self._conditions:
+            if _evaluate(condition, event):
+                return True
+        self.dropped += 1
+        return False
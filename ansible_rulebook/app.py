@@ -14,6 +14,7 @@
 
 import argparse
 import asyncio
+import copy
 import logging
 import os
 import sys
@@ -24,6 +25,12 @@ from typing import Any, Dict, List, Optional, Tuple
 import yaml
 
 from ansible_rulebook import rules_parser as rules_parser
+from ansible_rulebook.action_pools import (
+    DEFAULT_POOL,
+    ActionPool,
+    action_pools,
+    parse_action_pools,
+)
 from ansible_rulebook.collection import (
     has_rulebook,
     load_rulebook as collection_load_rulebook,
@@ -33,6 +40,7 @@ from ansible_rulebook.common import StartupArgs
 from ansible_rulebook.conf import DEFAULT_MAX_CONCURRENT_ACTIONS, settings
 from ansible_rulebook.engine import run_rulesets, start_source
 from ansible_rulebook.job_template_runner import job_template_runner
+from ansible_rulebook.jvm import start_jvm
 from ansible_rulebook.rule_types import EventSource, RuleSet, RuleSetQueue
 from ansible_rulebook.util import (
     decryptable,
@@ -162,6 +170,10 @@ async def run(parsed_args: argparse.Namespace) -> None:
         [parsed_args.filter_dir],
     )
 
+    reloader = None
+    if file_monitor:
+        reloader = RulebookReloader(parsed_args, startup_args, tasks)
+
     logger.info("Starting rules")
 
     feedback_task = None
@@ -171,6 +183,7 @@ async def run(parsed_args: argparse.Namespace) -> None:
         )
         tasks.append(feedback_task)
 
+    start_jvm(startup_args.rulesets)
     should_reload = await run_rulesets(
         event_log,
         ruleset_queues,
@@ -179,6 +192,7 @@ async def run(parsed_args: argparse.Namespace) -> None:
         parsed_args,
         startup_args.project_data_file,
         file_monitor,
+        reloader,
     )
 
     if feedback_task:
@@ -222,6 +236,72 @@ async def run(parsed_args: argparse.Namespace) -> None:
         await run(parsed_args)
 
 
+class RulebookReloader:
+    """Loads a changed rulebook and starts or stops ruleset sources.
+
+    Used by a hot reload to apply the changes to the running rulesets
+    instead of restarting the activation. The source tasks it starts are
+    added to the tasks cancelled when the activation ends.
+    """
+
+    def __init__(
+        self,
+        parsed_args: argparse.Namespace,
+        startup_args: StartupArgs,
+        tasks: List[asyncio.Task],
+    ):
+        self.parsed_args = parsed_args
+        self.startup_args = startup_args
+        self.tasks = tasks
+        # Whether the last load changed the variables of the rulesets
+        self.variables_changed = False
+
+    @property
+    def variables(self) -> Dict[str, Any]:
+        return self.startup_args.variables
+
+    async def load(self) -> List[RuleSet]:
+        """Parse and validate the rulebook and its variables again."""
+        startup_args = copy.copy(self.startup_args)
+        startup_args.variables = load_vars(self.parsed_args)
+        startup_args.check_controller_connection = False
+        startup_args.rulesets = load_rulebook(self.parsed_args, startup_args)
+        validate_actions(startup_args)
+        validate_variables(startup_args)
+        variables = decrypted_context(startup_args.variables)
+        if (
+            startup_args.check_controller_connection
+            and not self.startup_args.check_controller_connection
+        ):
+            await validate_controller_params(startup_args)
+            self.startup_args.check_controller_connection = True
+        self.variables_changed = variables != self.startup_args.variables
+        self.startup_args.variables = variables
+        return startup_args.rulesets
+
+    def start_sources(self, ruleset: RuleSet) -> RuleSetQueue:
+        tasks, ruleset_queues = spawn_sources(
+            [ruleset],
+            self.startup_args.variables,
+            [self.parsed_args.source_dir],
+            self.parsed_args.shutdown_delay,
+            [self.parsed_args.filter_dir],
+        )
+        self.tasks.extend(tasks)
+        return ruleset_queues[0]
+
+    async def stop_sources(self, ruleset_name: str) -> None:
+        tasks = [
+            task
+            for task in self.tasks
+            if task.get_name() == _source_task_name(ruleset_name)
+        ]
+        for task in tasks:
+            task.cancel()
+            self.tasks.remove(task)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # TODO(cutwater): Maybe move to util.py
 def load_vars(parsed_args) -> Dict[str, str]:
     variables = dict()
@@ -315,7 +395,8 @@ def spawn_sources(
                     shutdown_delay,
                     filter_dirs,
                     feedback_queue,
-                )
+                ),
+                name=_source_task_name(ruleset.name),
             )
             tasks.append(task)
         ruleset_queues.append(
@@ -324,6 +405,10 @@ def spawn_sources(
     return tasks, ruleset_queues
 
 
+def _source_task_name(ruleset_name: str) -> str:
+    return f"source :: {ruleset_name}"
+
+
 def _get_feedback_queue(
     source: EventSource,
     source_names: List[str],
@@ -422,3 +507,12 @@ def setup_semaphores():
     settings.max_actions_semaphore = asyncio.Semaphore(
         settings.max_concurrent_actions
     )
+    # Actions without a pool of their own share max_concurrent_actions
+    action_pools.configure(
+        ActionPool(
+            DEFAULT_POOL,
+            settings.max_concurrent_actions,
+            settings.max_actions_semaphore,
+        ),
+        parse_action_pools(settings.action_pools),
+    )
@@ -0,0 +1,202 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Audit records kept on disk while the server can't be reached.
+
+While the feedback websocket is down the audit records are appended to
+segment files in a spool directory instead of filling the event log
+queue. Each record is its length and CRC32 followed by its JSON. When the
+websocket reconnects the records are read back in the order they were
+written, and a segment is removed once all its records were sent.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from ansible_rulebook.envelope import dumps
+
+logger = logging.getLogger(__name__)
+
+HEADER = struct.Struct("<II")
+SEGMENT_SUFFIX = ".spool"
+# Default size of a segment file
+SEGMENT_BYTES = 4 * 1024 * 1024
+
+
+def _segment_number(filename: str) -> Optional[int]:
+    name, suffix = os.path.splitext(filename)
+    if suffix != SEGMENT_SUFFIX or not name.isdigit():
+        return None
+    return int(name)
+
+
+class AuditSpool:
+    """Append only spool of audit records.
+
+    Records are appended until the segment files hold max_bytes, append
+    then returns False and the caller has to hold on to the record.
+    Records read are only removed from the spool once consumed, so the
+    records not sent when the websocket drops again are read again.
+    Records left by a previous run are read before the new ones.
+    """
+
+    def __init__(
+        self, path: str, max_bytes: int, segment_bytes: int = SEGMENT_BYTES
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        os.makedirs(path, exist_ok=True)
+
+        self._sizes: Dict[int, int] = {}
+        for filename in os.listdir(path):
+            number = _segment_number(filename)
+            if number is not None:
+                self._sizes[number] = os.path.getsize(
+                    os.path.join(path, filename)
+                )
+        self._segments: Deque[int] = deque(sorted(self._sizes))
+        self.size = sum(self._sizes.values())
+        # Records left by a previous run are never appended to
+        self._writing: Optional[int] = None
+        self._writer = None
+        self._read_offset = 0
+        self._pending: Deque[Tuple[int, int]] = deque()
+        if self._segments:
+            logger.info(
+                "Audit spool %s holds %d bytes from a previous run",
+                path,
+                self.size,
+            )
+
+    def _filename(self, number: int) -> str:
+        return os.path.join(self.path, f"{number:012d}{SEGMENT_SUFFIX}")
+
+    def __bool__(self) -> bool:
+        return bool(self._segments) and (
+            len(self._segments) > 1
+            or self._read_offset < self._sizes[self._segments[0]]
+        )
+
+    def _rotate(self) -> None:
+        self._close_writer()
+        self._writing = self._segments[-1] + 1 if self._segments else 0
+        self._segments.append(self._writing)
+        self._sizes[self._writing] = 0
+        self._writer = open(self._filename(self._writing), "ab")
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+            os.fsync(self._writer.fileno())
+            self._writer.close()
+            self._writer = None
+
+    def append(self, record: Dict) -> bool:
+        """Append a record, False when the spool is full."""
+        payload = dumps(record).encode("utf-8")
+        frame = HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        if self.size + len(frame) > self.max_bytes:
+            return False
+        if self._writer is None or (
+            self._sizes[self._writing]
+            and self._sizes[self._writing] + len(frame) > self.segment_bytes
+        ):
+            self._rotate()
+        self._writer.write(frame)
+        self._writer.flush()
+        self._sizes[self._writing] += len(frame)
+        self.size += len(frame)
+        return True
+
+    def read(self, limit: int) -> List[Dict]:
+        """The next records, up to limit, from the oldest segment.
+
+        Records not consumed since the last read are read again.
+        """
+        self._pending.clear()
+        while self._segments:
+            number = self._segments[0]
+            records, corrupt = self._read_segment(number, limit)
+            if records:
+                return records
+            if corrupt:
+                logger.warning(
+                    "Audit spool segment %s is corrupt at offset %d, "
+                    "skipping the rest of it",
+                    self._filename(number),
+                    self._read_offset,
+                )
+                self._read_offset = self._sizes[number]
+            if number == self._writing and not corrupt:
+                break
+            self._release()
+        return []
+
+    def _read_segment(
+        self, number: int, limit: int
+    ) -> Tuple[List[Dict], bool]:
+        offset = self._read_offset
+        size = self._sizes[number]
+        if offset >= size:
+            return [], False
+
+        records = []
+        with open(self._filename(number), "rb") as f:
+            with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as data:
+                while offset < size and len(records) < limit:
+                    if offset + HEADER.size > size:
+                        return records, not records
+                    length, crc = HEADER.unpack_from(data, offset)
+                    start = offset + HEADER.size
+                    payload = data[start : start + length]
+                    if len(payload) < length or zlib.crc32(payload) != crc:
+                        return records, not records
+                    try:
+                        records.append(json.loads(payload))
+                    except ValueError:
+                        return records, not records
+                    offset = start + length
+                    self._pending.append((number, offset))
+        return records, False
+
+    def consume(self, count: int = 1) -> None:
+        """Remove the first count records read from the spool."""
+        for _ in range(count):
+            _, self._read_offset = self._pending.popleft()
+        number = self._segments[0]
+        if self._read_offset >= self._sizes[number] and not self._pending:
+            self._release()
+
+    def _release(self) -> None:
+        """Remove the oldest segment, all its records were read."""
+        number = self._segments.popleft()
+        if number == self._writing:
+            self._close_writer()
+            self._writing = None
+        self.size -= self._sizes.pop(number)
+        self._read_offset = 0
+        try:
+            os.remove(self._filename(number))
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        self._close_writer()
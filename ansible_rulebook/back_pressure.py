@@ -20,8 +20,9 @@ when actions or reporting queues reach capacity.
 import asyncio
 import logging
 import time
-from typing import Optional
+from typing import List, Optional
 
+from ansible_rulebook.action_pools import DEFAULT_POOL, ActionPool
 from ansible_rulebook.conf import settings
 from ansible_rulebook.exception import (
     TimedOutActionsException,
@@ -41,16 +42,25 @@ class BackPressureManager:
 
     Attributes:
         event_log: AsyncIO Queue for reporting/audit events
+        action_pools: The action pools the actions of a ruleset run in
     """
 
-    def __init__(self, event_log: Optional[asyncio.Queue] = None):
+    def __init__(
+        self,
+        event_log: Optional[asyncio.Queue] = None,
+        action_pools: Optional[List[ActionPool]] = None,
+    ):
         """Initialize the BackPressureManager.
 
         Args:
             event_log: Optional asyncio.Queue for reporting events.
                       If None, reporting back pressure is skipped.
+            action_pools: Optional list of the pools whose capacity
+                      holds back events. If None, the max concurrent
+                      actions semaphore is used.
         """
         self.event_log = event_log
+        self.action_pools = action_pools
 
     async def _wait_for_reporting_capacity(self) -> None:
         """Wait until reporting queue has capacity."""
@@ -120,49 +130,64 @@ class BackPressureManager:
                 f"{settings.max_back_pressure_timeout} seconds hence aborting"
             )
 
-    async def _wait_for_action_capacity(self) -> None:
-        """Wait until action semaphore has capacity."""
+    def _exhausted_pools(self) -> List[ActionPool]:
+        """The action pools without a free slot."""
+        if self.action_pools is not None:
+            return [pool for pool in self.action_pools if pool.exhausted]
+        semaphore = settings.max_actions_semaphore
+        if semaphore is None or semaphore._value > 0:
+            return []
+        return [
+            ActionPool(
+                DEFAULT_POOL, settings.max_concurrent_actions, semaphore
+            )
+        ]
+
+    async def _wait_for_action_capacity(self, pools: List[ActionPool]) -> None:
+        """Wait until the action pools have capacity."""
         blocked = False
         once = False
 
-        while settings.max_actions_semaphore._value <= 0:
+        while any(pool.exhausted for pool in pools):
             if not once:
-                logger.info(
-                    "Waiting on %d actions to finish, "
-                    "back pressure applied",
-                    settings.max_concurrent_actions,
-                )
+                for pool in pools:
+                    logger.info(
+                        "Waiting on %d actions of pool %s to finish, "
+                        "back pressure applied",
+                        pool.size,
+                        pool.name,
+                    )
                 once = True
             blocked = True
             await asyncio.sleep(1)
 
         if blocked:
             logger.info(
-                "Back pressure released. Free slots %d",
-                settings.max_actions_semaphore._value,
+                "Back pressure released. Free slots %s",
+                ", ".join(f"{pool.name}={pool.available}" for pool in pools),
             )
 
     async def apply_actions_back_pressure(self) -> None:
         """Apply back pressure based on concurrent action capacity.
 
-        Blocks event processing if max concurrent actions limit is reached,
-        waiting for running actions to complete before allowing new events
-        to be processed.
+        Blocks event processing if an action pool the ruleset needs is
+        full, waiting for running actions to complete before allowing
+        new events to be processed. Pools of other rulesets or other
+        actions don't hold back events.
 
         Uses asyncio.wait_for() with timeout from settings.
 
         Raises:
             TimedOutActionsException: If actions don't complete within timeout
         """
-        if settings.max_actions_semaphore is None:
-            return
-
-        if settings.max_actions_semaphore._value > 0:
+        pools = self._exhausted_pools()
+        if not pools:
             return
 
+        started = time.monotonic()
         try:
             await asyncio.wait_for(
-                self._wait_for_action_capacity(),
+                self._wait_for_action_capacity(pools),
                 timeout=settings.max_back_pressure_timeout,
             )
         except asyncio.TimeoutError:
@@ -170,6 +195,9 @@ class BackPressureManager:
                 "Actions failed to end in "
                 f"{settings.max_back_pressure_timeout} seconds hence aborting"
             )
+        finally:
+            for pool in pools:
+                pool.record_back_pressure(started)
 
     def _check_timeout_budget_exhausted(
         self, remaining_timeout: float, actions_elapsed: float
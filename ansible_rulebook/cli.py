@@ -19,30 +19,26 @@ import logging
 import os
 import signal
 import sys
+import time
 from typing import List
 
-import ansible_rulebook.util as util
-from ansible_rulebook.exception import (
+_STARTED = time.perf_counter()
+
+import ansible_rulebook.util as util  # noqa: E402
+from ansible_rulebook import terminal  # noqa: E402
+from ansible_rulebook.action_pools import parse_action_pools  # noqa: E402
+from ansible_rulebook.conf import settings  # noqa: E402
+from ansible_rulebook.exception import (  # noqa: E402
     SourceFilterNotFoundException,
     SourcePluginMainMissingException,
     SourcePluginNotAsyncioCompatibleException,
     SourcePluginNotFoundException,
 )
-from ansible_rulebook.messages import DEFAULT_SHUTDOWN_DELAY
-from ansible_rulebook.vault import Vault
+from ansible_rulebook.messages import DEFAULT_SHUTDOWN_DELAY  # noqa: E402
+from ansible_rulebook.startup_profile import StartupProfile  # noqa: E402
+from ansible_rulebook.vault import Vault  # noqa: E402
 
-# ensure a valid JVM is available and configures JAVA_HOME if necessary
-# must be done before importing any other modules
-util.check_jvm()
-if not os.environ.get("JAVA_HOME"):
-    os.environ["JAVA_HOME"] = util.get_java_home()
-
-from ansible_rulebook import app  # noqa: E402
-from ansible_rulebook import terminal  # noqa: E402
-from ansible_rulebook.conf import settings  # noqa: E402
-from ansible_rulebook.job_template_runner import (  # noqa: E402
-    job_template_runner,
-)
+_IMPORTED = time.perf_counter()
 
 display = terminal.Display()
 
@@ -51,6 +47,39 @@ DEFAULT_VERBOSITY = 0
 logger = logging.getLogger(__name__)
 
 
+def __getattr__(name: str):
+    # The engine and its dependencies are only imported once the arguments
+    # are valid and the JVM is checked, see main
+    if name == "app":
+        from ansible_rulebook import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class VersionAction(argparse.Action):
+    """Print the version, the JVM is only probed when asked for it."""
+
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help=None,
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(util.get_version())
+        parser.exit()
+
+
 def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         formatter_class=argparse.RawTextHelpFormatter
@@ -85,9 +114,8 @@ def get_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--version",
-        action="version",
+        action=VersionAction,
         help="Show the version and exit",
-        version=util.get_version(),
     )
     parser.add_argument(
         "-S",
@@ -248,6 +276,14 @@ def get_parser() -> argparse.ArgumentParser:
         help="Send heartbeat to the server after every n seconds"
         "Default is 0, no heartbeat is sent",
     )
+    parser.add_argument(
+        "--controller-job-status-stream",
+        action="store_true",
+        default=settings.controller_job_status_stream,
+        help="Subscribe to the controller's job status websocket to learn "
+        "about finished jobs right away, polling is kept as a fallback. "
+        "Can also be enabled via the env var EDA_CONTROLLER_JOB_STATUS_STREAM",
+    )
     parser.add_argument(
         "--execution-strategy",
         default=settings.default_execution_strategy,
@@ -298,6 +334,15 @@ def get_parser() -> argparse.ArgumentParser:
         default=os.environ.get("EDA_MAX_CONCURRENT_ACTIONS", "0"),
         type=int,
     )
+    parser.add_argument(
+        "--action-pools",
+        help="Comma separated sizes of action pools of their own for action "
+        "types, for all rulesets or for one, as action=size or "
+        "ruleset:action=size e.g. run_playbook=5,run_job_template=20. "
+        "Other actions share the --max-concurrent-actions pool. "
+        "It can also be passed via the env var EDA_ACTION_POOLS",
+        default=os.environ.get("EDA_ACTION_POOLS", ""),
+    )
     parser.add_argument(
         "--max-back-pressure-timeout",
         help="When a back pressure is applied due to actions or reporting "
@@ -324,6 +369,49 @@ def get_parser() -> argparse.ArgumentParser:
         default=os.environ.get("EDA_MAX_BATCH_JOB_POLLING_SIZE", "25"),
         type=int,
     )
+    parser.add_argument(
+        "--max-concurrent-job-polls",
+        help="Maximum number of batch polling requests sent to the "
+        "controller at the same time. Default is 5. "
+        "It can be passed via the env var EDA_MAX_CONCURRENT_JOB_POLLS",
+        default=os.environ.get("EDA_MAX_CONCURRENT_JOB_POLLS", "5"),
+        type=int,
+    )
+    parser.add_argument(
+        "--runner-pool-size",
+        help="Maximum number of playbooks and modules run by "
+        "ansible-runner at the same time. Default is 25. "
+        "It can be passed via the env var EDA_RUNNER_POOL_SIZE",
+        default=os.environ.get("EDA_RUNNER_POOL_SIZE", "25"),
+        type=int,
+    )
+    parser.add_argument(
+        "--runner-event-forwarding",
+        help="Which ansible-runner events of playbooks and modules are sent "
+        "as audit records: all, summary, failures (and summary) or sampled "
+        "(failures, summary and every EDA_RUNNER_EVENT_SAMPLE_RATE event). "
+        "Default is all. It can be passed via the env var "
+        "EDA_RUNNER_EVENT_FORWARDING",
+        default=os.environ.get("EDA_RUNNER_EVENT_FORWARDING", "all"),
+        choices=["all", "summary", "failures", "sampled"],
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        default=False,
+        help="Print how long each phase of the startup took, including "
+        "the import time of the main dependencies, before running the "
+        "rulebook",
+    )
+    parser.add_argument(
+        "--build-startup-cache",
+        action="store_true",
+        default=False,
+        help="Build a class data sharing archive of the rules engine "
+        "in EDA_JVM_STARTUP_CACHE_DIR and exit. The rulebook given with "
+        "-r is used to load the classes, a sample one otherwise. Later "
+        "runs with the same JVM use the archive to start faster",
+    )
 
     return parser
 
@@ -331,8 +419,11 @@ def get_parser() -> argparse.ArgumentParser:
 def validate_args(args: argparse.Namespace) -> None:
     if args.worker and (not args.id or not args.websocket_url):
         raise ValueError("Worker mode needs an id and websocket url specfied")
+    if args.build_startup_cache:
+        return
     if not args.worker and not args.rulebook:
         raise ValueError("Rulebook must be specified in non worker mode")
+    parse_action_pools(args.action_pools)
 
 
 def setup_logging_and_display(args: argparse.Namespace) -> None:
@@ -389,13 +480,18 @@ def update_settings(args: argparse.Namespace) -> None:
     settings.websocket_access_token = args.websocket_access_token
     settings.websocket_refresh_token = args.websocket_refresh_token
     settings.skip_audit_events = args.skip_audit_events
+    settings.action_pools = args.action_pools
     settings.max_back_pressure_timeout = args.max_back_pressure_timeout
     settings.max_reporting_queue_size = args.max_reporting_queue_size
     settings.max_batch_job_polling_size = args.max_batch_job_polling_size
+    settings.max_concurrent_job_polls = args.max_concurrent_job_polls
+    settings.runner_pool_size = args.runner_pool_size
+    settings.runner_event_forwarding = args.runner_event_forwarding
     settings.controller_retry_max_timeout = float(
         args.controller_retry_max_timeout
     )
     settings.controller_retry_attempts = int(args.controller_retry_attempts)
+    settings.controller_job_status_stream = args.controller_job_status_stream
     parse_vault_passwords(args)
 
 
@@ -470,13 +566,35 @@ def main(args: List[str] = None) -> int:
         parser.print_help()
         sys.exit(1)
 
-    args = parser.parse_args(args)
-    validate_args(args)
-    update_settings(args)
-    setup_logging_and_display(args)
-    setup_signal_handlers()
+    profile = StartupProfile(_STARTED)
+    profile.add("import ansible_rulebook.cli", _IMPORTED - _STARTED)
+    with profile.phase("parse arguments"):
+        args = parser.parse_args(args)
+        validate_args(args)
+        update_settings(args)
+        setup_logging_and_display(args)
+        setup_signal_handlers()
+
+    # ensure a valid JVM is available and configures JAVA_HOME if necessary
+    # must be done before importing the engine
+    with profile.phase("check jvm"):
+        util.check_jvm()
+        if not os.environ.get("JAVA_HOME"):
+            os.environ["JAVA_HOME"] = util.get_java_home()
+
+    if args.build_startup_cache:
+        from ansible_rulebook.jvm import build_startup_cache
+
+        return build_startup_cache(args.rulebook)
+
+    if args.profile_startup:
+        profile.import_modules()
+    with profile.phase("import ansible_rulebook.app"):
+        from ansible_rulebook import app
 
     if args.controller_url:
+        from ansible_rulebook.job_template_runner import job_template_runner
+
         job_template_runner.host = args.controller_url
         if args.controller_ssl_verify:
             job_template_runner.verify_ssl = args.controller_ssl_verify
@@ -493,6 +611,9 @@ def main(args: List[str] = None) -> int:
             )
             return 1
 
+    if args.profile_startup:
+        profile.report()
+
     try:
         asyncio.run(app.run(args))
     except KeyboardInterrupt:
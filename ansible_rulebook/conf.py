@@ -44,6 +44,9 @@ class _Settings:
         "persistence_enabled": ("EDA_PERSISTENCE_ENABLED", bool),
         "persistence_id": ("EDA_PERSISTENCE_ID", str),
         "max_concurrent_actions": ("EDA_MAX_CONCURRENT_ACTIONS", int),
+        "action_pools": ("EDA_ACTION_POOLS", str),
+        "action_plan_queue_size": ("EDA_ACTION_PLAN_QUEUE_SIZE", int),
+        "action_priority_aging": ("EDA_ACTION_PRIORITY_AGING", int),
         "max_actions_timeout": ("EDA_MAX_ACTIONS_TIMEOUT", int),
         "max_back_pressure_timeout": ("EDA_MAX_BACK_PRESSURE_TIMEOUT", int),
         "max_reporting_queue_size": ("EDA_MAX_REPORTING_QUEUE_SIZE", int),
@@ -51,6 +54,37 @@ class _Settings:
             "EDA_MAX_BATCH_JOB_POLLING_SIZE",
             int,
         ),
+        "max_concurrent_job_polls": ("EDA_MAX_CONCURRENT_JOB_POLLS", int),
+        "controller_job_status_stream": (
+            "EDA_CONTROLLER_JOB_STATUS_STREAM",
+            bool,
+        ),
+        "controller_cache_ttl": ("EDA_CONTROLLER_CACHE_TTL", int),
+        "controller_cache_size": ("EDA_CONTROLLER_CACHE_SIZE", int),
+        "project_cache_size": ("EDA_PROJECT_CACHE_SIZE", int),
+        "runner_pool_size": ("EDA_RUNNER_POOL_SIZE", int),
+        "runner_event_forwarding": ("EDA_RUNNER_EVENT_FORWARDING", str),
+        "runner_event_sample_rate": ("EDA_RUNNER_EVENT_SAMPLE_RATE", int),
+        "runner_artifacts": ("EDA_RUNNER_ARTIFACTS", str),
+        "runner_artifact_dir": ("EDA_RUNNER_ARTIFACT_DIR", str),
+        "fact_cache_dir": ("EDA_FACT_CACHE_DIR", str),
+        "fact_cache_ttl": ("EDA_FACT_CACHE_TTL", int),
+        "fact_gathering_forks": ("EDA_FACT_GATHERING_FORKS", int),
+        "action_state_flush_interval": (
+            "EDA_ACTION_STATE_FLUSH_INTERVAL",
+            int,
+        ),
+        "session_stats_interval": ("EDA_SESSION_STATS_INTERVAL", int),
+        "jvm_startup_cache_dir": ("EDA_JVM_STARTUP_CACHE_DIR", str),
+        "jvm_heap_percent": ("EDA_JVM_HEAP_PERCENT", int),
+        "jvm_gc": ("EDA_JVM_GC", str),
+        "event_admission": ("EDA_EVENT_ADMISSION", bool),
+        "event_projection": ("EDA_EVENT_PROJECTION", bool),
+        "event_projection_size": ("EDA_EVENT_PROJECTION_SIZE", int),
+        "audit_event_references": ("EDA_AUDIT_EVENT_REFERENCES", bool),
+        "audit_event_cache_size": ("EDA_AUDIT_EVENT_CACHE_SIZE", int),
+        "audit_spool_dir": ("EDA_AUDIT_SPOOL_DIR", str),
+        "audit_spool_size": ("EDA_AUDIT_SPOOL_SIZE", int),
         "eda_labels": ("EDA_LABELS", list),
     }
 
@@ -63,8 +97,17 @@ class _Settings:
             "max_back_pressure_timeout",
             "max_reporting_queue_size",
             "max_batch_job_polling_size",
+            "max_concurrent_job_polls",
+            "controller_cache_size",
+            "runner_pool_size",
+            "runner_event_sample_rate",
+            "fact_cache_ttl",
+            "fact_gathering_forks",
             "gc_after",
             "max_feedback_timeout",
+            "audit_event_cache_size",
+            "audit_spool_size",
+            "event_projection_size",
         }
     )
 
@@ -88,15 +131,89 @@ class _Settings:
         self.persistence_id = None
         self.controller_retry_max_timeout = 60.0
         self.controller_retry_attempts = 5
+        self.controller_job_status_stream = False
+        # Seconds controller templates, organizations and labels are
+        # cached, 0 disables the cache
+        self.controller_cache_ttl = 60
+        self.controller_cache_size = 1000
+        # Number of projects and inventories kept extracted for playbook
+        # runs, 0 disables the cache
+        self.project_cache_size = 8
         # max_concurrent_actions: 0 is a sentinel for "use default of 25"
         # This allows setup_semaphores() to apply the default
         # if not explicitly set
         self.max_concurrent_actions = 0
         self.max_actions_semaphore = None
+        # Pools of their own for some action types, e.g.
+        # run_playbook=5,Remediation:run_job_template=10. The other actions
+        # share max_concurrent_actions.
+        self.action_pools = ""
+        # Matches waiting for their actions in a ruleset, when it is full
+        # the lowest priority ones are dropped. 0 doesn't bound the queue.
+        self.action_plan_queue_size = 0
+        # Seconds a waiting match takes to gain a priority level, 0 never
+        # raises the priority
+        self.action_priority_aging = 60
         self.max_actions_timeout = 3600
         self.max_back_pressure_timeout = 3600
         self.max_reporting_queue_size = 50
         self.max_batch_job_polling_size = 25
+        self.max_concurrent_job_polls = 5
+        self.runner_pool_size = 25
+        # Which ansible-runner events are sent as audit records, one of
+        # all, summary, failures or sampled
+        self.runner_event_forwarding = "all"
+        # With sampled forwarding every nth event is sent
+        self.runner_event_sample_rate = 10
+        # disk keeps ansible-runner's stdout and stderr files, memory only
+        # keeps the tail of stdout needed to report failures
+        self.runner_artifacts = "disk"
+        # Directory for the artifacts of a run, e.g. on a tmpfs. They are
+        # removed when the run ends. Empty keeps them in the private data
+        # dir.
+        self.runner_artifact_dir = ""
+        # Directory keeping the facts gathered for each host, empty
+        # disables the cache
+        self.fact_cache_dir = ""
+        self.fact_cache_ttl = 3600
+        self.fact_gathering_forks = 50
+        # Milliseconds action states are kept in memory before they are
+        # written to the persistence store, 0 writes them right away
+        self.action_state_flush_interval = 500
+        # Milliseconds a snapshot of the session stats is reused, 0 takes
+        # new stats every time
+        self.session_stats_interval = 1000
+        # Directory of the class data sharing archives built with
+        # --build-startup-cache, used by the JVM when one matches
+        self.jvm_startup_cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "ansible-rulebook",
+        )
+        # Percent of the container memory limit used as max JVM heap, 0
+        # keeps the drools_jpy default
+        self.jvm_heap_percent = 0
+        # JVM garbage collector, one of auto, serial, parallel, g1 or
+        # default
+        self.jvm_gc = "auto"
+        # Drop the events no rule of a ruleset can match before they are
+        # posted to the rules engine
+        self.event_admission = False
+        # Only post the event attributes the rules of a ruleset use, the
+        # actions get the full events
+        self.event_projection = False
+        # Maximum number of full events kept per ruleset for projection
+        self.event_projection_size = 10000
+        # Send each matching event once in an Event record and refer to
+        # it by meta.uuid in the audit records
+        self.audit_event_references = False
+        # Number of events remembered as sent on the websocket
+        self.audit_event_cache_size = 10000
+        # Directory the audit records are spooled to while the websocket
+        # is down, empty to keep them in the event log queue only
+        self.audit_spool_dir = ""
+        # Maximum size of the audit spool in MB
+        self.audit_spool_size = 256
 
         self.update_from_env()
 
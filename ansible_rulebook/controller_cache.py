@@ -0,0 +1,125 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from ansible_rulebook.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Lookups that found nothing are remembered for a shorter time so a
+# template created after a failed launch is picked up quickly.
+NEGATIVE_CACHE_TTL = 10.0
+
+
+class ControllerMetadataCache:
+    """TTL and size bound cache for controller metadata lookups.
+
+    Templates, organizations and labels rarely change while an activation
+    runs but are looked up for every launch. Entries expire after
+    settings.controller_cache_ttl seconds, a ttl of 0 disables caching.
+    The least recently used entry is dropped once
+    settings.controller_cache_size entries are stored.
+
+    Concurrent lookups of the same key share one request to the
+    controller, even when caching is disabled.
+    """
+
+    def __init__(self):
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        cache_empty: bool = True,
+    ) -> Any:
+        """Return the cached value for key or load it with loader.
+
+        Args:
+            key: The cache key
+            loader: Coroutine function fetching the value from the controller
+            cache_empty: Whether a falsy value may be cached, using the
+                shorter NEGATIVE_CACHE_TTL
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            del self._entries[key]
+
+        if key in self._inflight:
+            self._hits += 1
+            return await asyncio.shield(self._inflight[key])
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Waiters got the exception, don't warn about it being unused
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if value or cache_empty:
+                self._store(key, value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        ttl = settings.controller_cache_ttl
+        if ttl <= 0:
+            return
+        if not value:
+            ttl = min(ttl, NEGATIVE_CACHE_TTL)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.controller_cache_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        if self._entries.pop(key, None) is not None:
+            logger.debug("Invalidated controller cache entry %s", key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
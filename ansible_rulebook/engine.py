@@ -14,11 +14,23 @@
 
 import argparse
 import asyncio
+import hashlib
 import logging
 import os
 import runpy
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from drools.dispatch import establish_async_channel, handle_async_messages
 from drools.ruleset import session_stats, shutdown as drools_shutdown
@@ -33,14 +45,19 @@ from ansible_rulebook.collection import (
     has_source_filter,
     split_collection_name,
 )
+from ansible_rulebook.conf import settings
+from ansible_rulebook.fact_cache import FactCache
 from ansible_rulebook.messages import Shutdown
 from ansible_rulebook.persistence import enable_leader, enable_persistence
 from ansible_rulebook.rule_set_runner import RuleSetRunner
 from ansible_rulebook.rule_types import (
+    EngineRuleSetQueuePlan,
     EventSource,
     EventSourceFilter,
+    RuleSet,
     RuleSetQueue,
 )
+from ansible_rulebook.stats_sampler import session_stats_sampler
 from ansible_rulebook.util import (
     collect_ansible_facts,
     find_builtin_filter,
@@ -59,6 +76,9 @@ from .exception import (
     SourcePluginNotFoundException,
 )
 
+if TYPE_CHECKING:
+    from ansible_rulebook.app import RulebookReloader
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,11 +87,19 @@ _background_tasks = set()
 
 
 async def heartbeat_task(
-    event_log: asyncio.Queue, rule_set_names: List[str], interval: int
+    event_log: asyncio.Queue, rule_set_names: Collection[str], interval: int
 ):
     while True:
-        for name in rule_set_names:
-            await send_session_stats(event_log, session_stats(name))
+        for name in list(rule_set_names):
+            if name not in rule_set_names:
+                # Stopped by a hot reload
+                continue
+            # The heartbeat is always sent, the fresh stats are shared
+            # with the action loop of the ruleset
+            stats = session_stats_sampler.record(name, session_stats(name))
+            if stats:
+                session_stats_sampler.mark_sent(name, stats)
+            await send_session_stats(event_log, stats)
         await asyncio.sleep(interval)
 
 
@@ -146,9 +174,12 @@ async def start_source(
 
         source_filters = []
 
-        source.source_filters.append(meta_info_filter(source))
-
-        for source_filter in source.source_filters:
+        # The parsed source is left untouched, a hot reload starts it
+        # again or compares it with the changed rulebook
+        for source_filter in [
+            *source.source_filters,
+            meta_info_filter(source),
+        ]:
             logger.info("loading source filter %s", source_filter.filter_name)
             if (
                 filter_dirs
@@ -252,18 +283,23 @@ async def start_source(
         logger.error(shutdown_msg)
         raise
     finally:
-        logger.debug("Broadcast shutdown to all source plugins")
-        task = asyncio.create_task(
-            broadcast(
-                Shutdown(
-                    message=shutdown_msg,
-                    source_plugin=source.source_name,
-                    delay=shutdown_delay,
-                ),
+        if queue not in all_source_queues:
+            # A hot reload stopped the ruleset of this source, the other
+            # rulesets keep running
+            logger.debug("Source %s stopped by reload", source.source_name)
+        else:
+            logger.debug("Broadcast shutdown to all source plugins")
+            task = asyncio.create_task(
+                broadcast(
+                    Shutdown(
+                        message=shutdown_msg,
+                        source_plugin=source.source_name,
+                        delay=shutdown_delay,
+                    ),
+                )
             )
-        )
-        _background_tasks.add(task)
-        task.add_done_callback(_background_tasks.discard)
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
 
 
 class RulebookFileChangeHandler(FileSystemEventHandler):
@@ -309,6 +345,7 @@ async def run_rulesets(
     parsed_args: argparse.Namespace = None,
     project_data_file: Optional[str] = None,
     file_monitor: str = None,
+    reloader: Optional["RulebookReloader"] = None,
 ) -> bool:
     logger.debug("run_ruleset")
     reader, writer = await establish_async_channel()
@@ -328,36 +365,28 @@ async def run_rulesets(
         logger.debug("ruleset define: %s", ruleset_queue_plan.ruleset.define())
 
     hosts_facts = []
-    ruleset_names = []
-    rulesets = {}
+    fact_cache = None
     enable_leader()
     for ruleset, _, _ in ruleset_queues:
         if ruleset.gather_facts and not hosts_facts:
             if inventory:
-                hosts_facts = collect_ansible_facts(inventory)
+                hosts_facts, fact_cache = await gather_facts(inventory)
             else:
                 logger.warning(
                     "Ignoring gather_facts, since it requires inventory"
                 )
 
-        ruleset_names.append(ruleset.name)
-        rulesets[ruleset.name] = ruleset
-
-    ruleset_tasks = []
-    send_heartbeat_task = None
-    if parsed_args and parsed_args.heartbeat > 0 and event_log:
-        send_heartbeat_task = asyncio.create_task(
-            heartbeat_task(event_log, ruleset_names, parsed_args.heartbeat),
-            name="heartbeat_task",
-        )
-
-    for ruleset_queue_plan in rulesets_queue_plans:
+    def start_ruleset(
+        ruleset_queue: RuleSetQueue,
+        ruleset_queue_plan: EngineRuleSetQueuePlan,
+        variables: Dict,
+    ) -> _RunningRuleset:
         ruleset_runner = RuleSetRunner(
             event_log=event_log,
             ruleset_queue_plan=ruleset_queue_plan,
             hosts_facts=hosts_facts,
             variables=variables,
-            rule_set=rulesets[ruleset_queue_plan.ruleset.name],
+            rule_set=ruleset_queue.ruleset,
             project_data_file=project_data_file,
             parsed_args=parsed_args,
             broadcast_method=broadcast,
@@ -366,15 +395,77 @@ async def run_rulesets(
         ruleset_task = asyncio.create_task(
             ruleset_runner.run_ruleset(), name=task_name
         )
-        ruleset_tasks.append(ruleset_task)
+        return _RunningRuleset(
+            ruleset_queue, ruleset_task, ruleset_digest(ruleset_queue.ruleset)
+        )
+
+    # The rulesets with a rules engine session, by name
+    running = {}
+    for ruleset_queue, ruleset_queue_plan in zip(
+        ruleset_queues, rulesets_queue_plans
+    ):
+        ruleset_queue = RuleSetQueue(*ruleset_queue)
+        running[ruleset_queue.ruleset.name] = start_ruleset(
+            ruleset_queue, ruleset_queue_plan, variables
+        )
+
+    async def restart_ruleset(ruleset_queue: RuleSetQueue) -> _RunningRuleset:
+        ruleset = ruleset_queue.ruleset
+        if ruleset.gather_facts and not hosts_facts and inventory:
+            hosts_facts.extend((await gather_facts(inventory))[0])
+        # The variables are loaded again with the changed rulebook
+        (ruleset_queue_plan,) = rule_generator.generate_rulesets(
+            [ruleset_queue], reloader.variables, inventory
+        )
+        return start_ruleset(
+            ruleset_queue, ruleset_queue_plan, reloader.variables
+        )
+
+    send_heartbeat_task = None
+    if parsed_args and parsed_args.heartbeat > 0 and event_log:
+        send_heartbeat_task = asyncio.create_task(
+            heartbeat_task(event_log, running, parsed_args.heartbeat),
+            name="heartbeat_task",
+        )
+
+    def fact_rulesets() -> List[str]:
+        return [
+            name
+            for name, entry in running.items()
+            if entry.ruleset_queue.ruleset.gather_facts
+        ]
+
+    refresh_facts_task = None
+    if fact_cache:
+        refresh_facts_task = asyncio.create_task(
+            fact_cache.refresh(fact_rulesets),
+            name="refresh_facts_task",
+        )
 
     monitor_task = None
     if file_monitor:
         monitor_task = asyncio.create_task(monitor_rulebook(file_monitor))
-        ruleset_tasks.append(monitor_task)
 
     logger.info("Waiting for all ruleset tasks to end")
-    await asyncio.wait(ruleset_tasks, return_when=asyncio.FIRST_EXCEPTION)
+    while True:
+        ruleset_tasks = [entry.task for entry in running.values()]
+        if monitor_task:
+            ruleset_tasks.append(monitor_task)
+        await asyncio.wait(ruleset_tasks, return_when=asyncio.FIRST_EXCEPTION)
+        if not (
+            reloader
+            and monitor_task.done()
+            and isinstance(monitor_task.exception(), HotReloadException)
+            and not any(
+                not entry.task.cancelled() and entry.task.exception()
+                for entry in running.values()
+                if entry.task.done()
+            )
+        ):
+            break
+        await reload_rulesets(reloader, running, restart_ruleset)
+        monitor_task = asyncio.create_task(monitor_rulebook(file_monitor))
+
     async_task.cancel()
     logger.info("Cancelling all ruleset tasks")
     for task in ruleset_tasks:
@@ -394,10 +485,154 @@ async def run_rulesets(
     logger.debug("Returning from run_rulesets")
     if send_heartbeat_task:
         send_heartbeat_task.cancel()
+    if refresh_facts_task:
+        refresh_facts_task.cancel()
 
     return should_reload
 
 
+class _RunningRuleset(NamedTuple):
+    ruleset_queue: RuleSetQueue
+    task: asyncio.Task
+    digest: str
+
+
+def _strip_uuids(ruleset: RuleSet) -> RuleSet:
+    rules = [
+        rule._replace(
+            uuid=None,
+            actions=[action._replace(uuid=None) for action in rule.actions],
+        )
+        for rule in ruleset.rules
+    ]
+    return ruleset._replace(uuid=None, rules=rules)
+
+
+def ruleset_digest(ruleset: RuleSet) -> str:
+    """Hash the content of a parsed ruleset, ignoring generated uuids."""
+    return hashlib.sha256(repr(_strip_uuids(ruleset)).encode()).hexdigest()
+
+
+def sources_digest(ruleset: RuleSet) -> str:
+    """Hash the sources of a parsed ruleset."""
+    return hashlib.sha256(repr(ruleset.sources).encode()).hexdigest()
+
+
+async def reload_rulesets(
+    reloader: "RulebookReloader",
+    running: Dict[str, _RunningRuleset],
+    restart_ruleset: Callable[[RuleSetQueue], Awaitable[_RunningRuleset]],
+) -> None:
+    """Apply a changed rulebook to the running rulesets.
+
+    Rulesets are matched by name and compared by content. Unchanged
+    rulesets keep running with their sources, their events and partial
+    matches. A changed ruleset gets a new rules engine session, its
+    sources keep running when the sources section didn't change. Removed
+    rulesets are stopped without shutting down the others. When the
+    variables changed every ruleset is restarted with its sources.
+
+    A ruleset is taken out of running before its session ends, so the
+    heartbeat and the fact refresh only see running sessions.
+
+    Args:
+        reloader: Loads the rulebook and starts or stops sources
+        running: The running rulesets by name, updated in place
+        restart_ruleset: Starts the rules of a ruleset on its source queue
+    """
+    try:
+        new_rulesets = await reloader.load()
+    except Exception as e:
+        logger.error(
+            "HOT-RELOAD: Keeping the running rulesets, "
+            "the changed rulebook can't be loaded: %s",
+            str(e),
+        )
+        return
+
+    if reloader.variables_changed:
+        logger.critical("HOT-RELOAD: Variables changed, restarting rulesets")
+
+    new_names = {ruleset.name for ruleset in new_rulesets}
+    for name in list(running):
+        if name not in new_names:
+            logger.critical("HOT-RELOAD: Stopping removed ruleset %s", name)
+            await _stop_ruleset(reloader, running.pop(name), True)
+
+    for ruleset in new_rulesets:
+        current = running.get(ruleset.name)
+        if current and current.task.done():
+            # The ruleset already ended, start it over like a new one
+            await _stop_ruleset(reloader, running.pop(ruleset.name), True)
+            current = None
+        elif (
+            current
+            and not reloader.variables_changed
+            and current.digest == ruleset_digest(ruleset)
+        ):
+            logger.debug("HOT-RELOAD: Ruleset %s is unchanged", ruleset.name)
+            continue
+
+        if current is None:
+            logger.critical("HOT-RELOAD: Starting ruleset %s", ruleset.name)
+            ruleset_queue = reloader.start_sources(ruleset)
+        elif not reloader.variables_changed and sources_digest(
+            current.ruleset_queue.ruleset
+        ) == sources_digest(ruleset):
+            logger.critical(
+                "HOT-RELOAD: Restarting rules of ruleset %s", ruleset.name
+            )
+            del running[ruleset.name]
+            await _stop_ruleset(reloader, current, False)
+            ruleset_queue = RuleSetQueue(
+                ruleset,
+                current.ruleset_queue.source_queue,
+                current.ruleset_queue.source_feedback_queues,
+            )
+        else:
+            logger.critical("HOT-RELOAD: Restarting ruleset %s", ruleset.name)
+            del running[ruleset.name]
+            await _stop_ruleset(reloader, current, True)
+            ruleset_queue = reloader.start_sources(ruleset)
+        running[ruleset.name] = await restart_ruleset(ruleset_queue)
+
+
+async def _stop_ruleset(
+    reloader: "RulebookReloader", entry: _RunningRuleset, stop_sources: bool
+) -> None:
+    if stop_sources:
+        source_queue = entry.ruleset_queue.source_queue
+        while source_queue in all_source_queues:
+            all_source_queues.remove(source_queue)
+        await reloader.stop_sources(entry.ruleset_queue.ruleset.name)
+    if not entry.task.done():
+        entry.task.cancel()
+    # The session has to end before a new one with the same name starts
+    await asyncio.gather(entry.task, return_exceptions=True)
+
+
+async def gather_facts(
+    inventory: str,
+) -> Tuple[List[Dict], Optional[FactCache]]:
+    """Return the facts of the inventory hosts.
+
+    Gathering runs in a thread so the event loop stays responsive. With
+    a fact cache the cached facts are used right away and the returned
+    cache refreshes stale hosts once the rulesets run.
+    """
+    fact_cache = None
+    if settings.fact_cache_dir:
+        fact_cache = FactCache(inventory)
+        hosts_facts = await asyncio.to_thread(fact_cache.load)
+        if hosts_facts:
+            return hosts_facts, fact_cache
+
+    hosts_facts = await asyncio.to_thread(collect_ansible_facts, inventory)
+    if fact_cache:
+        await asyncio.to_thread(fact_cache.store, hosts_facts)
+    return hosts_facts, fact_cache
+
+
 def meta_info_filter(source: EventSource) -> EventSourceFilter:
     source_filter_name = "eda.builtin.insert_meta_info"
     source_filter_args = dict(
@@ -0,0 +1,135 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Events encoded to JSON once.
+
+An event is posted to the rules engine and then sent in the audit record
+of every action its match runs. EventEnvelope keeps the JSON encoding of
+an event next to it so it is only built once, dumps splices the encoded
+events into the audit records sent to the server.
+"""
+
+import json
+import re
+import uuid
+from typing import Any, Dict
+
+import yaml
+
+
+class EventEnvelope(dict):
+    """An event and its cached JSON encoding.
+
+    Events are not changed once received, a change to the top level keys
+    still drops the cached encoding.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._json = None
+
+    @classmethod
+    def wrap(cls, event: Dict) -> "EventEnvelope":
+        return event if isinstance(event, cls) else cls(event)
+
+    def json(self) -> str:
+        if self._json is None:
+            self._json = json.dumps(self)
+        return self._json
+
+    def _changed(self) -> None:
+        self._json = None
+
+    def __setitem__(self, key, value):
+        self._changed()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._changed()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._changed()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def pop(self, *args):
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._changed()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._changed()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._changed()
+        super().update(*args, **kwargs)
+
+
+# Events end up in the extra vars of playbooks written as YAML
+for _dumper in (yaml.Dumper, yaml.SafeDumper):
+    yaml.add_representer(
+        EventEnvelope,
+        yaml.representer.SafeRepresenter.represent_dict,
+        Dumper=_dumper,
+    )
+
+_MARKER = f"\x00{uuid.uuid4().hex}:"
+_ENCODED_MARKER = re.compile(re.escape(json.dumps(_MARKER)[:-1]) + r'(\d+)"')
+
+
+def encode(event: Any) -> Any:
+    """JSON of an event, from the envelope when it has one."""
+    if isinstance(event, EventEnvelope):
+        return event.json()
+    return event
+
+
+def dumps(record: Dict) -> str:
+    """json.dumps of a record reusing the encoding of its events.
+
+    Envelopes are looked for in the values of the record and of the
+    dicts it holds, like matching_events.
+    """
+    fragments = []
+
+    def swap(value: Any) -> Any:
+        if isinstance(value, EventEnvelope):
+            fragments.append(value.json())
+            return f"{_MARKER}{len(fragments) - 1}"
+        return value
+
+    if isinstance(record, dict):
+        record = {
+            key: (
+                {name: swap(item) for name, item in value.items()}
+                if isinstance(value, dict)
+                and not isinstance(value, EventEnvelope)
+                else swap(value)
+            )
+            for key, value in record.items()
+        }
+    encoded = json.dumps(record)
+    if not fragments:
+        return encoded
+    return _ENCODED_MARKER.sub(
+        lambda match: fragments[int(match.group(1))], encoded
+    )
@@ -1,7 +1,7 @@
 import asyncio
 import json
 import logging
-from typing import Any
+from typing import Any, Optional
 
 import xxhash
 from psycopg import AsyncConnection, OperationalError, sql
@@ -81,6 +81,37 @@ options:
         detected as dead within ~40 seconds (10 + 10*3).
     type: int
     default: 3
+  outbox_table:
+    description:
+      - Name of an outbox table to read events from, optionally schema
+        qualified (schema.table). When set, notifications on the channels
+        only wake the listener and the events are fetched from the table
+        in batches with SELECT ... FOR UPDATE SKIP LOCKED. A row is deleted
+        once the event has been accepted, if the source has feedback
+        enabled this is when the rule engine has processed the event.
+        The table must have an ordered id column and a payload column of
+        type json, jsonb or text.
+    type: str
+  batch_size:
+    description:
+      - Maximum number of rows fetched from the outbox table in one
+        transaction. Default is 100.
+    type: int
+    default: 100
+  poll_interval:
+    description:
+      - Seconds to wait for a notification before checking the outbox
+        table anyway. Default is 30.
+    type: float
+    default: 30
+  feedback_timeout:
+    description:
+      - Seconds to wait for the rule engine to process an event from the
+        outbox table when feedback is enabled. The rows acked so far are
+        deleted and the rest of the batch is unlocked and fetched again
+        later. Default is 60.
+    type: float
+    default: 60
 notes:
   - Chunking - this is just informational, a user doesn't have to do anything
     special to enable chunking. The sender, which is the pg_notify
@@ -100,6 +131,13 @@ notes:
     chunks have been received it will deliver the entire payload to the
     rulebook engine. Before the payload is delivered we validated
     that the entire message has been received by validating its computed hash.
+  - |
+    In outbox mode notifications sent while the listener is reconnecting
+    are not lost since the events are stored in the table. The table is
+    drained after every (re)connect. Delivery is at least once, events
+    of a batch which was interrupted by a connection loss are delivered
+    again. A minimal outbox table looks like
+    CREATE TABLE eda_outbox (id BIGSERIAL PRIMARY KEY, payload JSONB);
 """
 
 EXAMPLES = r"""
@@ -125,6 +163,14 @@ EXAMPLES = r"""
     keepalives_idle: 5
     keepalives_interval: 5
     keepalives_count: 2
+
+- eda.builtin.pg_listener:
+    dsn: "host=localhost port=5432 dbname=mydb"
+    channels:
+      - my_events
+    outbox_table: eda_outbox
+    batch_size: 500
+    feedback: true
 """
 
 LOGGER = logging.getLogger(__name__)
@@ -188,10 +234,25 @@ def _validate_args(args: dict[str, Any]) -> None:
         dict,
     ):
         err_msg = "Postgres params must be a dictionary"
+    elif args.get("outbox_table") is not None and (
+        not isinstance(args["outbox_table"], str) or not args["outbox_table"]
+    ):
+        err_msg = "Outbox table must be a non empty string"
+    elif int(args.get("batch_size", OUTBOX_BATCH_SIZE_DEFAULT)) < 1:
+        err_msg = "Batch size must be a positive integer"
+    elif (
+        float(args.get("feedback_timeout", OUTBOX_FEEDBACK_TIMEOUT_DEFAULT))
+        <= 0
+    ):
+        err_msg = "Feedback timeout must be a positive number"
     if err_msg:
         raise ValueError(err_msg)
 
 
+OUTBOX_BATCH_SIZE_DEFAULT = 100
+OUTBOX_POLL_INTERVAL_DEFAULT = 30
+OUTBOX_FEEDBACK_TIMEOUT_DEFAULT = 60
+
 PG_RETRY_MAX_TIMEOUT_DEFAULT = 60
 PG_RETRY_ATTEMPTS_DEFAULT = 10
 
@@ -241,7 +302,10 @@ async def main(queue: asyncio.Queue[Any], args: dict[str, Any]) -> None:
                 with attempt:
                     conn = await _connect_and_subscribe(args, reconnecting)
             connected = True
-            await _process_notifications(conn, queue)
+            if args.get("outbox_table"):
+                await _process_outbox(conn, queue, args)
+            else:
+                await _process_notifications(conn, queue)
             return
         except asyncio.CancelledError:
             LOGGER.info("pg_listener shutdown requested")
@@ -340,6 +404,131 @@ async def _process_notifications(
         raise
 
 
+def _outbox_queries(table: str) -> tuple[sql.Composed, sql.Composed]:
+    identifier = sql.Identifier(*table.split("."))
+    select_query = sql.SQL(
+        "SELECT id, payload FROM {} ORDER BY id LIMIT %s "
+        "FOR UPDATE SKIP LOCKED"
+    ).format(identifier)
+    delete_query = sql.SQL("DELETE FROM {} WHERE id = ANY(%s)").format(
+        identifier
+    )
+    return select_query, delete_query
+
+
+class _OutboxFeedback:
+    """Replies of the rule engine to the events of the outbox table."""
+
+    def __init__(self, queue: asyncio.Queue[Any], timeout: float) -> None:
+        self.queue = queue
+        self.timeout = timeout
+        # Replies still to come for events we stopped waiting for
+        self.late = 0
+
+    async def wait(self) -> bool:
+        """Wait for the reply to the last event, False on timeout."""
+        try:
+            while True:
+                await asyncio.wait_for(self.queue.get(), self.timeout)
+                if not self.late:
+                    return True
+                self.late -= 1
+        except asyncio.TimeoutError:
+            self.late += 1
+            return False
+
+
+async def _process_outbox(
+    conn: AsyncConnection,
+    queue: asyncio.Queue[Any],
+    args: dict[str, Any],
+) -> None:
+    """Drain the outbox table every time a notification arrives.
+
+    The notification payloads are ignored, they only wake us up. The
+    table is drained once right away so rows inserted while we were
+    disconnected are delivered, and again every poll_interval seconds
+    in case a notification was missed.
+    """
+    select_query, delete_query = _outbox_queries(args["outbox_table"])
+    batch_size = int(args.get("batch_size", OUTBOX_BATCH_SIZE_DEFAULT))
+    poll_interval = float(
+        args.get("poll_interval", OUTBOX_POLL_INTERVAL_DEFAULT)
+    )
+    feedback = None
+    if args.get("eda_feedback_queue"):
+        feedback = _OutboxFeedback(
+            args["eda_feedback_queue"],
+            float(
+                args.get("feedback_timeout", OUTBOX_FEEDBACK_TIMEOUT_DEFAULT)
+            ),
+        )
+
+    while True:
+        while (
+            await _drain_outbox_batch(
+                conn,
+                queue,
+                select_query,
+                delete_query,
+                batch_size,
+                feedback,
+            )
+            == batch_size
+        ):
+            pass
+        async for _ in conn.notifies(timeout=poll_interval, stop_after=1):
+            LOGGER.debug("Woken up by a notification")
+
+
+async def _drain_outbox_batch(
+    conn: AsyncConnection,
+    queue: asyncio.Queue[Any],
+    select_query: sql.Composed,
+    delete_query: sql.Composed,
+    batch_size: int,
+    feedback: Optional[_OutboxFeedback],
+) -> int:
+    """Deliver one batch of outbox rows and delete the accepted ones.
+
+    The rows stay locked until the transaction commits, if the
+    connection drops in between nothing is deleted and the rows are
+    fetched again after reconnecting. When the rule engine doesn't
+    process an event in time the batch ends there, so the rows are not
+    held locked. Returns the number of rows acked.
+    """
+    async with conn.transaction():
+        cursor = conn.cursor()
+        await cursor.execute(select_query, (batch_size,))
+        rows = await cursor.fetchall()
+        LOGGER.debug("Fetched %d rows from the outbox table", len(rows))
+        acked = []
+        for row_id, payload in rows:
+            try:
+                data = (
+                    json.loads(payload)
+                    if isinstance(payload, (str, bytes))
+                    else payload
+                )
+            except json.decoder.JSONDecodeError:
+                LOGGER.exception("Error decoding data of row %s", row_id)
+                acked.append(row_id)
+                continue
+            await queue.put(data)
+            if feedback and not await feedback.wait():
+                LOGGER.warning(
+                    "Event of row %s was not processed in %.0f seconds, "
+                    "releasing the rest of the batch",
+                    row_id,
+                    feedback.timeout,
+                )
+                break
+            acked.append(row_id)
+        if acked:
+            await cursor.execute(delete_query, (acked,))
+    return len(acked)
+
+
 async def _handle_chunked_message(
     data: dict[str, Any],
     chunked_cache: dict[str, Any],
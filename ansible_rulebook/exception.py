@@ -39,6 +39,10 @@ class RulenameDuplicateException(Exception):
     pass
 
 
+class PartitionKeyMissingException(Exception):
+    pass
+
+
 class ControllerApiException(Exception):
     pass
 
@@ -200,6 +204,10 @@ class InventoryNotFound(Exception):
     pass
 
 
+class ProjectExtractException(Exception):
+    pass
+
+
 class MissingArtifactKeyException(Exception):
     pass
 
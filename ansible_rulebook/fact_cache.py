@@ -0,0 +1,188 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from drools import ruleset as lang
+from drools.exceptions import MessageNotHandledException
+
+from ansible_rulebook.conf import settings
+from ansible_rulebook.util import collect_ansible_facts
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before retrying when the inventory can't be gathered
+RETRY_DELAY = 60
+
+
+class FactCache:
+    """Persistent cache of the facts gathered for each host.
+
+    Facts are stored as one JSON file per host in settings.fact_cache_dir
+    and are fresh for settings.fact_cache_ttl seconds. An activation with
+    cached facts starts right away with them. Hosts with stale or no
+    cached facts are gathered in the background while the rules run and
+    their facts are replaced in the rulesets when they arrive.
+    """
+
+    def __init__(self, inventory: str):
+        self.inventory = inventory
+        self.cache_dir = settings.fact_cache_dir
+        self._gathered_at: Dict[str, float] = {}
+        self._hosts: Set[str] = set()
+
+    def load(self) -> List[Dict]:
+        """Return the cached facts of every host in the inventory."""
+        self._hosts = self._inventory_hosts()
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        hosts_facts = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, name)) as f:
+                    entry = json.load(f)
+                host = entry["host"]
+                if self._hosts and host not in self._hosts:
+                    continue
+                self._hosts.add(host)
+                self._gathered_at[host] = entry["gathered_at"]
+                hosts_facts.append(entry["facts"])
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning("Ignoring fact cache file %s: %s", name, e)
+        logger.info(
+            "Loaded cached facts of %d hosts, %d need refreshing",
+            len(hosts_facts),
+            len(self.stale_hosts()),
+        )
+        return hosts_facts
+
+    def store(self, hosts_facts: List[Dict]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        now = time.time()
+        for data in hosts_facts:
+            host = data["meta"]["hosts"]
+            self._hosts.add(host)
+            self._gathered_at[host] = now
+            path = self._path(host)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump({"host": host, "gathered_at": now, "facts": data}, f)
+            os.replace(f"{path}.tmp", path)
+
+    def stale_hosts(self) -> List[str]:
+        expires = time.time() - settings.fact_cache_ttl
+        return sorted(
+            host
+            for host in self._hosts
+            if self._gathered_at.get(host, 0) <= expires
+        )
+
+    def next_refresh(self) -> float:
+        """Seconds until the next host's facts become stale."""
+        if not self._gathered_at:
+            return settings.fact_cache_ttl
+        oldest = min(self._gathered_at.values())
+        return max(oldest + settings.fact_cache_ttl - time.time(), 1)
+
+    async def refresh(self, ruleset_names: Callable[[], List[str]]) -> None:
+        """Gather stale hosts and replace their facts, until cancelled.
+
+        ruleset_names returns the running rulesets that gather facts.
+        """
+        while True:
+            hosts = self.stale_hosts()
+            if hosts:
+                now = time.time()
+                hosts_facts = await self._gather(hosts)
+                if hosts_facts is None:
+                    # Try the whole inventory again after RETRY_DELAY
+                    retry_at = now - settings.fact_cache_ttl + RETRY_DELAY
+                else:
+                    for name in ruleset_names():
+                        try:
+                            replace_facts(name, hosts_facts)
+                        except Exception as e:
+                            logger.warning(
+                                "Replacing facts in ruleset %s failed: %s",
+                                name,
+                                str(e),
+                            )
+                    # Unreachable hosts are tried again after the ttl
+                    retry_at = now
+                for host in hosts:
+                    if self._gathered_at.get(host, 0) < now:
+                        self._gathered_at[host] = retry_at
+            await asyncio.sleep(self.next_refresh())
+
+    async def _gather(self, hosts: List[str]) -> Optional[List[Dict]]:
+        logger.info("Refreshing facts of %d hosts", len(hosts))
+        try:
+            hosts_facts = await asyncio.to_thread(
+                collect_ansible_facts, self.inventory, hosts, True
+            )
+            await asyncio.to_thread(self.store, hosts_facts)
+        except Exception as e:
+            logger.warning("Refreshing facts failed: %s", str(e))
+            return None
+        return hosts_facts
+
+    def _path(self, host: str) -> str:
+        digest = hashlib.sha256(host.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _inventory_hosts(self) -> Set[str]:
+        # Deferred like in collect_ansible_facts, importing ansible-runner
+        # is slow
+        import ansible_runner
+
+        try:
+            out, _ = ansible_runner.get_inventory(
+                action="list",
+                inventories=[os.path.abspath(self.inventory)],
+                response_format="json",
+                quiet=True,
+            )
+        except Exception as e:
+            logger.warning("Could not list inventory hosts: %s", str(e))
+            return set()
+        if not isinstance(out, dict):
+            return set()
+        hosts = set(out.get("_meta", {}).get("hostvars", {}))
+        for group, data in out.items():
+            if group != "_meta" and isinstance(data, dict):
+                hosts.update(data.get("hosts", []))
+        return hosts
+
+
+def replace_facts(name: str, hosts_facts: List[Dict]) -> None:
+    """Swap the gathered facts of each host in a ruleset."""
+    for data in hosts_facts:
+        try:
+            lang.retract_matching_facts(
+                name, {"meta": {"hosts": data["meta"]["hosts"]}}, True, []
+            )
+        except MessageNotHandledException:
+            pass
+        try:
+            lang.assert_fact(name, data)
+        except MessageNotHandledException:
+            pass
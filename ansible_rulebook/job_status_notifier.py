@@ -0,0 +1,164 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import json
+import logging
+import ssl
+from typing import TYPE_CHECKING, Optional, Union
+from urllib.parse import urljoin
+
+import websockets
+from websockets.asyncio.client import ClientConnection
+
+if TYPE_CHECKING:
+    from ansible_rulebook.job_template_runner import JobTemplateRunner
+    from ansible_rulebook.shared_job_monitor import SharedJobMonitor
+
+logger = logging.getLogger(__name__)
+
+WEBSOCKET_SLUG = "websocket/"
+JOB_STATUS_GROUPS = {"jobs": ["status_changed"]}
+
+BACKOFF_MIN = 2.0
+BACKOFF_MAX = 60.0
+BACKOFF_FACTOR = 2.0
+
+
+class JobStatusNotifier:
+    """Listen to the controller's job status websocket channel.
+
+    The controller pushes a status_changed message for every job. When
+    a monitored job reaches a completion status the SharedJobMonitor is
+    told to fetch it right away instead of waiting for its next poll.
+    While the stream is down the monitor keeps polling on its own
+    schedule, so a lost connection only costs latency, never results.
+    """
+
+    def __init__(
+        self, runner: "JobTemplateRunner", monitor: "SharedJobMonitor"
+    ):
+        self._runner = runner
+        self._monitor = monitor
+        self._task: Optional[asyncio.Task] = None
+        self._connected = False
+        self._notifications = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def notifications(self) -> int:
+        return self._notifications
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._connected = False
+
+    def _url(self) -> str:
+        url = urljoin(self._runner.host, WEBSOCKET_SLUG)
+        if url.startswith("https"):
+            return "wss" + url[len("https") :]
+        return "ws" + url[len("http") :]
+
+    def _headers(self) -> dict:
+        headers = dict(self._runner._auth_headers() or {})
+        basic_auth = self._runner._basic_auth()
+        if basic_auth:
+            headers["Authorization"] = basic_auth.encode()
+        return headers
+
+    def _sslcontext(self) -> Union[None, ssl.SSLContext]:
+        if not self._runner.host.startswith("https"):
+            return None
+        context = self._runner._sslcontext
+        if context is True:
+            return ssl.create_default_context()
+        if context is False:
+            return ssl._create_unverified_context()
+        return context
+
+    async def _run(self) -> None:
+        backoff_delay = BACKOFF_MIN
+        while True:
+            try:
+                async with websockets.connect(
+                    self._url(),
+                    ssl=self._sslcontext(),
+                    additional_headers=self._headers(),
+                ) as websocket:
+                    await self._subscribe(websocket)
+                    self._connected = True
+                    backoff_delay = BACKOFF_MIN
+                    logger.info("Controller job status stream connected")
+                    await self._receive(websocket)
+            except asyncio.CancelledError:
+                raise
+            except (
+                websockets.exceptions.WebSocketException,
+                OSError,
+                asyncio.TimeoutError,
+                ValueError,
+            ) as e:
+                logger.warning(
+                    "Controller job status stream unavailable (%s), "
+                    "falling back to polling, reconnecting in %.0f seconds",
+                    str(e),
+                    backoff_delay,
+                )
+            finally:
+                if self._connected:
+                    self._connected = False
+                    self._monitor.status_stream_lost()
+            await asyncio.sleep(backoff_delay)
+            backoff_delay = min(backoff_delay * BACKOFF_FACTOR, BACKOFF_MAX)
+
+    async def _subscribe(self, websocket: ClientConnection) -> None:
+        """Wait for the controller to accept us and join the jobs group."""
+        accept = json.loads(await websocket.recv())
+        if not accept.get("accept"):
+            raise ValueError(f"connection not accepted: {accept}")
+        subscription = {"groups": JOB_STATUS_GROUPS}
+        if "xrftoken" in accept:
+            subscription["xrftoken"] = accept["xrftoken"]
+        await websocket.send(json.dumps(subscription))
+
+    async def _receive(self, websocket: ClientConnection) -> None:
+        async for message in websocket:
+            data = json.loads(message)
+            if data.get("group_name") != "jobs":
+                continue
+            status = data.get("status")
+            job_id = data.get("unified_job_id")
+            if (
+                job_id is not None
+                and status in self._runner.JOB_COMPLETION_STATUSES
+            ):
+                self._notifications += 1
+                logger.debug(
+                    "Job %s reported %s by the status stream", job_id, status
+                )
+                self._monitor.job_finished(str(job_id))
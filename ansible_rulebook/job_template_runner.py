@@ -27,6 +27,7 @@ from aiohttp_retry import ExponentialRetry, RetryClient
 
 from ansible_rulebook import util
 from ansible_rulebook.conf import settings
+from ansible_rulebook.controller_cache import ControllerMetadataCache
 from ansible_rulebook.exception import (
     ControllerApiException,
     ControllerObjectCreateException,
@@ -64,6 +65,7 @@ class JobTemplateRunner:
         verify_ssl: str = "yes",
     ):
         self.token = token
+        self._metadata_cache = ControllerMetadataCache()
         self._host = ""
         self.host = host
         self.username = username
@@ -89,6 +91,7 @@ class JobTemplateRunner:
     def host(self, value: str):
         self._host = util.ensure_trailing_slash(value)
         self._set_slugs(value)
+        self._metadata_cache.clear()
 
     async def close_session(self):
         if self._session:
@@ -269,8 +272,22 @@ class JobTemplateRunner:
                 return ssl.create_default_context(cafile=self.verify_ssl)
         return False
 
+    @staticmethod
+    def _template_cache_key(
+        name: str, organization: str, unified_type: str
+    ) -> tuple:
+        return ("template", unified_type, organization, name)
+
     async def _get_template_obj(
         self, name: str, organization: str, unified_type: str
+    ) -> Optional[dict]:
+        return await self._metadata_cache.get_or_load(
+            self._template_cache_key(name, organization, unified_type),
+            lambda: self._fetch_template_obj(name, organization, unified_type),
+        )
+
+    async def _fetch_template_obj(
+        self, name: str, organization: str, unified_type: str
     ) -> Optional[dict]:
         params = {"name": name}
 
@@ -358,7 +375,11 @@ class JobTemplateRunner:
             job_params["labels"] = label_ids
 
         url = urljoin(self.host, obj["launch"])
-        job = await self._launch(job_params, url)
+        job = await self._launch(
+            job_params,
+            url,
+            self._template_cache_key(name, organization, "job_template"),
+        )
         return job["url"]
 
     async def run_job_template(
@@ -450,7 +471,13 @@ class JobTemplateRunner:
                 "Workflow template %s does not accept limit, removing it", name
             )
             job_params.pop("limit")
-        job = await self._launch(job_params, url)
+        job = await self._launch(
+            job_params,
+            url,
+            self._template_cache_key(
+                name, organization, "workflow_job_template"
+            ),
+        )
         return job["url"]
 
     async def run_workflow_job_template(
@@ -504,7 +531,9 @@ class JobTemplateRunner:
         future = await self._job_monitor.register_job(url)
         return await future
 
-    async def _launch(self, job_params: dict, url: str) -> dict:
+    async def _launch(
+        self, job_params: dict, url: str, cache_key: Optional[tuple] = None
+    ) -> dict:
         body = None
         try:
             async with self._session.post(
@@ -526,6 +555,14 @@ class JobTemplateRunner:
                 post_response.raise_for_status()
                 return body
         except aiohttp.ClientError as e:
+            if (
+                cache_key
+                and isinstance(e, aiohttp.ClientResponseError)
+                and e.status == HTTPStatus.NOT_FOUND
+            ):
+                # The template was deleted or recreated, look it up again
+                # on the next launch
+                self._metadata_cache.invalidate(cache_key)
             logger.error(CLIENT_CONNECT_ERROR_STRING, str(e))  # NOSONAR
             if body:
                 logger.error("Error: %s", body)  # NOSONAR
@@ -579,8 +616,26 @@ class JobTemplateRunner:
             logger.error(CLIENT_CONNECT_ERROR_STRING, str(e))  # NOSONAR
             raise ControllerApiException(str(e))
 
+    async def _get_organization(self, organization: str) -> Optional[dict]:
+        return await self._metadata_cache.get_or_load(
+            ("organization", organization),
+            lambda: self._get_obj_by_name(
+                self._organization_slug, organization
+            ),
+        )
+
     async def _get_or_create_label(
         self, label: str, organization_obj: dict
+    ) -> dict:
+        # Only labels that exist are cached, a failed creation is retried
+        return await self._metadata_cache.get_or_load(
+            ("label", organization_obj["id"], label),
+            lambda: self._fetch_or_create_label(label, organization_obj),
+            cache_empty=False,
+        )
+
+    async def _fetch_or_create_label(
+        self, label: str, organization_obj: dict
     ) -> dict:
         obj = await self._get_obj_by_name(self._labels_slug, label)
         if obj:
@@ -600,9 +655,7 @@ class JobTemplateRunner:
         self, organization: str, labels: Optional[list[str]]
     ) -> list[int]:
         result = []
-        organization_obj = await self._get_obj_by_name(
-            self._organization_slug, organization
-        )
+        organization_obj = await self._get_organization(organization)
         if not organization_obj:
             logger.warning(
                 f"Organization {organization} not found "
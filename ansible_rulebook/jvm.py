@@ -0,0 +1,330 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Options of the JVM embedding the Drools rules engine.
+
+The JVM is created in process by drools_jpy the first time the rules
+engine is used. Before that happens start_jvm picks a heap size and a
+garbage collector from the memory limit of the container and the size of
+the rulebook, and points the JVM to a class data sharing archive of the
+Drools classpath when one was built with --build-startup-cache.
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional
+
+import drools
+from drools.ruleset import RulesetCollection
+
+from ansible_rulebook import util
+from ansible_rulebook.conf import settings
+from ansible_rulebook.rule_types import RuleSet
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+
+# Memory limit of the container with cgroup v2 and v1
+CGROUP_MEMORY_FILES = (
+    "/sys/fs/cgroup/memory.max",
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+)
+# cgroup v1 reports a limit close to the max int64 when there is none
+UNLIMITED_MEMORY = 1 << 60
+
+MIN_HEAP_MB = 64
+# Rulebooks with more rules start with half of the heap committed and
+# use G1, smaller ones with a small heap use the serial collector
+SMALL_RULEBOOK_RULES = 100
+SMALL_HEAP_MB = 1024
+
+GC_OPTIONS = {
+    "serial": "-XX:+UseSerialGC",
+    "parallel": "-XX:+UseParallelGC",
+    "g1": "-XX:+UseG1GC",
+}
+
+# Rulebook run when building the startup cache to load the classes used
+# to compile and evaluate the common kinds of conditions
+SAMPLE_RULEBOOK = """
+- name: Startup cache
+  hosts: all
+  sources:
+    - range:
+        limit: 5
+  rules:
+    - name: Compare
+      condition: event.i == 1
+      action:
+        debug:
+    - name: All
+      condition:
+        all:
+          - event.i > 1
+          - event.meta.host == "localhost"
+      action:
+        debug:
+    - name: Any
+      condition:
+        any:
+          - event.name is defined
+          - event.i in [3, 4]
+      action:
+        debug:
+"""
+TRAINING_EVENTS = 10
+
+
+class JvmProfile(NamedTuple):
+    max_heap: Optional[str]
+    options: List[str]
+
+
+def cgroup_memory_limit() -> Optional[int]:
+    """Return the memory limit of the container in bytes, if any."""
+    for path in CGROUP_MEMORY_FILES:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        try:
+            limit = int(value)
+        except ValueError:
+            # cgroup v2 reports max when there is no limit
+            return None
+        return limit if limit < UNLIMITED_MEMORY else None
+    return None
+
+
+def resource_profile(rule_count: int) -> JvmProfile:
+    """Return the heap size and JVM options for a rulebook.
+
+    Without a container memory limit, or when DROOLS_JPY_JVM_MAXMEM is
+    set, the heap is left to drools_jpy and the collector to the JVM
+    unless settings.jvm_gc names one.
+    """
+    heap_mb = 0
+    options = []
+    limit = cgroup_memory_limit()
+    if (
+        limit
+        and settings.jvm_heap_percent > 0
+        and not os.environ.get("DROOLS_JPY_JVM_MAXMEM")
+    ):
+        heap_mb = max(
+            limit * settings.jvm_heap_percent // 100 // MiB, MIN_HEAP_MB
+        )
+        if rule_count > SMALL_RULEBOOK_RULES:
+            options.append(f"-Xms{heap_mb // 2}M")
+
+    gc = settings.jvm_gc
+    if gc == "auto":
+        gc = ""
+        if heap_mb:
+            small = (
+                heap_mb <= SMALL_HEAP_MB and rule_count <= SMALL_RULEBOOK_RULES
+            )
+            gc = "serial" if small else "g1"
+    if gc in GC_OPTIONS:
+        options.append(GC_OPTIONS[gc])
+    elif gc and gc != "default":
+        logger.warning("Ignoring unknown garbage collector %s", gc)
+
+    return JvmProfile(f"{heap_mb}M" if heap_mb else None, options)
+
+
+def drools_jar() -> str:
+    jar = os.environ.get("DROOLS_JPY_CLASSPATH")
+    if jar:
+        return jar
+    package_dir = os.path.dirname(os.path.realpath(drools.__file__))
+    jars = glob.glob(os.path.join(package_dir, "jars", "*.jar"))
+    if not jars:
+        raise FileNotFoundError(f"No Drools jar found in {package_dir}")
+    return jars[0]
+
+
+def java_executable() -> str:
+    return os.path.realpath(f"{util.get_java_home()}/bin/java")
+
+
+def startup_cache_path() -> str:
+    """Path of the startup cache for the current Drools jar and JVM.
+
+    An archive can only be used by the JVM and classpath it was built
+    with, both are part of its name.
+    """
+    jar = drools_jar()
+    stat = os.stat(jar)
+    java = java_executable()
+    properties = util.get_java_properties(java) or {}
+    key = ":".join(
+        [
+            os.path.realpath(jar),
+            str(stat.st_mtime_ns),
+            str(stat.st_size),
+            java,
+            properties.get("java.version", ""),
+        ]
+    )
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return os.path.join(settings.jvm_startup_cache_dir, f"drools-{digest}.jsa")
+
+
+@contextmanager
+def _jvm_environment(
+    max_heap: Optional[str], options: List[str]
+) -> Iterator[None]:
+    """Expose the options to the JVM created in this process only."""
+    saved = {
+        key: os.environ.get(key)
+        for key in ("DROOLS_JPY_JVM_MAXMEM", "JAVA_TOOL_OPTIONS")
+    }
+    if max_heap:
+        os.environ["DROOLS_JPY_JVM_MAXMEM"] = max_heap
+    if options:
+        # Options set by the user come last and win
+        os.environ["JAVA_TOOL_OPTIONS"] = " ".join(
+            [*options, saved["JAVA_TOOL_OPTIONS"] or ""]
+        ).strip()
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def start_jvm(rulesets: List[RuleSet]) -> None:
+    """Create the rules engine JVM, once per process."""
+    if RulesetCollection.engine:
+        return
+
+    profile = resource_profile(sum(len(ruleset.rules) for ruleset in rulesets))
+    options = list(profile.options)
+    if os.path.isdir(settings.jvm_startup_cache_dir):
+        archive = startup_cache_path()
+        if os.path.exists(archive):
+            logger.info("Using JVM startup cache %s", archive)
+            options.append(f"-XX:SharedArchiveFile={archive}")
+    logger.debug(
+        "JVM max heap: %s, options: %s", profile.max_heap or "default", options
+    )
+
+    with _jvm_environment(profile.max_heap, options):
+        RulesetCollection.create_engine()
+
+
+def build_startup_cache(rulebook: Optional[str] = None) -> int:
+    """Build the class data sharing archive of the Drools classpath.
+
+    The classes loaded while a rulebook is compiled and evaluated are
+    recorded by a training run in a new process, then dumped into an
+    archive in settings.jvm_startup_cache_dir. The sample rulebook is
+    used when no rulebook is given.
+    """
+    archive = startup_cache_path()
+    os.makedirs(os.path.dirname(archive), exist_ok=True)
+    options = resource_profile(0).options
+
+    with tempfile.TemporaryDirectory(prefix="jvm_startup_cache") as tmp_dir:
+        class_list = os.path.join(tmp_dir, "classes.lst")
+        env = dict(os.environ)
+        env["JAVA_TOOL_OPTIONS"] = " ".join(
+            [
+                f"-XX:DumpLoadedClassList={class_list}",
+                *options,
+                os.environ.get("JAVA_TOOL_OPTIONS", ""),
+            ]
+        ).strip()
+        try:
+            subprocess.run(
+                [sys.executable, "-m", __name__, rulebook or ""],
+                env=env,
+                check=True,
+            )
+            subprocess.run(
+                [
+                    java_executable(),
+                    "-Xshare:dump",
+                    f"-XX:SharedClassListFile={class_list}",
+                    f"-XX:SharedArchiveFile={archive}.tmp",
+                    *options,
+                    "-cp",
+                    drools_jar(),
+                ],
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.error("Building the JVM startup cache failed: %s", e)
+            return 1
+
+    os.replace(f"{archive}.tmp", archive)
+    print(f"JVM startup cache written to {archive}")
+    return 0
+
+
+def _train(rulebook: Optional[str]) -> None:
+    import yaml
+    from drools import ruleset as lang
+    from drools.rule import Rule as DroolsRule
+
+    from ansible_rulebook.json_generator import visit_ruleset
+    from ansible_rulebook.rules_parser import parse_rule_sets
+
+    data = SAMPLE_RULEBOOK
+    if rulebook:
+        with open(rulebook) as f:
+            data = f.read()
+
+    for ruleset in parse_rule_sets(yaml.safe_load(data)):
+        try:
+            ast = visit_ruleset(ruleset, {})
+            drools_ruleset = lang.Ruleset(
+                name=ruleset.name,
+                serialized_ruleset=json.dumps(ast["RuleSet"]),
+            )
+            for rule in ruleset.rules:
+                drools_ruleset.add_rule(
+                    DroolsRule(name=rule.name, callback=lambda _: None)
+                )
+            for i in range(TRAINING_EVENTS):
+                event = {"i": i, "meta": {"host": "localhost"}}
+                lang.post(ruleset.name, event)
+            lang.assert_fact(ruleset.name, {"i": 1})
+            lang.session_stats(ruleset.name)
+            lang.end_session(ruleset.name)
+        except Exception as e:
+            logger.warning("Skipping ruleset %s: %s", ruleset.name, e)
+
+    # The class list is complete once the JVM exits
+    import jpy
+
+    jpy.get_type("java.lang.System").exit(0)
+
+
+if __name__ == "__main__":
+    _train(sys.argv[1] if len(sys.argv) > 1 else None)
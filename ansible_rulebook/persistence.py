@@ -8,9 +8,11 @@ enabling leader election among multiple rulebook instances.
 """
 
 import argparse
+import asyncio
 import json
 import logging
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 import dpath
 from drools import ruleset as lang
@@ -30,6 +32,136 @@ POSTGRES_REQUIRED_KEYS = {
 # Required configuration keys for H2 embedded database
 H2_REQUIRED_KEYS = {"drools_db_file_path"}
 
+# Number of already written action states kept in memory
+ACTION_STATE_CACHE_SIZE = 1000
+
+ActionKey = Tuple[str, str, int]
+
+
+class _ActionStateStore:
+    """
+    In memory mirror of the action info kept in the persistence store.
+
+    Every state transition of an action used to read, decode, merge and
+    write its action info in the database from the event loop. The mirror
+    is authoritative for the actions of this instance, updates are merged
+    in memory and written behind in one pass at most
+    settings.action_state_flush_interval milliseconds later. Several
+    transitions of an action within that interval become a single write,
+    and an action whose matching is deleted before the flush isn't written
+    at all.
+
+    The states recovery depends on, like an action being started or the
+    job it launched, are saved with flush and written right away so a
+    crash can't lose them. Pending states are flushed before a ruleset
+    session ends. An interval of 0, or calls outside of an event loop,
+    write through right away.
+    """
+
+    def __init__(self):
+        self._states: "OrderedDict[ActionKey, dict]" = OrderedDict()
+        # Keys waiting to be written, mapped to whether they are new
+        self._dirty: Dict[ActionKey, bool] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, key: ActionKey) -> Optional[dict]:
+        state = self._states.get(key)
+        if state is None:
+            return None
+        self._states.move_to_end(key)
+        return dict(state)
+
+    def save(
+        self, key: ActionKey, state: dict, create: bool, flush: bool = False
+    ) -> None:
+        loop = self._write_behind_loop()
+        if loop is None:
+            _write_action_info(key, state, create)
+            return
+
+        self._states[key] = state
+        self._states.move_to_end(key)
+        create = self._dirty.pop(key, False) or create
+        if flush:
+            _write_action_info(key, state, create)
+            self._evict()
+            return
+
+        self._dirty[key] = create
+        if self._flush_handle is None or self._flush_loop is not loop:
+            self._flush_loop = loop
+            self._flush_handle = loop.call_later(
+                settings.action_state_flush_interval / 1000, self.flush
+            )
+
+    def cache(self, key: ActionKey, state: dict) -> None:
+        """Keep a state read from the persistence store."""
+        if self._write_behind_loop() is None:
+            return
+        self._states[key] = state
+        self._evict()
+
+    def discard(self, rule_set: str, matching_uuid: str) -> None:
+        """Forget the actions of a matching, written or not."""
+        for key in [
+            k
+            for k in self._states
+            if k[0] == rule_set and k[1] == matching_uuid
+        ]:
+            self._states.pop(key, None)
+            self._dirty.pop(key, None)
+
+    def flush(self, rule_set: Optional[str] = None) -> None:
+        """Write the pending action states, only those of rule_set if given."""
+        if rule_set is None:
+            self._flush_handle = None
+            self._flush_loop = None
+        keys = [k for k in self._dirty if rule_set is None or k[0] == rule_set]
+        if keys:
+            logger.debug("Writing %d action states", len(keys))
+        for key in keys:
+            create = self._dirty.pop(key)
+            try:
+                _write_action_info(key, self._states[key], create)
+            except Exception as e:
+                logger.error("Error writing action info %s: %s", key, str(e))
+        self._evict()
+
+    def clear(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self.__init__()
+
+    def _evict(self) -> None:
+        clean = len(self._states) - len(self._dirty)
+        for key in list(self._states):
+            if clean <= ACTION_STATE_CACHE_SIZE:
+                break
+            if key not in self._dirty:
+                del self._states[key]
+                clean -= 1
+
+    @staticmethod
+    def _write_behind_loop() -> Optional[asyncio.AbstractEventLoop]:
+        if settings.action_state_flush_interval <= 0:
+            return None
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+
+_action_states = _ActionStateStore()
+
+
+def _write_action_info(key: ActionKey, state: dict, create: bool) -> None:
+    if create:
+        # Create a new action info record in the database
+        lang.add_action_info(*key, json.dumps(state))
+    else:
+        lang.update_action_info(*key, json.dumps(state))
+
 
 def enable_persistence(
     parsed_args: argparse.Namespace, variables: Dict
@@ -62,6 +194,8 @@ def enable_persistence(
         # No valid database configuration found, persistence remains disabled
         return
 
+    _action_states.clear()
+
     # This should be a UUID but the backend currently does not
     # use UUID's it uses integer ids
     activation_uuid = f"{parsed_args.persistence_id}"
@@ -94,12 +228,15 @@ def update_action_info(
     index: int,
     info: dict,
     create: bool = False,
+    flush: bool = False,
 ) -> None:
     """
     Update or create action information in the persistence store.
 
     This function stores action execution state in the database, allowing
     actions to be tracked and recovered across rulebook restarts or failover.
+    New action info and updates with flush are written right away, other
+    updates may be written behind.
 
     Args:
         rule_set: Name of the ruleset containing the action
@@ -108,6 +245,7 @@ def update_action_info(
         index: Index of the action within the rule's action list
         info: Dictionary containing action state information to store
         create: If True, create new action info; if False, update existing
+        flush: If True, write the action info before returning
 
     Returns:
         None. Action info is persisted to the database if persistence
@@ -116,28 +254,28 @@ def update_action_info(
     if not settings.persistence_enabled:
         return
 
+    key = (rule_set, matching_uuid, index)
     if create:
-        # Create a new action info record in the database
-        lang.add_action_info(rule_set, matching_uuid, index, json.dumps(info))
+        action_data = dict(info)
     else:
         # Update existing action info by merging new data with saved data
-        saved_data = lang.get_action_info(rule_set, matching_uuid, index)
-        if saved_data is None:
-            action_data = {}
-        else:
-            try:
-                action_data = json.loads(saved_data)
-            except json.JSONDecodeError as e:
-                logger.error("Error parsing saved action data  %s", e.msg)
+        action_data = _action_states.get(key)
+        if action_data is None:
+            saved_data = lang.get_action_info(rule_set, matching_uuid, index)
+            if saved_data is None:
                 action_data = {}
+            else:
+                try:
+                    action_data = json.loads(saved_data)
+                except json.JSONDecodeError as e:
+                    logger.error("Error parsing saved action data  %s", e.msg)
+                    action_data = {}
 
         # Merge the new info into the existing data
         for k, v in info.items():
             action_data[k] = v
         logger.debug("Updating action info %s", action_data)
-        lang.update_action_info(
-            rule_set, matching_uuid, index, json.dumps(action_data)
-        )
+    _action_states.save(key, action_data, create, create or flush)
 
 
 def get_action_a_priori(
@@ -159,20 +297,58 @@ def get_action_a_priori(
         Dictionary containing the stored action data if it exists,
         empty dict if data exists but is corrupted, or None if no data exists.
     """
+    key = (rule_set, matching_uuid, index)
+    action_data = _action_states.get(key)
+    if action_data is not None:
+        return action_data
+
     if lang.action_info_exists(rule_set, matching_uuid, index):
         data = lang.get_action_info(rule_set, matching_uuid, index)
         if data is None:
             return {}
         logger.debug("Previous action data %s", data)
         try:
-            return json.loads(data)
+            action_data = json.loads(data)
         except json.JSONDecodeError as e:
             logger.error("Error parsing prior action data  %s", e.msg)
             return {}
+        _action_states.cache(key, dict(action_data))
+        return action_data
 
     return None
 
 
+def delete_action_info(rule_set: str, matching_uuid: str) -> None:
+    """
+    Delete the action information and matching events of a matching.
+
+    Action states of the matching still waiting to be written are dropped,
+    there is nothing left to recover once the matching is deleted.
+
+    Args:
+        rule_set: Name of the ruleset containing the actions
+        matching_uuid: Unique identifier for the rule matching
+
+    Returns:
+        None
+    """
+    _action_states.discard(rule_set, matching_uuid)
+    lang.delete_action_info(rule_set, matching_uuid)
+
+
+def flush_action_info(rule_set: Optional[str] = None) -> None:
+    """
+    Write the action states still waiting in memory.
+
+    Args:
+        rule_set: Only flush the actions of this ruleset, all if None
+
+    Returns:
+        None
+    """
+    _action_states.flush(rule_set)
+
+
 def enable_leader():
     """
     Enable leader election for this rulebook instance.
@@ -0,0 +1,222 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Action plan queue ordered by the priority of the rules.
+
+The matches of a ruleset wait here until the runner dispatches their
+actions. Matches of rules with a higher priority are dispatched first,
+matches of the same priority in the order they matched.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Matches waiting before the ruleset stops reading events
+BACKLOG = 10
+
+# rank, -priority, sequence, queued at, match
+Entry = Tuple[float, int, int, float, Any]
+
+
+def _persisted(item: Any) -> bool:
+    """Whether the actions of a match are tracked by persistence."""
+    results = getattr(item, "rule_engine_results", None)
+    return bool(getattr(results, "matching_uuid", None))
+
+
+class ActionPlanQueue:
+    """Queue of the matches of a ruleset, highest priority first.
+
+    A waiting match gains one priority level every aging seconds so
+    low priority matches are not starved, 0 disables aging. When limit
+    is set and the queue is full, the newest match of the lowest
+    priority is dropped to make room for a match of a higher one, or
+    the new match is dropped if none is lower. Matches tracked by
+    persistence are never dropped, the queue holds them over the limit.
+    """
+
+    def __init__(self, limit: int = 0, aging: float = 0):
+        self.limit = limit
+        self.aging = aging
+        self._heap: List[Entry] = []
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+        self._waiting = 0
+        self._notify_task: Optional[asyncio.Task] = None
+        self._stats: Dict[int, Dict[str, Union[int, float]]] = {}
+
+    def _level_stats(self, priority: int) -> Dict[str, Union[int, float]]:
+        stats = self._stats.get(priority)
+        if stats is None:
+            stats = self._stats[priority] = {
+                "depth": 0,
+                "max_depth": 0,
+                "dispatched": 0,
+                "dropped": 0,
+                "max_wait": 0.0,
+            }
+        return stats
+
+    def qsize(self) -> int:
+        return len(self._heap)
+
+    def empty(self) -> bool:
+        return not self._heap
+
+    def _entry(self, item: Any) -> Entry:
+        priority = getattr(item, "priority", 0)
+        queued_at = time.monotonic()
+        # Waiting aging seconds is worth a priority level, every waiting
+        # match gains the same so their order doesn't change over time
+        rank = priority - queued_at / self.aging if self.aging else priority
+        return (-rank, -priority, next(self._sequence), queued_at, item)
+
+    def put_nowait(self, item: Any) -> None:
+        entry = self._entry(item)
+        if self.limit and len(self._heap) >= self.limit:
+            if not self._make_room(entry):
+                return
+        heapq.heappush(self._heap, entry)
+        stats = self._level_stats(-entry[1])
+        stats["depth"] += 1
+        stats["max_depth"] = max(stats["max_depth"], stats["depth"])
+        self._notify()
+
+    def _make_room(self, entry: Entry) -> bool:
+        """Drop a match for a new one, False when it's the new one."""
+        candidates = [
+            queued for queued in self._heap if not _persisted(queued[-1])
+        ]
+        if not _persisted(entry[-1]):
+            candidates.append(entry)
+        if not candidates:
+            logger.warning(
+                "Action plan queue is full, keeping the persisted actions "
+                "of rule %s",
+                getattr(entry[-1], "rule", None),
+            )
+            return True
+
+        # The newest match of the lowest priority
+        dropped = max(candidates, key=lambda queued: (queued[1], queued[2]))
+        self._drop(-dropped[1], dropped[-1])
+        if dropped is entry:
+            return False
+        self._heap.remove(dropped)
+        heapq.heapify(self._heap)
+        self._stats[-dropped[1]]["depth"] -= 1
+        return True
+
+    def _drop(self, priority: int, item: Any) -> None:
+        self._level_stats(priority)["dropped"] += 1
+        logger.warning(
+            "Action plan queue is full, dropped the actions of rule %s "
+            "with priority %d",
+            getattr(item, "rule", None),
+            priority,
+        )
+
+    def get_nowait(self) -> Any:
+        if not self._heap:
+            raise asyncio.QueueEmpty
+        return self._dispatch(heapq.heappop(self._heap))
+
+    def take(self, predicate: Callable[[Any], bool]) -> Optional[Any]:
+        """Remove the first match in dispatch order accepted by predicate.
+
+        Returns None when predicate accepts none of the waiting matches.
+        """
+        for entry in sorted(self._heap):
+            if predicate(entry[-1]):
+                break
+        else:
+            return None
+        if entry is self._heap[0]:
+            return self.get_nowait()
+        self._heap.remove(entry)
+        heapq.heapify(self._heap)
+        return self._dispatch(entry)
+
+    def _dispatch(self, entry: Entry) -> Any:
+        _, priority, _, queued_at, item = entry
+        stats = self._stats[-priority]
+        stats["depth"] -= 1
+        stats["dispatched"] += 1
+        stats["max_wait"] = max(
+            stats["max_wait"], round(time.monotonic() - queued_at, 3)
+        )
+        self._notify()
+        return item
+
+    async def get(self) -> Any:
+        await self._wait(lambda: bool(self._heap))
+        return self.get_nowait()
+
+    def peek(self) -> Any:
+        """The match get would return next."""
+        if not self._heap:
+            raise asyncio.QueueEmpty
+        return self._heap[0][-1]
+
+    async def wait_above(self, size: int) -> None:
+        """Wait until more than size matches are waiting."""
+        await self._wait(lambda: len(self._heap) > size)
+
+    async def wait_below(self, size: int) -> None:
+        """Wait until at most size matches are waiting."""
+        await self._wait(lambda: len(self._heap) <= size)
+
+    async def wait_for_room(self) -> None:
+        """Wait until a new match is queued without dropping another."""
+        size = BACKLOG
+        if self.limit:
+            size = min(size, self.limit - 1)
+        await self.wait_below(size)
+
+    async def _wait(self, predicate) -> None:
+        if predicate():
+            return
+        async with self._changed:
+            self._waiting += 1
+            try:
+                await self._changed.wait_for(predicate)
+            finally:
+                self._waiting -= 1
+
+    def _notify(self) -> None:
+        # Matches are queued from the rules engine callbacks, which
+        # can't hold the lock of the condition
+        if self._waiting and self._notify_task is None:
+            self._notify_task = asyncio.get_running_loop().create_task(
+                self._notify_all()
+            )
+
+    async def _notify_all(self) -> None:
+        try:
+            async with self._changed:
+                self._changed.notify_all()
+        finally:
+            self._notify_task = None
+
+    def get_stats(self) -> Dict[int, Dict[str, Union[int, float]]]:
+        return {
+            priority: dict(stats)
+            for priority, stats in sorted(self._stats.items(), reverse=True)
+        }
@@ -0,0 +1,315 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Post only the event attributes the rules of a ruleset look at.
+
+The conditions and throttles of a ruleset name the event attributes Drools
+needs, everything else is removed from the events posted to it. The full
+events are kept here, keyed by meta.uuid, for as long as Drools may return
+them in a match and the matching events are swapped back for the full ones
+before the actions run.
+"""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from ansible_rulebook.admission import AdmissionIndex, compile_expression
+
+logger = logging.getLogger(__name__)
+
+Keys = Tuple[str, ...]
+
+# Default time the rules engine keeps partially matched events
+DEFAULT_EVENTS_TTL = 2 * 60 * 60
+
+UNIT_SECONDS = {
+    "millisecond": 0.001,
+    "second": 1,
+    "minute": 60,
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+}
+DURATION = re.compile(
+    r"^\s*(\d+)\s+(millisecond|second|minute|hour|day)s?\s*$"
+)
+PATH_TOKEN = re.compile(
+    r"""\.?([^.\[\]'"]+)|\[(?:"([^"]*)"|'([^']*)'|(-?\d+))\]"""
+)
+THROTTLE_WINDOWS = ("once_within", "once_after", "accumulate_within")
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """Seconds in a duration like 5 minutes, None if it isn't one."""
+    match = DURATION.match(str(value))
+    if not match:
+        return None
+    return int(match.group(1)) * UNIT_SECONDS[match.group(2)]
+
+
+def parse_path(path: str) -> Optional[Keys]:
+    """Keys of the attribute a path refers to, up to the first index.
+
+    Attributes of list items are kept with the whole list.
+    """
+    keys = []
+    position = 0
+    while position < len(path):
+        match = PATH_TOKEN.match(path, position)
+        if not match:
+            return None
+        name, double_quoted, single_quoted, index = match.groups()
+        if index is not None:
+            break
+        if name is not None:
+            keys.append(name)
+        else:
+            keys.append(
+                double_quoted if double_quoted is not None else single_quoted
+            )
+        position = match.end()
+    return tuple(keys) if keys else None
+
+
+def _references(node: Any, paths: List[Keys]) -> bool:
+    """Add the attribute paths a node refers to.
+
+    Returns False when a node refers to a whole event.
+    """
+    if isinstance(node, list):
+        return all(_references(item, paths) for item in node)
+    if not isinstance(node, dict):
+        return True
+    if len(node) == 1:
+        kind, value = next(iter(node.items()))
+        if kind == "AssignmentExpression":
+            # The lhs names the match, not an attribute
+            return _references(value["rhs"], paths)
+        if kind in ("Event", "Fact", "Events", "Facts") and isinstance(
+            value, str
+        ):
+            keys = parse_path(value)
+            if keys and kind in ("Events", "Facts"):
+                # The first key names an earlier match of the rule
+                keys = keys[1:]
+            if not keys:
+                return False
+            paths.append(keys)
+            return True
+    return all(_references(value, paths) for value in node.values())
+
+
+def _throttle_path(attribute: str) -> Optional[Keys]:
+    for prefix in ("event", "fact"):
+        if attribute.startswith((f"{prefix}.", f"{prefix}[")):
+            return parse_path(attribute[len(prefix) :])
+    return None
+
+
+def _tree(paths: List[Keys]) -> Dict:
+    """Nest the paths, None marks an attribute kept as a whole."""
+    tree = {}
+    for keys in sorted(set(paths), key=len):
+        node = tree
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+            if node is None:
+                break
+        else:
+            node[keys[-1]] = None
+    return tree
+
+
+def _project(value: Dict, tree: Dict) -> Tuple[Dict, bool]:
+    projected = {}
+    pruned = False
+    for key, item in value.items():
+        if key not in tree:
+            pruned = True
+        elif tree[key] is None or not isinstance(item, dict):
+            projected[key] = item
+        else:
+            projected[key], item_pruned = _project(item, tree[key])
+            pruned = pruned or item_pruned
+    return projected, pruned
+
+
+def _uuid(event: Any) -> Optional[str]:
+    if isinstance(event, dict) and isinstance(event.get("meta"), dict):
+        return event["meta"].get("uuid")
+    return None
+
+
+class EventProjection:
+    """Projection of the events posted to a ruleset.
+
+    Rulesets whose rules all match or reject an event while it is posted
+    only keep the event being posted. Rules that hold events, like rules
+    with several conditions, timeouts and throttles, keep the events they
+    may match for the longest time the rules engine could hold them. At
+    most limit events are kept, the oldest ones are evicted first and a
+    match of an evicted event gets the projected event, 0 keeps them all.
+    """
+
+    def __init__(
+        self,
+        tree: Dict,
+        retention: float = 0,
+        retained: Optional[AdmissionIndex] = None,
+        release_on_match: bool = True,
+        limit: int = 0,
+    ):
+        self.tree = tree
+        self.retention = retention
+        self.retained = retained
+        self.release_on_match = release_on_match
+        self.limit = limit
+        self.evicted = 0
+        self.max_retained = 0
+        self._current: Optional[Tuple[str, Dict]] = None
+        self._events: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+
+    @classmethod
+    def from_ruleset_ast(
+        cls, ruleset_ast: Dict, limit: int = 0
+    ) -> Optional["EventProjection"]:
+        """Build the projection, None when a rule needs whole events."""
+        name = ruleset_ast.get("name")
+        match_multiple = ruleset_ast.get("match_multiple_rules", False)
+        paths: List[Keys] = [("meta",)]
+        windows = []
+        retaining = []
+        for rule in ruleset_ast["rules"]:
+            rule = rule["Rule"]
+            condition = rule["condition"]
+            if not _references(condition, paths):
+                logger.debug("Ruleset %s posts whole events", name)
+                return None
+
+            rule_windows = []
+            if "timeout" in condition:
+                rule_windows.append(condition["timeout"])
+            throttle = rule.get("throttle")
+            if throttle:
+                for attribute in throttle["group_by_attributes"]:
+                    keys = _throttle_path(attribute)
+                    if not keys:
+                        logger.debug("Ruleset %s posts whole events", name)
+                        return None
+                    paths.append(keys)
+                rule_windows.extend(
+                    throttle[key]
+                    for key in THROTTLE_WINDOWS
+                    if key in throttle
+                )
+
+            single = "AnyCondition" in condition or (
+                len(condition.get("AllCondition", [])) == 1
+            )
+            if rule_windows or not single or match_multiple:
+                windows.extend(rule_windows)
+                for when, expressions in condition.items():
+                    if when != "timeout":
+                        retaining.extend(
+                            compile_expression(expression)
+                            for expression in expressions
+                        )
+
+        retention = 0
+        retained = None
+        if retaining:
+            windows.append(
+                ruleset_ast.get("default_events_ttl") or DEFAULT_EVENTS_TTL
+            )
+            seconds = [
+                (
+                    window
+                    if isinstance(window, (int, float))
+                    else parse_duration(window)
+                )
+                for window in windows
+            ]
+            if None in seconds:
+                logger.debug("Ruleset %s posts whole events", name)
+                return None
+            retention = max(seconds)
+            retained = AdmissionIndex(retaining)
+        return cls(
+            _tree(paths), retention, retained, not match_multiple, limit
+        )
+
+    def project(self, event: Dict) -> Dict:
+        """Return the event to post, keep the full event if it differs."""
+        uuid = _uuid(event)
+        if not uuid:
+            return event
+        projected, pruned = _project(event, self.tree)
+        if not pruned:
+            return event
+
+        now = time.monotonic()
+        while self._events:
+            _, (deadline, _) = next(iter(self._events.items()))
+            if deadline > now:
+                break
+            self._events.popitem(last=False)
+
+        # Matches are dispatched while the event is posted
+        self._current = (uuid, event)
+        if self.retention and (
+            self.retained is None or self.retained.admits(event)
+        ):
+            self._events[uuid] = (now + self.retention, event)
+            if self.limit and len(self._events) > self.limit:
+                self._evict()
+            self.max_retained = max(self.max_retained, len(self._events))
+        return projected
+
+    def _evict(self) -> None:
+        self._events.popitem(last=False)
+        if not self.evicted:
+            logger.warning(
+                "More than %d events retained for projection, evicting "
+                "the oldest, their matches get the projected events",
+                self.limit,
+            )
+        self.evicted += 1
+
+    def rehydrate(self, data: Dict) -> Dict:
+        """Swap the events of a match for the full events."""
+        rehydrated = {}
+        for name, event in data.items():
+            uuid = _uuid(event)
+            full = None
+            if uuid and uuid in self._events:
+                if self.release_on_match:
+                    _, full = self._events.pop(uuid)
+                else:
+                    _, full = self._events[uuid]
+            elif self._current and self._current[0] == uuid:
+                full = self._current[1]
+            rehydrated[name] = event if full is None else full
+        return rehydrated
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "retained": len(self._events),
+            "max_retained": self.max_retained,
+            "evicted": self.evicted,
+        }
@@ -12,15 +12,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-import asyncio
+import dataclasses
 import json
 import logging
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from drools.rule import Rule as DroolsRule
 from drools.ruleset import Ruleset as DroolsRuleset
 
+from ansible_rulebook.admission import AdmissionIndex
+from ansible_rulebook.conf import settings
+from ansible_rulebook.envelope import EventEnvelope
 from ansible_rulebook.json_generator import visit_ruleset
+from ansible_rulebook.plan_queue import ActionPlanQueue
+from ansible_rulebook.projection import EventProjection
 from ansible_rulebook.rule_types import (
     Action,
     ActionContext,
@@ -43,6 +48,7 @@ def add_to_plan(
     hosts: List,
     plan: Plan,
     rule_engine_results: Any,
+    priority: int = 0,
 ) -> None:
     plan.queue.put_nowait(
         ActionContext(
@@ -55,6 +61,7 @@ def add_to_plan(
             inventory,
             hosts,
             rule_engine_results,
+            priority,
         )
     )
 
@@ -67,9 +74,25 @@ def make_fn(
     inventory: str,
     hosts: List,
     plan: Plan,
+    projection: Optional[EventProjection] = None,
 ) -> Callable:
     def fn(rule_engine_results):
         logger.debug("callback calling %s", ansible_rule.name)
+        data = rule_engine_results.data
+        if projection:
+            data = projection.rehydrate(data)
+        # The actions of the match share the encoding of its events
+        rule_engine_results = dataclasses.replace(
+            rule_engine_results,
+            data={
+                name: (
+                    EventEnvelope.wrap(event)
+                    if isinstance(event, dict)
+                    else event
+                )
+                for name, event in data.items()
+            },
+        )
         add_to_plan(
             ruleset,
             ruleset_uuid,
@@ -81,6 +104,7 @@ def make_fn(
             hosts,
             plan,
             rule_engine_results,
+            ansible_rule.priority,
         )
 
     return fn
@@ -104,7 +128,19 @@ def generate_rulesets(
             name=ansible_ruleset.name,
             serialized_ruleset=json.dumps(ruleset_ast["RuleSet"]),
         )
-        plan = Plan(queue=asyncio.Queue())
+        plan = Plan(
+            queue=ActionPlanQueue(
+                settings.action_plan_queue_size,
+                settings.action_priority_aging,
+            )
+        )
+        projection = None
+        # Events restored by the persistence store after a restart have
+        # no full copy here
+        if settings.event_projection and not settings.persistence_enabled:
+            projection = EventProjection.from_ruleset_ast(
+                ruleset_ast["RuleSet"], settings.event_projection_size
+            )
         for ansible_rule in ansible_ruleset.rules:
             if ansible_rule.enabled:
                 fn = make_fn(
@@ -115,14 +151,23 @@ def generate_rulesets(
                     inventory,
                     ansible_ruleset.hosts,
                     plan,
+                    projection,
                 )
                 drools_ruleset.add_rule(
                     DroolsRule(name=ansible_rule.name, callback=fn)
                 )
 
+        admission = None
+        if settings.event_admission:
+            admission = AdmissionIndex.from_ruleset_ast(ruleset_ast["RuleSet"])
         rulesets.append(
             EngineRuleSetQueuePlan(
-                drools_ruleset, source_queue, plan, source_feedback_queues
+                drools_ruleset,
+                source_queue,
+                plan,
+                source_feedback_queues,
+                admission,
+                projection,
             )
         )
     return rulesets
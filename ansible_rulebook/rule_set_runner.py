@@ -16,10 +16,10 @@ import asyncio
 import gc
 import logging
 import uuid
-from collections import defaultdict
+from collections import ChainMap, Counter, defaultdict, deque
 from pprint import pformat
 from types import MappingProxyType
-from typing import Dict, List, Optional, Union, cast
+from typing import Deque, Dict, List, Optional, Union, cast
 
 import dpath
 import jinja2.exceptions as jinja2_exceptions
@@ -28,7 +28,6 @@ from drools.exceptions import (
     MessageNotHandledException,
     MessageObservedException,
 )
-from drools.ruleset import session_stats
 
 from ansible_rulebook import terminal
 from ansible_rulebook.action.control import Control
@@ -49,14 +48,18 @@ from ansible_rulebook.action.run_playbook import RunPlaybook
 from ansible_rulebook.action.run_workflow_template import RunWorkflowTemplate
 from ansible_rulebook.action.set_fact import SetFact
 from ansible_rulebook.action.shutdown import Shutdown as ShutdownAction
+from ansible_rulebook.action_pools import action_pools
 from ansible_rulebook.back_pressure import BackPressureManager
 from ansible_rulebook.conf import settings
+from ansible_rulebook.envelope import EventEnvelope, encode
 from ansible_rulebook.exception import (
     ShutdownException,
     UnsupportedActionException,
 )
 from ansible_rulebook.messages import Shutdown
 from ansible_rulebook.persistence import (
+    delete_action_info,
+    flush_action_info,
     get_action_a_priori,
     update_action_info,
 )
@@ -65,10 +68,13 @@ from ansible_rulebook.rule_types import (
     ActionContext,
     EngineRuleSetQueuePlan,
     ExecutionStrategy,
+    RuleSet,
 )
 from ansible_rulebook.rules_parser import parse_hosts
+from ansible_rulebook.stats_sampler import session_stats_sampler
 from ansible_rulebook.util import (
     mask_sensitive_variable_values,
+    render_string,
     run_at,
     send_session_stats,
     substitute_variables,
@@ -76,6 +82,9 @@ from ansible_rulebook.util import (
 
 COMPLETED_STATUSES = [FAILED_STATUS, SUCCESSFUL_STATUS]
 
+# Number of host facts asserted before yielding to the event loop
+PRIME_FACTS_CHUNK_SIZE = 100
+
 logger = logging.getLogger(__name__)
 
 ACTION_CLASSES = {
@@ -92,6 +101,28 @@ ACTION_CLASSES = {
     "run_workflow_template": RunWorkflowTemplate,
 }
 
+# Actions that only talk to the rules engine and the event log, they are
+# run without a task or an action slot of their own
+INLINE_ACTIONS = frozenset(
+    ["debug", "print_event", "none", "set_fact", "post_event", "retract_fact"]
+)
+
+
+def _pooled_actions(rule_set: RuleSet) -> List[str]:
+    """The actions of a ruleset that take a slot of an action pool.
+
+    Inline actions only take one when they are tracked by persistence
+    or use a lock, like in _is_inline.
+    """
+    return [
+        action.action
+        for rule in rule_set.rules
+        for action in rule.actions
+        if action.action not in INLINE_ACTIONS
+        or "lock" in action.action_args
+        or settings.persistence_enabled
+    ]
+
 
 class RuleSetRunner:
     def __init__(
@@ -108,6 +139,8 @@ class RuleSetRunner:
         self.action_loop_task = None
         self.event_log = event_log
         self.ruleset_queue_plan = ruleset_queue_plan
+        self.admission = ruleset_queue_plan.admission
+        self.projection = ruleset_queue_plan.projection
         self.name = ruleset_queue_plan.ruleset.name
         self.rule_set = rule_set
         self.hosts_facts = hosts_facts
@@ -120,12 +153,32 @@ class RuleSetRunner:
         self.event_counter = 0
         self.display = terminal.Display()
         self.locks = defaultdict(asyncio.Lock)
-        self.back_pressure_manager = BackPressureManager(event_log)
+        # Only the pools the actions of this ruleset run in hold back its
+        # events
+        self.pools = action_pools.for_actions(
+            self.name, _pooled_actions(rule_set)
+        )
+        self.back_pressure_manager = BackPressureManager(event_log, self.pools)
+        self._masked = None
+        # Matches waiting for the match before them with the same key,
+        # a lane is dropped as soon as it is drained
+        self._lanes: Dict[Optional[str], Deque] = {}
+        self._lock_users = Counter()
+
+    def _masked_variables(self, variables: Dict) -> Dict:
+        """Rulebook variables with the sensitive values masked, built once."""
+        if self._masked is None or self._masked[0] is not variables:
+            self._masked = (
+                variables,
+                mask_sensitive_variable_values(variables),
+            )
+        return self._masked[1]
 
     async def run_ruleset(self):
         tasks = []
+        session_stats_sampler.watch(self.name, self.admission)
         try:
-            prime_facts(self.name, self.hosts_facts)
+            await prime_facts(self.name, self.hosts_facts)
             task_name = (
                 f"action_plan_task:: {self.ruleset_queue_plan.ruleset.name}"
             )
@@ -189,7 +242,27 @@ class RuleSetRunner:
                     kind=self.shutdown.kind,
                 )
             )
-        stats = lang.end_session(self.name)
+        if self.admission and self.admission.dropped:
+            logger.info(
+                "Ruleset %s dropped %d events no rule could match",
+                self.name,
+                self.admission.dropped,
+            )
+        for pool in self.pools:
+            logger.info("Action pool %s stats %s", pool.name, pool.get_stats())
+        logger.info(
+            "Action plan queue stats by priority %s",
+            self.ruleset_queue_plan.plan.queue.get_stats(),
+        )
+        if self.projection:
+            logger.info(
+                "Event projection stats %s", self.projection.get_stats()
+            )
+        flush_action_info(self.name)
+        stats = session_stats_sampler.adjust(
+            self.name, lang.end_session(self.name)
+        )
+        session_stats_sampler.forget(self.name)
         if self.parsed_args and self.parsed_args.heartbeat > 0:
             await send_session_stats(self.event_log, stats)
         logger.info(pformat(stats))
@@ -253,6 +326,9 @@ class RuleSetRunner:
                     await self.event_log.put(dict(type="EmptyEvent"))
                     continue
 
+                if isinstance(data, dict):
+                    data = EventEnvelope.wrap(data)
+
                 # Feedback must be sent for any event the engine
                 # received, even if already observed or unhandled,
                 # so the source can advance. Without this, feedback-
@@ -260,12 +336,22 @@ class RuleSetRunner:
                 # that never arrives.
                 send_feedback = False
                 try:
-                    logger.debug(
-                        "Posting data to ruleset %s => %s",
-                        self.name,
-                        str(data),
-                    )
-                    lang.post(self.name, data)
+                    if self.admission and not self.admission.admits(data):
+                        logger.debug(
+                            "No rule of ruleset %s can match => %s",
+                            self.name,
+                            str(data),
+                        )
+                    else:
+                        logger.debug(
+                            "Posting data to ruleset %s => %s",
+                            self.name,
+                            str(data),
+                        )
+                        event = data
+                        if self.projection:
+                            event = self.projection.project(data)
+                        lang.post(self.name, encode(event))
                     send_feedback = True
                 except asyncio.CancelledError:
                     raise
@@ -280,7 +366,8 @@ class RuleSetRunner:
                     # state is unknown.
                     logger.error(e)
                 finally:
-                    logger.debug(lang.get_pending_events(self.name))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(lang.get_pending_events(self.name))
                     if (
                         settings.gc_after
                         and self.event_counter > settings.gc_after
@@ -289,8 +376,7 @@ class RuleSetRunner:
                         gc.collect()
                     else:
                         self.event_counter += 1
-                    while self.ruleset_queue_plan.plan.queue.qsize() > 10:
-                        await asyncio.sleep(0)
+                    await self.ruleset_queue_plan.plan.queue.wait_for_room()
 
                 # Send feedback outside the try/except so it runs
                 # regardless of which lang.post() outcome occurred.
@@ -322,6 +408,9 @@ class RuleSetRunner:
             task.get_name(),
             len(self.active_actions),
         )
+        self._end_if_idle()
+
+    def _end_if_idle(self):
         if (
             self.ruleset_queue_plan.plan.queue.empty()
             and self.shutdown
@@ -343,16 +432,24 @@ class RuleSetRunner:
         Acquire the lock for the specified resource, access the resource,
         and release the lock.
         """
-        async with self.locks[lock_name]:
-            logger.debug(
-                f"Acquired lock: {lock_name} for action: {action}, "
-                f"rule: {metadata.rule}"
-            )
-            await ACTION_CLASSES[action](
-                metadata,
-                control,
-                **action_args,
-            )()
+        self._lock_users[lock_name] += 1
+        try:
+            async with self.locks[lock_name]:
+                logger.debug(
+                    f"Acquired lock: {lock_name} for action: {action}, "
+                    f"rule: {metadata.rule}"
+                )
+                await ACTION_CLASSES[action](
+                    metadata,
+                    control,
+                    **action_args,
+                )()
+        finally:
+            self._lock_users[lock_name] -= 1
+            if not self._lock_users[lock_name]:
+                # Locks nobody holds or waits for are not kept
+                del self._lock_users[lock_name]
+                del self.locks[lock_name]
 
         logger.debug(
             f"Released lock: {lock_name} for action: {action}, "
@@ -363,7 +460,7 @@ class RuleSetRunner:
         logger.info("Waiting for actions on events from %s", self.name)
         try:
             while True:
-                queue_item = await self.ruleset_queue_plan.plan.queue.get()
+                queue_item = await self._next_action_item()
                 rule_run_at = run_at()
                 action_item = cast(ActionContext, queue_item)
                 if (
@@ -371,25 +468,30 @@ class RuleSetRunner:
                     and self.parsed_args.heartbeat > 0
                     and not settings.skip_audit_events
                 ):
-                    await send_session_stats(
-                        self.event_log,
-                        session_stats(self.ruleset_queue_plan.ruleset.name),
+                    await session_stats_sampler.send_changed(
+                        self.event_log, self.ruleset_queue_plan.ruleset.name
                     )
-                if len(action_item.actions) > 1:
-                    task = asyncio.create_task(
-                        self._run_multiple_actions(action_item, rule_run_at)
-                    )
-                    self.active_actions.add(task)
-                    task.add_done_callback(self._handle_action_completion)
-                else:
-                    task = self._run_action(
-                        action_item.actions[0], action_item, rule_run_at
+                strategy = self.rule_set.execution_strategy
+                if strategy == ExecutionStrategy.PARTITIONED:
+                    self._enqueue(
+                        self._partition(action_item), action_item, rule_run_at
                     )
+                    continue
 
-                if (
-                    self.rule_set.execution_strategy
-                    == ExecutionStrategy.SEQUENTIAL
-                ):
+                if self._is_inline(action_item):
+                    if strategy == ExecutionStrategy.SEQUENTIAL:
+                        await self._run_inline_actions(
+                            action_item, rule_run_at
+                        )
+                        self._end_if_idle()
+                    else:
+                        # The internal actions of a parallel ruleset share
+                        # one lane
+                        self._enqueue(None, action_item, rule_run_at)
+                    continue
+
+                task = self._start_actions(action_item, rule_run_at)
+                if strategy == ExecutionStrategy.SEQUENTIAL:
                     await task
 
         except asyncio.CancelledError:
@@ -403,6 +505,171 @@ class RuleSetRunner:
         finally:
             await self._cleanup()
 
+    async def _next_action_item(self) -> ActionContext:
+        """Take the next match off the action plan queue.
+
+        In a parallel ruleset a match waits in the queue while the pools
+        its actions need are full, so the highest priority match gets
+        the next free slot. Matches behind it whose pools have room,
+        inline ones included, are dispatched meanwhile.
+        """
+        queue = self.ruleset_queue_plan.plan.queue
+        if self.rule_set.execution_strategy != ExecutionStrategy.PARALLEL:
+            return await queue.get()
+
+        while True:
+            await queue.wait_above(0)
+            exhausted = []
+
+            def has_room(action_item: ActionContext) -> bool:
+                pools = self._exhausted_pools(action_item)
+                for pool in pools:
+                    if pool not in exhausted:
+                        exhausted.append(pool)
+                return not pools
+
+            action_item = queue.take(has_room)
+            if action_item is not None:
+                return action_item
+
+            waiters = [
+                asyncio.ensure_future(pool.free_slot()) for pool in exhausted
+            ]
+            waiters.append(
+                asyncio.ensure_future(queue.wait_above(queue.qsize()))
+            )
+            try:
+                await asyncio.wait(
+                    waiters, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def _exhausted_pools(self, action_item: ActionContext) -> List:
+        if self._is_inline(action_item):
+            return []
+        pools = []
+        for action in action_item.actions:
+            pool = action_pools.get(self.name, action.action)
+            if pool is None or not pool.exhausted:
+                continue
+            if pool not in pools:
+                pools.append(pool)
+        return pools
+
+    def _is_inline(self, action_item: ActionContext) -> bool:
+        """Check if the actions of a match can skip the action machinery.
+
+        Actions tracked by persistence and actions waiting on a lock
+        still get a task of their own.
+        """
+        if action_item.rule_engine_results.matching_uuid:
+            return False
+        return all(
+            action.action in INLINE_ACTIONS
+            and "lock" not in action.action_args
+            for action in action_item.actions
+        )
+
+    async def _run_inline_actions(
+        self, action_item: ActionContext, rule_run_at: str
+    ) -> None:
+        for action in action_item.actions:
+            metadata = Metadata(
+                rule_set=action_item.ruleset,
+                rule_set_uuid=action_item.ruleset_uuid,
+                rule=action_item.rule,
+                rule_uuid=action_item.rule_uuid,
+                rule_run_at=rule_run_at,
+            )
+            await self._call_action(
+                metadata,
+                action.action,
+                MappingProxyType(action.action_args),
+                action_item.variables,
+                action_item.inventory,
+                action_item.hosts,
+                action_item.rule_engine_results,
+            )
+
+    def _start_actions(
+        self, action_item: ActionContext, rule_run_at: str
+    ) -> asyncio.Task:
+        if len(action_item.actions) > 1:
+            task = asyncio.create_task(
+                self._run_multiple_actions(action_item, rule_run_at)
+            )
+            self.active_actions.add(task)
+            task.add_done_callback(self._handle_action_completion)
+            return task
+        return self._run_action(
+            action_item.actions[0], action_item, rule_run_at
+        )
+
+    def _partition(self, action_item: ActionContext) -> str:
+        """Render the partition key of the ruleset for a match."""
+        data = action_item.rule_engine_results.data
+        context = ChainMap(
+            {"event": data["m"]} if list(data) == ["m"] else {"events": data},
+            action_item.variables,
+        )
+        try:
+            return str(render_string(self.rule_set.partition_key, context))
+        except Exception as e:
+            logger.warning(
+                "Partition key of rule %s could not be rendered, err %s",
+                action_item.rule,
+                str(e),
+            )
+            return ""
+
+    def _enqueue(
+        self,
+        key: Optional[str],
+        action_item: ActionContext,
+        rule_run_at: str,
+    ) -> None:
+        """Run the actions of a match after the earlier ones of its lane.
+
+        A lane gets a task when its first match arrives, the task ends
+        and the lane is dropped once it has caught up.
+        """
+        lane = self._lanes.get(key)
+        if lane is not None:
+            lane.append((action_item, rule_run_at))
+            return
+
+        self._lanes[key] = deque([(action_item, rule_run_at)])
+        if key is None:
+            task_name = f"inline_actions::{self.name}"
+        else:
+            task_name = f"partition::{self.name}::{key}"
+        task = asyncio.create_task(self._drain_lane(key), name=task_name)
+        self.active_actions.add(task)
+        task.add_done_callback(self._handle_action_completion)
+
+    async def _drain_lane(self, key: Optional[str]) -> None:
+        lane = self._lanes[key]
+        try:
+            while lane:
+                action_item, rule_run_at = lane.popleft()
+                try:
+                    if self._is_inline(action_item):
+                        await self._run_inline_actions(
+                            action_item, rule_run_at
+                        )
+                    else:
+                        await self._start_actions(action_item, rule_run_at)
+                except Exception as e:
+                    logger.error(
+                        "Error running actions of rule %s, err %s",
+                        action_item.rule,
+                        str(e),
+                    )
+        finally:
+            del self._lanes[key]
+
     async def _run_multiple_actions(
         self, action_item: ActionContext, rule_run_at: str
     ) -> None:
@@ -487,8 +754,9 @@ class RuleSetRunner:
         hosts: List,
         rules_engine_result,
     ) -> None:
-        if settings.max_actions_semaphore:
-            async with settings.max_actions_semaphore:
+        pool = action_pools.get(self.name, action)
+        if pool:
+            async with pool:
                 await self._call_action(
                     metadata,
                     action,
@@ -537,7 +805,7 @@ class RuleSetRunner:
                 metadata.persistent_info
                 and metadata.persistent_info.last_action
             ):
-                lang.delete_action_info(
+                delete_action_info(
                     metadata.rule_set, metadata.persistent_info.matching_uuid
                 )
             return
@@ -573,11 +841,16 @@ class RuleSetRunner:
                     single_match = rules_engine_result.data[keys[0]]
                 else:
                     multi_match = rules_engine_result.data
-                variables_copy = variables.copy()
-                if action == "debug":
-                    variables_copy = mask_sensitive_variable_values(
-                        variables_copy
-                    )
+                # The match goes in an overlay, the rulebook variables are
+                # shared by every action and never deep copied
+                variables_copy = ChainMap(
+                    {},
+                    (
+                        self._masked_variables(variables)
+                        if action == "debug"
+                        else variables
+                    ),
+                )
                 if single_match is not None:
                     variables_copy["event"] = single_match
                     event = single_match
@@ -585,7 +858,8 @@ class RuleSetRunner:
                         if "hosts" in event["meta"]:
                             hosts = parse_hosts(event["meta"]["hosts"])
                 else:
-                    variables_copy["events"] = multi_match
+                    # var_root changes the events of this action only
+                    variables_copy["events"] = dict(multi_match)
                     new_hosts = []
                     for event in variables_copy["events"].values():
                         if "meta" in event:
@@ -619,7 +893,7 @@ class RuleSetRunner:
                 lock = action_args.get("lock", None)
                 if (
                     self.rule_set.execution_strategy
-                    == ExecutionStrategy.PARALLEL
+                    != ExecutionStrategy.SEQUENTIAL
                     and lock
                 ):
                     await self._run_action_with_lock(
@@ -641,7 +915,9 @@ class RuleSetRunner:
                 logger.error(
                     "KeyError %s with variables %s",
                     str(e),
-                    pformat(mask_sensitive_variable_values(variables_copy)),
+                    pformat(
+                        mask_sensitive_variable_values(dict(variables_copy))
+                    ),
                 )
                 error = e
             except MessageNotHandledException as e:
@@ -687,7 +963,7 @@ class RuleSetRunner:
                     and not cancelled
                 ):
                     if metadata.persistent_info.last_action:
-                        lang.delete_action_info(
+                        delete_action_info(
                             metadata.rule_set,
                             metadata.persistent_info.matching_uuid,
                         )
@@ -725,12 +1001,16 @@ class RuleSetRunner:
             )
 
 
-def prime_facts(name: str, hosts_facts: List[Dict]):
-    for data in hosts_facts:
+async def prime_facts(name: str, hosts_facts: List[Dict]):
+    # Large inventories are asserted in chunks so other rulesets and the
+    # sources keep running while the facts are loaded
+    for index, data in enumerate(hosts_facts, 1):
         try:
             lang.assert_fact(name, data)
         except MessageNotHandledException:
             pass
+        if index % PRIME_FACTS_CHUNK_SIZE == 0:
+            await asyncio.sleep(0)
 
 
 def _update_variables(variables: Dict, var_root: Union[str, Dict]):
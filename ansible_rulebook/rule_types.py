@@ -22,11 +22,14 @@ from typing import Any, Dict, List, NamedTuple, Optional, Union
 from drools.ruleset import Ruleset as EngineRuleSet
 
 import ansible_rulebook.condition_types as ct
+from ansible_rulebook.admission import AdmissionIndex
+from ansible_rulebook.projection import EventProjection
 
 
 class ExecutionStrategy(Enum):
     SEQUENTIAL = 1
     PARALLEL = 2
+    PARTITIONED = 3
 
 
 class EventSourceFilter(NamedTuple):
@@ -69,6 +72,7 @@ class Rule(NamedTuple):
     enabled: bool
     throttle: Optional[Throttle] = None
     uuid: Optional[str] = None
+    priority: int = 0
 
 
 class RuleSet(NamedTuple):
@@ -81,6 +85,7 @@ class RuleSet(NamedTuple):
     uuid: Optional[str] = None
     default_events_ttl: Optional[str] = None
     match_multiple_rules: bool = False
+    partition_key: Optional[str] = None
 
 
 class ActionContext(NamedTuple):
@@ -93,6 +98,7 @@ class ActionContext(NamedTuple):
     inventory: str
     hosts: List[str]
     rule_engine_results: Any
+    priority: int = 0
 
 
 class RuleSetQueue(NamedTuple):
@@ -111,3 +117,5 @@ class EngineRuleSetQueuePlan(NamedTuple):
     source_queue: asyncio.Queue
     plan: Plan
     source_feedback_queues: dict[str, asyncio.Queue]
+    admission: Optional[AdmissionIndex] = None
+    projection: Optional[EventProjection] = None
@@ -31,6 +31,7 @@ from ansible_rulebook.conf import settings
 from ansible_rulebook.util import substitute_variables
 
 from .exception import (
+    PartitionKeyMissingException,
     RulenameDuplicateException,
     RulenameEmptyException,
     RulesetNameDuplicateException,
@@ -84,6 +85,13 @@ def parse_rule_sets(
             execution_strategy = rt.ExecutionStrategy.SEQUENTIAL
         elif strategy == "parallel":
             execution_strategy = rt.ExecutionStrategy.PARALLEL
+        elif strategy == "partitioned":
+            execution_strategy = rt.ExecutionStrategy.PARTITIONED
+            if not rule_set.get("partition_key"):
+                raise PartitionKeyMissingException(
+                    f"Ruleset {name} with partitioned execution strategy "
+                    "needs a partition_key"
+                )
 
         rule_set_list.append(
             rt.RuleSet(
@@ -98,6 +106,7 @@ def parse_rule_sets(
                 match_multiple_rules=rule_set.get(
                     "match_multiple_rules", False
                 ),
+                partition_key=rule_set.get("partition_key"),
             )
         )
     return rule_set_list
@@ -190,6 +199,7 @@ def parse_rules(rules: Dict, variables: Dict) -> List[rt.Rule]:
             enabled=rule.get("enabled", True),
             throttle=throttle,
             uuid=str(uuid.uuid4()),
+            priority=rule.get("priority", 0),
         )
         if rule.enabled:
             rule_list.append(rule)
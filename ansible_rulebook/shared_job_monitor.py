@@ -14,16 +14,28 @@
 
 import asyncio
 import logging
+import random
+import time
 from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 from ansible_rulebook.conf import settings
 from ansible_rulebook.exception import ControllerApiException
+from ansible_rulebook.job_status_notifier import JobStatusNotifier
 
 if TYPE_CHECKING:
     from ansible_rulebook.job_template_runner import JobTemplateRunner
 
 logger = logging.getLogger(__name__)
 
+# A newly registered job is first polled after FIRST_POLL_DELAY seconds,
+# every following poll waits POLL_BACKOFF_FACTOR times longer, up to the
+# runner's refresh_delay. Jobs due within POLL_COALESCE_WINDOW seconds are
+# polled together so they share the id__in requests.
+FIRST_POLL_DELAY = 1.0
+POLL_BACKOFF_FACTOR = 2.0
+POLL_JITTER = 0.1
+POLL_COALESCE_WINDOW = 0.5
+
 
 class SharedJobMonitor:
     """Shared monitor that polls multiple jobs in batches.
@@ -38,6 +50,13 @@ class SharedJobMonitor:
     - Better error handling across all jobs
     - Reduced overhead from multiple asyncio tasks
     - Natural cleanup when the runner is destroyed
+
+    Every job has its own poll schedule, short jobs are noticed quickly
+    while long running ones back off to the runner's refresh_delay.
+
+    With settings.controller_job_status_stream the controller's websocket
+    tells us when a job finishes and polling every refresh_delay is only
+    kept as a safety net.
     """
 
     def __init__(self, runner: "JobTemplateRunner"):
@@ -47,6 +66,13 @@ class SharedJobMonitor:
         self._jobs_lock = asyncio.Lock()
         self._total_jobs_monitored = 0
         self._monitor_start_count = 0
+        self._wakeup = asyncio.Event()
+        self._api_calls = 0
+        self._poll_loops = 0
+        self._last_loop_latency = 0.0
+        self._max_loop_latency = 0.0
+        self._total_loop_latency = 0.0
+        self._notifier = JobStatusNotifier(runner, self)
 
     @staticmethod
     def _job_key(job_url: str) -> str:
@@ -80,12 +106,19 @@ class SharedJobMonitor:
                 "url": job_url,
                 "numeric_id": numeric_id,
                 "future": future,
+                "polls": 0,
+                "next_poll": time.monotonic()
+                + min(FIRST_POLL_DELAY, self._runner.refresh_delay),
             }
             self._total_jobs_monitored += 1
+            self._wakeup.set()
 
             monitor_was_stopped = (
                 self._monitor_task is None or self._monitor_task.done()
             )
+            if settings.controller_job_status_stream:
+                self._notifier.start()
+
             if monitor_was_stopped:
                 self._monitor_start_count += 1
                 self._monitor_task = asyncio.create_task(self._monitor_loop())
@@ -121,14 +154,23 @@ class SharedJobMonitor:
                             self._total_jobs_monitored,
                         )
                         self._monitor_task = None
+                        await self._notifier.stop()
                         break
 
-                    jobs_to_check = list(self._jobs.items())
-
-                await self._poll_all_jobs(jobs_to_check)
+                    due = time.monotonic() + POLL_COALESCE_WINDOW
+                    jobs_to_check = [
+                        (key, info)
+                        for key, info in self._jobs.items()
+                        if info["next_poll"] <= due
+                    ]
 
                 if jobs_to_check:
-                    await asyncio.sleep(self._runner.refresh_delay)
+                    started = time.monotonic()
+                    await self._poll_all_jobs(jobs_to_check)
+                    self._record_loop_latency(time.monotonic() - started)
+                    self._schedule_next_polls(jobs_to_check)
+
+                await self._wait_for_next_poll()
 
             except (
                 ControllerApiException,
@@ -146,8 +188,67 @@ class SharedJobMonitor:
                     str(e),
                 )
                 await self._fail_all_jobs(e)
+                await self._notifier.stop()
                 break
 
+    def _schedule_next_polls(
+        self, polled_jobs: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """Back off the next poll of every job that is still running."""
+        now = time.monotonic()
+        max_delay = self._runner.refresh_delay
+        for _key, job_info in polled_jobs:
+            job_info["polls"] += 1
+            if self._notifier.connected:
+                job_info["next_poll"] = now + max_delay
+                continue
+            delay = min(
+                max_delay,
+                FIRST_POLL_DELAY * POLL_BACKOFF_FACTOR ** job_info["polls"],
+            )
+            delay *= 1 + random.uniform(-POLL_JITTER, POLL_JITTER)
+            job_info["next_poll"] = now + delay
+
+    async def _wait_for_next_poll(self) -> None:
+        """Sleep until the next job is due or a new job is registered."""
+        self._wakeup.clear()
+        if not self._jobs:
+            return
+        next_poll = min(info["next_poll"] for info in self._jobs.values())
+        delay = next_poll - time.monotonic()
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    def job_finished(self, numeric_id: str) -> None:
+        """Poll a job right away, the status stream reported it done."""
+        now = time.monotonic()
+        for job_info in self._jobs.values():
+            if job_info["numeric_id"] == numeric_id:
+                job_info["next_poll"] = now
+                self._wakeup.set()
+
+    def status_stream_lost(self) -> None:
+        """Go back to the polling schedule for all running jobs."""
+        now = time.monotonic()
+        for job_info in self._jobs.values():
+            job_info["polls"] = 0
+            job_info["next_poll"] = min(
+                job_info["next_poll"],
+                now + min(FIRST_POLL_DELAY, self._runner.refresh_delay),
+            )
+        self._wakeup.set()
+
+    def _record_loop_latency(self, latency: float) -> None:
+        self._poll_loops += 1
+        self._last_loop_latency = latency
+        self._max_loop_latency = max(self._max_loop_latency, latency)
+        self._total_loop_latency += latency
+
     async def _poll_all_jobs(
         self, jobs_to_check: List[Tuple[str, Dict[str, Any]]]
     ):
@@ -199,9 +300,21 @@ class SharedJobMonitor:
             chunk_size,
         )
 
-        for chunk in chunks:
-            chunk_jobs = {jid: jobs[jid] for jid in chunk}
-            await self._poll_job_chunk(chunk_jobs, api_path, job_type)
+        semaphore = asyncio.Semaphore(settings.max_concurrent_job_polls)
+
+        async def _poll_chunk(chunk: List[str]) -> None:
+            async with semaphore:
+                chunk_jobs = {jid: jobs[jid] for jid in chunk}
+                await self._poll_job_chunk(chunk_jobs, api_path, job_type)
+
+        results = await asyncio.gather(
+            *[_poll_chunk(chunk) for chunk in chunks],
+            return_exceptions=True,
+        )
+        # Let the monitor loop classify the error once all chunks are done
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _poll_job_chunk(
         self, jobs: Dict[str, Dict[str, Any]], api_path: str, job_type: str
@@ -221,6 +334,7 @@ class SharedJobMonitor:
             "id__in": ",".join(numeric_ids),
             "page_size": len(numeric_ids),
         }
+        self._api_calls += 1
         result = await self._runner._get_page_no_retry(api_path, params)
 
         processed = 0
@@ -347,6 +461,17 @@ class SharedJobMonitor:
             "monitor_cycles": self._monitor_start_count,
             "monitor_running": self._monitor_task is not None
             and not self._monitor_task.done(),
+            "status_stream_connected": self._notifier.connected,
+            "status_stream_notifications": self._notifier.notifications,
+            "api_calls": self._api_calls,
+            "poll_loops": self._poll_loops,
+            "last_loop_latency": self._last_loop_latency,
+            "max_loop_latency": self._max_loop_latency,
+            "avg_loop_latency": (
+                self._total_loop_latency / self._poll_loops
+                if self._poll_loops
+                else 0.0
+            ),
         }
 
     def is_healthy(self) -> bool:
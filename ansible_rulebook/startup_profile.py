@@ -0,0 +1,70 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator, List, Optional, Tuple
+
+# Heavy dependencies pulled in by the engine, imported one at a time
+# before the engine itself to break down its import time. A module
+# shows up with the time it took to import whatever wasn't imported yet.
+PROFILED_IMPORTS = (
+    "jinja2",
+    "ansible_runner",
+    "jsonschema",
+    "drools.ruleset",
+    "watchdog.observers",
+    "websockets",
+    "aiohttp",
+    "aiohttp_retry",
+    "ansible_rulebook.engine",
+)
+
+
+class StartupProfile:
+    """Wall clock time spent in each phase of the startup."""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases: List[Tuple[str, float]] = []
+
+    def add(self, name: str, elapsed: float) -> None:
+        self.phases.append((name, elapsed))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def import_modules(self) -> None:
+        for name in PROFILED_IMPORTS:
+            with self.phase(f"import {name}"):
+                try:
+                    importlib.import_module(name)
+                except ImportError:
+                    pass
+
+    def report(self, file: Optional[IO] = None) -> None:
+        file = file or sys.stderr
+        total = time.perf_counter() - self.started
+        width = max(len(name) for name, _ in self.phases) if self.phases else 0
+        print("Startup profile:", file=file)
+        for name, elapsed in self.phases:
+            print(f"  {name:<{width}} {elapsed * 1000:9.1f} ms", file=file)
+        print(f"  {'total':<{width}} {total * 1000:9.1f} ms", file=file)
@@ -0,0 +1,109 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from drools.ruleset import session_stats
+
+from ansible_rulebook.admission import AdmissionIndex
+from ansible_rulebook.conf import settings
+from ansible_rulebook.util import send_session_stats
+
+# Stats telling whether the session did something since the last record,
+# clock and memory figures change all the time
+CHANGE_KEYS = (
+    "numberOfRules",
+    "numberOfDisabledRules",
+    "rulesTriggered",
+    "eventsProcessed",
+    "eventsMatched",
+    "eventsSuppressed",
+    "permanentStorageCount",
+    "lastRuleFired",
+    "lastRuleFiredAt",
+    "lastEventReceivedAt",
+)
+
+
+def _fingerprint(stats: Dict) -> Tuple:
+    return tuple(stats.get(key) for key in CHANGE_KEYS)
+
+
+class SessionStatsSampler:
+    """Debounced session stats shared by the heartbeat and the actions.
+
+    Building the stats of a session is a call into the rules engine. A
+    snapshot is taken at most every settings.session_stats_interval
+    milliseconds per ruleset and served to every caller in between.
+    Records sent when an action starts are skipped when the counters
+    haven't changed since the last record of the ruleset.
+
+    Events dropped by the admission index of a ruleset never reach the
+    rules engine, they are added to its counters here.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, Tuple[float, Dict]] = {}
+        self._sent: Dict[str, Tuple] = {}
+        self._admissions: Dict[str, AdmissionIndex] = {}
+
+    def watch(self, name: str, admission: Optional[AdmissionIndex]) -> None:
+        if admission:
+            self._admissions[name] = admission
+
+    def adjust(self, name: str, stats: Optional[Dict]) -> Optional[Dict]:
+        """Count the events dropped before the rules engine in stats."""
+        admission = self._admissions.get(name)
+        if not stats or not admission or not admission.dropped:
+            return stats
+        stats = dict(stats)
+        # Drools counts the events no rule matched as suppressed
+        for key in ("eventsProcessed", "eventsSuppressed"):
+            stats[key] = stats.get(key, 0) + admission.dropped
+        return stats
+
+    def get(self, name: str) -> Optional[Dict]:
+        """Return a snapshot of the stats of a ruleset."""
+        snapshot = self._snapshots.get(name)
+        interval = settings.session_stats_interval / 1000
+        if snapshot and time.monotonic() - snapshot[0] < interval:
+            return snapshot[1]
+        return self.record(name, session_stats(name))
+
+    def record(self, name: str, stats: Optional[Dict]) -> Optional[Dict]:
+        """Keep stats of a ruleset taken by the caller as the snapshot."""
+        stats = self.adjust(name, stats)
+        self._snapshots[name] = (time.monotonic(), stats)
+        return stats
+
+    def mark_sent(self, name: str, stats: Dict) -> None:
+        self._sent[name] = _fingerprint(stats)
+
+    async def send_changed(self, event_log: asyncio.Queue, name: str) -> None:
+        """Send the stats of a ruleset unless nothing changed."""
+        stats = self.get(name)
+        if not stats or self._sent.get(name) == _fingerprint(stats):
+            return
+        self.mark_sent(name, stats)
+        await send_session_stats(event_log, stats)
+
+    def forget(self, name: str) -> None:
+        self._snapshots.pop(name, None)
+        self._sent.pop(name, None)
+        self._admissions.pop(name, None)
+
+
+session_stats_sampler = SessionStatsSampler()
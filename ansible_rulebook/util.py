@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import asyncio
+import functools
 import importlib.metadata
 import logging
 import os
@@ -26,10 +27,9 @@ import tempfile
 import typing
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 from urllib.parse import urlparse
 
-import ansible_runner
 import jinja2
 from jinja2.nativetypes import NativeEnvironment
 from packaging import version
@@ -83,26 +83,37 @@ def decryptable(obj: Union[Dict, List, str, bool, int]) -> None:
                 raise
 
 
-def render_string(value: str, context: Dict) -> str:
+@functools.lru_cache(maxsize=None)
+def _native_environment() -> NativeEnvironment:
+    env = NativeEnvironment(undefined=jinja2.StrictUndefined)
+    register_filters(env)
+    return env
+
+
+@functools.lru_cache(maxsize=1024)
+def _native_template(value: str) -> Any:
+    return _native_environment().from_string(value)
+
+
+def render_string(value: str, context: Mapping) -> str:
     if "{{" in value and "}}" in value:
-        env = NativeEnvironment(undefined=jinja2.StrictUndefined)
-        register_filters(env)
-        # Create a NativeTemplate
-        value = env.from_string(value).render(context)
+        # A ChainMap of variables is flattened into a dict by render, only
+        # the top level names are copied
+        value = _native_template(value).render(context)
 
     if isinstance(value, str) and settings.vault.is_encrypted(value):
         value = settings.vault.decrypt(value)
     return value
 
 
-def render_string_or_return_value(value: Any, context: Dict) -> Any:
+def render_string_or_return_value(value: Any, context: Mapping) -> Any:
     if isinstance(value, str):
         return render_string(value, context)
     return value
 
 
 def substitute_variables(
-    value: Union[str, int, Dict, List], context: Dict
+    value: Union[str, int, Dict, List], context: Mapping
 ) -> Union[str, int, Dict, List]:
     if isinstance(value, str):
         return render_string_or_return_value(value, context)
@@ -120,7 +131,22 @@ def substitute_variables(
         return value
 
 
-def collect_ansible_facts(inventory: str) -> List[Dict]:
+def collect_ansible_facts(
+    inventory: str,
+    hosts: Optional[List[str]] = None,
+    ignore_failures: bool = False,
+) -> List[Dict]:
+    """Gather the facts of the inventory hosts with ansible.builtin.setup.
+
+    Args:
+        inventory: Path of the inventory file or directory
+        hosts: Only gather these hosts, all hosts when not given
+        ignore_failures: Return the facts of the reachable hosts instead of
+            raising when some hosts fail
+    """
+    # Deferred, only activations with gather_facts need ansible-runner here
+    import ansible_runner
+
     hosts_facts = []
     with tempfile.TemporaryDirectory(
         prefix="gather_facts"
@@ -133,8 +159,10 @@ def collect_ansible_facts(inventory: str) -> List[Dict]:
             private_data_dir=private_data_dir,
             module="ansible.builtin.setup",
             host_pattern="*",
+            limit=",".join(hosts) if hosts else None,
+            forks=settings.fact_gathering_forks,
         )
-        if r.rc != 0:
+        if r.rc != 0 and not ignore_failures:
             raise Exception(
                 "Error collecting facts in ansible_runner.run "
                 f"rc={r.rc}, status={r.status}"
@@ -164,6 +192,27 @@ def run_java_settings(exec_path: str) -> subprocess.CompletedProcess:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def get_java_properties(exec_path: str) -> Optional[Dict[str, str]]:
+    """
+    Return the system properties reported by a java executable,
+    or None if it can't be run. Every probe forks a JVM, the result
+    is cached per executable for the life of the process.
+    """
+    try:
+        result = run_java_settings(exec_path)
+    except subprocess.CalledProcessError as exc:
+        logger.error("Failed to run 'java': %s", exc)
+        return None
+
+    properties = {}
+    for line in result.stderr.splitlines():
+        if "=" in line:
+            key, _, value = line.partition("=")
+            properties.setdefault(key.strip(), value.strip())
+    return properties
+
+
 def get_java_home() -> typing.Optional[str]:
     """
     Get the java home path. It tries to get the path
@@ -182,16 +231,10 @@ def get_java_home() -> typing.Optional[str]:
         return None
 
     # try to get the java home path from the default java executable
-    try:
-        result = run_java_settings(exec_path)
-    except subprocess.CalledProcessError:
+    properties = get_java_properties(os.path.realpath(exec_path))
+    if not properties:
         return None
-
-    for line in result.stderr.splitlines():
-        if "java.home" in line:
-            return line.split("=")[-1].strip()
-
-    return None
+    return properties.get("java.home")
 
 
 def get_java_version() -> str:
@@ -200,17 +243,11 @@ def get_java_version() -> str:
     if not java_home:
         return "Java executable not found."
 
-    exec_path = f"{java_home}/bin/java"
-    try:
-        result = run_java_settings(exec_path)
-    except subprocess.CalledProcessError as exc:
-        logger.error("Failed to run 'java': %s", exc)
+    exec_path = os.path.realpath(f"{java_home}/bin/java")
+    properties = get_java_properties(exec_path)
+    if properties is None:
         return "Java error"
-    for line in result.stderr.splitlines():
-        if "java.version" in line:
-            return line.split("=")[-1].strip()
-
-    return "Java version not found."
+    return properties.get("java.version", "Java version not found.")
 
 
 def check_jvm():
@@ -20,6 +20,7 @@ import os
 import random
 import tempfile
 import typing as tp
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 import aiofiles.tempfile
@@ -28,8 +29,10 @@ import yaml
 from websockets.asyncio.client import ClientConnection
 
 from ansible_rulebook import rules_parser as rules_parser
+from ansible_rulebook.audit_spool import AuditSpool
 from ansible_rulebook.common import StartupArgs
 from ansible_rulebook.conf import settings
+from ansible_rulebook.envelope import dumps
 from ansible_rulebook.token import renew_token
 from ansible_rulebook.util import create_context, validate_url
 from ansible_rulebook.vault import Vault, has_vaulted_str
@@ -47,6 +50,9 @@ BACKOFF_INITIAL = 5
 
 WS_TRANSIENT_CLOSE_CODES = {1001, 1006, 1011, 1012, 1013}
 
+# Number of spooled audit records read at a time when replaying them
+SPOOL_REPLAY_BATCH = 100
+
 
 async def _wait_before_retry(backoff_delay: float) -> float:
     # Sleep and retry implemention duplicated from
@@ -277,17 +283,137 @@ async def _handle_request_workload(
 class EventLogQueue:
     queue: asyncio.Queue = field(default=None)
     event: dict = field(default=None)
+    # meta.uuid of the events sent on this connection, least recently
+    # referenced first
+    sent_events: OrderedDict = field(default_factory=OrderedDict)
+    # Audit records kept on disk while the websocket is down
+    spool: tp.Optional[AuditSpool] = field(default=None)
+    spooler: tp.Optional[asyncio.Task] = field(default=None)
+    # Record taken from the queue when the spool was full
+    overflow: dict = field(default=None)
+
+
+def _reference_events(record: dict) -> tp.Tuple[tp.Dict[str, dict], dict]:
+    """Replace the matching events of a record by their meta.uuid.
+
+    Returns the referenced events by uuid and the new record, events
+    without a uuid stay in matching_events.
+    """
+    matching_events = record.get("matching_events")
+    if not isinstance(matching_events, dict):
+        return {}, record
+
+    events = {}
+    embedded = {}
+    references = {}
+    for name, event in matching_events.items():
+        meta = event.get("meta") if isinstance(event, dict) else None
+        uuid = meta.get("uuid") if isinstance(meta, dict) else None
+        if uuid:
+            events[uuid] = event
+            references[name] = uuid
+        else:
+            embedded[name] = event
+    if not references:
+        return {}, record
+    return events, {
+        **record,
+        "matching_events": embedded,
+        "matching_event_uuids": references,
+    }
+
+
+async def _send_log(
+    websocket: ClientConnection, logs: EventLogQueue, record: dict
+) -> None:
+    if settings.audit_event_references:
+        events, record = _reference_events(record)
+        for uuid, event in events.items():
+            if uuid in logs.sent_events:
+                logs.sent_events.move_to_end(uuid)
+                continue
+            await websocket.send(
+                dumps({"type": "Event", "uuid": uuid, "event": event})
+            )
+            logs.sent_events[uuid] = True
+            if len(logs.sent_events) > settings.audit_event_cache_size:
+                logs.sent_events.popitem(last=False)
+    await websocket.send(dumps(record))
+
+
+def _create_spool() -> tp.Optional[AuditSpool]:
+    if not settings.audit_spool_dir:
+        return None
+    path = os.path.join(settings.audit_spool_dir, settings.identifier)
+    logger.info("Spooling audit records to %s while disconnected", path)
+    return AuditSpool(path, settings.audit_spool_size * 1024 * 1024)
+
+
+async def _spool_event_log(logs: EventLogQueue) -> None:
+    """Move the audit records from the queue to the spool."""
+    while True:
+        event = await logs.queue.get()
+        if event == dict(type="Exit"):
+            # Left for the handler in case the websocket reconnects
+            logs.queue.put_nowait(event)
+            return
+        if not logs.spool.append(event):
+            logger.warning(
+                "Audit spool %s is full, holding back new audit records",
+                logs.spool.path,
+            )
+            logs.overflow = event
+            return
+
+
+def _start_spooler(logs: EventLogQueue) -> None:
+    if logs.spool is not None and logs.overflow is None:
+        logs.spooler = asyncio.create_task(
+            _spool_event_log(logs), name="audit_spooler"
+        )
+
+
+async def _stop_spooler(logs: EventLogQueue) -> None:
+    if logs.spooler is not None:
+        logs.spooler.cancel()
+        try:
+            await logs.spooler
+        except asyncio.CancelledError:
+            pass
+        logs.spooler = None
+
+
+async def _replay_spool(
+    websocket: ClientConnection, logs: EventLogQueue
+) -> None:
+    replayed = 0
+    while True:
+        records = logs.spool.read(SPOOL_REPLAY_BATCH)
+        if not records:
+            break
+        for record in records:
+            await _send_log(websocket, logs, record)
+            logs.spool.consume()
+        replayed += len(records)
+    logger.info("Replayed %d spooled audit records", replayed)
 
 
 async def send_event_log_to_websocket(event_log: asyncio.Queue):
     logs = EventLogQueue()
     logs.queue = event_log
-
-    return await _connect_websocket(
-        handler=_handle_send_event_log,
-        retry_on_close=True,
-        logs=logs,
-    )
+    logs.spool = _create_spool()
+    _start_spooler(logs)
+
+    try:
+        return await _connect_websocket(
+            handler=_handle_send_event_log,
+            retry_on_close=True,
+            logs=logs,
+        )
+    finally:
+        await _stop_spooler(logs)
+        if logs.spool is not None:
+            logs.spool.close()
 
 
 async def _handle_send_event_log(
@@ -295,13 +421,33 @@ async def _handle_send_event_log(
     logs: EventLogQueue,
 ):
     logger.info("feedback websocket connected")
+    await _stop_spooler(logs)
+    # Events sent on a previous connection may not have been received
+    logs.sent_events.clear()
+
+    try:
+        await _send_event_log(websocket, logs)
+    except Exception:
+        _start_spooler(logs)
+        raise
+
 
+async def _send_event_log(
+    websocket: ClientConnection,
+    logs: EventLogQueue,
+) -> None:
     if logs.event:
         logger.info("Resending last event...")
-        json_str = json.dumps(logs.event)
-        await websocket.send(json_str)
+        await _send_log(websocket, logs, logs.event)
         logs.event = None
 
+    # Records spooled while disconnected are older than the queued ones
+    if logs.spool:
+        await _replay_spool(websocket, logs)
+    if logs.overflow:
+        await _send_log(websocket, logs, logs.overflow)
+        logs.overflow = None
+
     while True:
         event = await logs.queue.get()
         logger.debug(f"Event received, {event}")
@@ -311,8 +457,7 @@ async def _handle_send_event_log(
             break
 
         logs.event = event
-        json_str = json.dumps(event)
-        await websocket.send(json_str)
+        await _send_log(websocket, logs, event)
         logs.event = None
 
 
@@ -21,6 +21,8 @@ from ansible_rulebook.event_source.pg_listener import (
     PG_KEEPALIVE_DEFAULTS,
     MissingRequiredArgumentError,
     _build_connect_params,
+    _outbox_queries,
+    _OutboxFeedback,
     _validate_args,
     main as pg_listener_main,
 )
@@ -358,6 +360,210 @@ def test_backoff_resets_between_failovers(capfd) -> None:
             assert "2 seconds" in msg.getMessage()
 
 
+class _StopOutbox(Exception):
+    pass
+
+
+class _OutboxConnection:
+    """Fake connection serving rows from an in memory outbox table."""
+
+    def __init__(self, rows: list[tuple[int, Any]], wakeups: int) -> None:
+        self.rows = rows
+        self.wakeups = wakeups
+        self.closed = False
+        self.executed: list[tuple[Any, Any]] = []
+        self.deleted: list[int] = []
+        self.transactions = 0
+
+    def cursor(self) -> AsyncMock:
+        cursor = AsyncMock()
+        fetched: list[tuple[int, Any]] = []
+
+        async def execute(query: Any, params: Any = None) -> None:
+            self.executed.append((query, params))
+            text = repr(query)
+            if "SELECT id" in text:
+                fetched[:] = self.rows[: params[0]]
+            elif "DELETE" in text:
+                self.deleted.extend(params[0])
+                self.rows = [r for r in self.rows if r[0] not in params[0]]
+
+        async def fetchall() -> list[tuple[int, Any]]:
+            return list(fetched)
+
+        cursor.execute = execute
+        cursor.fetchall = fetchall
+        return cursor
+
+    def transaction(self) -> "_OutboxConnection":
+        self.transactions += 1
+        return self
+
+    async def __aenter__(self) -> "_OutboxConnection":
+        return self
+
+    async def __aexit__(self, *_args: Any) -> None:
+        return None
+
+    async def notifies(self, **kwargs: Any):
+        assert kwargs == {"timeout": 30.0, "stop_after": 1}
+        if self.wakeups == 0:
+            raise _StopOutbox()
+        self.wakeups -= 1
+        self.rows.append((100 + self.wakeups, {"woken": True}))
+        yield MagicMock(payload="ignored")
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_outbox_drains_table_in_batches() -> None:
+    """Rows are fetched in batches, delivered in order and deleted."""
+    rows = [(i, {"i": i}) for i in range(5)] + [(5, json.dumps({"i": 5}))]
+    fake = _OutboxConnection(rows, wakeups=1)
+    myqueue = _MockQueue()
+
+    with patch(
+        "ansible_rulebook.event_source.pg_listener.AsyncConnection.connect",
+        AsyncMock(return_value=fake),
+    ):
+        with pytest.raises(_StopOutbox):
+            asyncio.run(
+                pg_listener_main(
+                    myqueue,
+                    {
+                        "dsn": "host=localhost dbname=mydb",
+                        "channels": ["test"],
+                        "outbox_table": "public.eda_outbox",
+                        "batch_size": 4,
+                    },
+                )
+            )
+
+    assert myqueue.queue == [{"i": i} for i in range(6)] + [{"woken": True}]
+    assert fake.deleted == [0, 1, 2, 3, 4, 5, 100]
+    assert fake.rows == []
+    # 4 rows + 2 rows, then the wakeup delivers 1 row
+    assert fake.transactions == 3
+    assert fake.closed
+
+
+def test_outbox_waits_for_feedback_before_ack() -> None:
+    """With feedback enabled a row is acked only after the engine's reply."""
+    fake = _OutboxConnection([(1, {"a": 1}), (2, {"a": 2})], wakeups=0)
+    feedback: list[Any] = []
+
+    class _FeedbackQueue:
+        async def get(self) -> dict[str, Any]:
+            # Nothing may be deleted while events are still in flight
+            assert fake.deleted == []
+            feedback.append(myqueue.queue[-1])
+            return myqueue.queue[-1]
+
+    myqueue = _MockQueue()
+    with patch(
+        "ansible_rulebook.event_source.pg_listener.AsyncConnection.connect",
+        AsyncMock(return_value=fake),
+    ):
+        with pytest.raises(_StopOutbox):
+            asyncio.run(
+                pg_listener_main(
+                    myqueue,
+                    {
+                        "dsn": "host=localhost dbname=mydb",
+                        "channels": ["test"],
+                        "outbox_table": "eda_outbox",
+                        "eda_feedback_queue": _FeedbackQueue(),
+                    },
+                )
+            )
+
+    assert feedback == [{"a": 1}, {"a": 2}]
+    assert fake.deleted == [1, 2]
+
+
+def test_outbox_releases_batch_when_feedback_times_out() -> None:
+    """Rows are not held locked while the engine doesn't reply."""
+    fake = _OutboxConnection([(1, {"a": 1}), (2, {"a": 2})], wakeups=0)
+
+    class _SilentQueue:
+        async def get(self) -> None:
+            await asyncio.Event().wait()
+
+    myqueue = _MockQueue()
+    with patch(
+        "ansible_rulebook.event_source.pg_listener.AsyncConnection.connect",
+        AsyncMock(return_value=fake),
+    ):
+        with pytest.raises(_StopOutbox):
+            asyncio.run(
+                pg_listener_main(
+                    myqueue,
+                    {
+                        "dsn": "host=localhost dbname=mydb",
+                        "channels": ["test"],
+                        "outbox_table": "eda_outbox",
+                        "eda_feedback_queue": _SilentQueue(),
+                        "feedback_timeout": 0.01,
+                    },
+                )
+            )
+
+    assert myqueue.queue == [{"a": 1}]
+    assert fake.deleted == []
+    assert fake.transactions == 1
+
+
+@pytest.mark.asyncio
+async def test_outbox_feedback_skips_late_replies() -> None:
+    """A reply arriving after the timeout doesn't ack the next event."""
+    replies: asyncio.Queue[Any] = asyncio.Queue()
+    feedback = _OutboxFeedback(replies, 0.01)
+
+    assert not await feedback.wait()
+    replies.put_nowait({"a": 1})
+    assert not await feedback.wait()
+    assert feedback.late == 1
+
+    replies.put_nowait({"a": 2})
+    replies.put_nowait({"a": 3})
+    assert await feedback.wait()
+    assert feedback.late == 0
+    assert replies.empty()
+
+
+def test_outbox_skips_undecodable_rows() -> None:
+    """A row that is not valid json is dropped instead of blocking."""
+    fake = _OutboxConnection([(1, '{"a"; "b"}'), (2, '{"a": 2}')], 0)
+    myqueue = _MockQueue()
+    with patch(
+        "ansible_rulebook.event_source.pg_listener.AsyncConnection.connect",
+        AsyncMock(return_value=fake),
+    ):
+        with pytest.raises(_StopOutbox):
+            asyncio.run(
+                pg_listener_main(
+                    myqueue,
+                    {
+                        "dsn": "host=localhost dbname=mydb",
+                        "channels": ["test"],
+                        "outbox_table": "eda_outbox",
+                    },
+                )
+            )
+
+    assert myqueue.queue == [{"a": 2}]
+    assert fake.deleted == [1, 2]
+
+
+def test_outbox_queries_quote_schema_qualified_table() -> None:
+    """The table name is quoted per identifier part."""
+    select_query, delete_query = _outbox_queries("myschema.outbox")
+    assert "Identifier('myschema', 'outbox')" in repr(select_query)
+    assert "FOR UPDATE SKIP LOCKED" in repr(select_query)
+    assert "Identifier('myschema', 'outbox')" in repr(delete_query)
+
+
 def test_validate_args_with_missing_keys() -> None:
     """Test missing required arguments."""
     args: dict[str, str] = {}
@@ -475,6 +681,34 @@ def test_validate_args_with_valid_args() -> None:
             ValueError,
             "Postgres params must be a dictionary",
         ),
+        # Invalid outbox table
+        (
+            {"channels": ["channel1"], "dsn": "dummy", "outbox_table": ""},
+            ValueError,
+            "Outbox table must be a non empty string",
+        ),
+        # Invalid batch size
+        (
+            {
+                "channels": ["channel1"],
+                "dsn": "dummy",
+                "outbox_table": "outbox",
+                "batch_size": 0,
+            },
+            ValueError,
+            "Batch size must be a positive integer",
+        ),
+        # Invalid feedback timeout
+        (
+            {
+                "channels": ["channel1"],
+                "dsn": "dummy",
+                "outbox_table": "outbox",
+                "feedback_timeout": 0,
+            },
+            ValueError,
+            "Feedback timeout must be a positive number",
+        ),
     ],
 )
 def test_validate_args_type_checks(
@@ -1174,3 +1174,66 @@ async def test_retry_on_workflow_launch(new_job_template_runner):
             JOB_TEMPLATE_NAME_1, ORGANIZATION_NAME, {"a": 1}, []
         )
         assert data["status"] == "successful"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_launches_share_template_lookup(
+    new_job_template_runner,
+):
+    """A burst of launches looks the template up only once."""
+    import asyncio
+
+    with aioresponses() as mocked:
+        add_job_templates_pages(
+            mocked,
+            new_job_template_runner.host,
+            UNIFIED_JOB_TEMPLATE_PAGE1_RESPONSE_NO_LABELS,
+            UNIFIED_JOB_TEMPLATE_PAGE2_RESPONSE_NO_LABELS,
+        )
+        mocked.post(
+            f"{new_job_template_runner.host}{JOB_TEMPLATE_1_LAUNCH_SLUG}",
+            status=200,
+            body=json.dumps(JOB_TEMPLATE_POST_RESPONSE),
+            repeat=True,
+        )
+        urls = await asyncio.gather(
+            *[
+                new_job_template_runner.launch_job_template(
+                    JOB_TEMPLATE_NAME_1, ORGANIZATION_NAME, {"a": 1}
+                )
+                for _ in range(20)
+            ]
+        )
+
+    assert len(urls) == 20
+    stats = new_job_template_runner._metadata_cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 19
+
+
+@pytest.mark.asyncio
+async def test_launch_not_found_invalidates_template(new_job_template_runner):
+    """A 404 on launch drops the cached template for the next lookup."""
+    from ansible_rulebook.job_template_runner import JobTemplateRunner
+
+    key = JobTemplateRunner._template_cache_key(
+        JOB_TEMPLATE_NAME_1, ORGANIZATION_NAME, "job_template"
+    )
+    with aioresponses() as mocked:
+        add_job_templates_pages(
+            mocked,
+            new_job_template_runner.host,
+            UNIFIED_JOB_TEMPLATE_PAGE1_RESPONSE_NO_LABELS,
+            UNIFIED_JOB_TEMPLATE_PAGE2_RESPONSE_NO_LABELS,
+        )
+        mocked.post(
+            f"{new_job_template_runner.host}{JOB_TEMPLATE_1_LAUNCH_SLUG}",
+            status=404,
+            body=json.dumps({"detail": "Not found."}),
+        )
+        with pytest.raises(ControllerApiException):
+            await new_job_template_runner.launch_job_template(
+                JOB_TEMPLATE_NAME_1, ORGANIZATION_NAME, {"a": 1}
+            )
+
+    assert key not in new_job_template_runner._metadata_cache._entries
@@ -2859,3 +2859,81 @@ async def test_98_jinja_files():
             ],
         }
         await validate_events(event_log, **checks)
+
+
+@pytest.mark.asyncio
+async def test_99_parallel_fact_chain():
+    ruleset_queues, event_log = load_rulebook(
+        "examples/99_parallel_fact_chain.yml"
+    )
+
+    queue = ruleset_queues[0][1]
+    queue.put_nowait(dict(i=1))
+    queue.put_nowait(Shutdown())
+
+    await run_rulesets(
+        event_log,
+        ruleset_queues,
+        dict(),
+        dict(),
+    )
+
+    actions = []
+    while not event_log.empty():
+        event = event_log.get_nowait()
+        if event["type"] == "Action":
+            assert event["status"] == "successful"
+            actions.append((event["rule"], event["action"]))
+        if event["type"] == "Shutdown":
+            break
+    assert actions == [
+        ("r1", "set_fact"),
+        ("r1", "debug"),
+        ("r2", "post_event"),
+        ("r3", "print_event"),
+    ]
+    assert event_log.empty()
+
+
+@pytest.mark.asyncio
+async def test_100_partitioned():
+    ruleset_queues, event_log = load_rulebook("examples/100_partitioned.yml")
+
+    queue = ruleset_queues[0][1]
+    for host, i in [("a", 1), ("b", 1), ("a", 2), ("b", 2), ("a", 3)]:
+        queue.put_nowait(dict(host=host, i=i))
+    queue.put_nowait(Shutdown())
+
+    await run_rulesets(
+        event_log,
+        ruleset_queues,
+        dict(),
+        dict(),
+    )
+
+    actions = {"a": [], "b": []}
+    while not event_log.empty():
+        event = event_log.get_nowait()
+        if event["type"] == "Action":
+            assert event["status"] == "successful"
+            match = event["matching_events"]["m"]
+            actions[match["host"]].append((match["i"], event["action"]))
+        if event["type"] == "Shutdown":
+            break
+    assert actions == {
+        "a": [
+            (1, "debug"),
+            (1, "print_event"),
+            (2, "debug"),
+            (2, "print_event"),
+            (3, "debug"),
+            (3, "print_event"),
+        ],
+        "b": [
+            (1, "debug"),
+            (1, "print_event"),
+            (2, "debug"),
+            (2, "print_event"),
+        ],
+    }
+    assert event_log.empty()
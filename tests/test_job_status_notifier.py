@@ -0,0 +1,232 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for JobStatusNotifier against a local fake controller."""
+
+import asyncio
+import json
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+import websockets
+from aioresponses import aioresponses
+
+from .data.awx_test_data import JOB_1_RUNNING, JOB_1_SUCCESSFUL
+
+
+class FakeController:
+    """Serves the controller's /websocket/ job status channel."""
+
+    def __init__(self, accept: bool = True):
+        self.accept = accept
+        self.subscriptions = []
+        self.headers = []
+        self.clients = []
+        self.server = None
+
+    async def handler(self, websocket):
+        self.headers.append(websocket.request.headers)
+        self.clients.append(websocket)
+        await websocket.send(json.dumps({"accept": self.accept, "user": 1}))
+        try:
+            async for message in websocket:
+                self.subscriptions.append(json.loads(message))
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def job_status(self, job_id: int, status: str):
+        for client in self.clients:
+            await client.send(
+                json.dumps(
+                    {
+                        "group_name": "jobs",
+                        "type": "job",
+                        "unified_job_id": job_id,
+                        "status": status,
+                    }
+                )
+            )
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+
+@pytest_asyncio.fixture
+async def fake_controller():
+    controller = FakeController()
+    controller.server = await websockets.serve(
+        controller.handler, "127.0.0.1", 0
+    )
+    yield controller
+    controller.server.close()
+    await controller.server.wait_closed()
+
+
+@pytest_asyncio.fixture
+async def stream_runner(fake_controller, monkeypatch):
+    from ansible_rulebook.conf import settings
+    from ansible_rulebook.job_template_runner import JobTemplateRunner
+
+    monkeypatch.setattr(settings, "controller_job_status_stream", True)
+    obj = JobTemplateRunner(
+        host=f"http://127.0.0.1:{fake_controller.port}",
+        token="DUMMY",
+    )
+    obj.refresh_delay = 30.0
+    yield obj
+    await obj._job_monitor._notifier.stop()
+    await obj.close_session()
+
+
+async def _wait_for(predicate, timeout=5.0):
+    async def _poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_poll(), timeout=timeout)
+
+
+def batch_url(host):
+    return re.compile(re.escape(f"{host}api/v2/jobs/") + r"\?.*\bid__in=")
+
+
+@pytest.mark.asyncio
+async def test_pushed_completion_resolves_job(stream_runner, fake_controller):
+    """A status_changed message triggers an immediate poll."""
+    monitor = stream_runner._job_monitor
+    job_url = f"{stream_runner.host}api/v2/jobs/909/"
+
+    with (
+        patch("ansible_rulebook.shared_job_monitor.FIRST_POLL_DELAY", 0.01),
+        aioresponses() as mocked,
+    ):
+        mocked.get(
+            batch_url(stream_runner.host),
+            status=200,
+            body=json.dumps({"count": 1, "results": [JOB_1_RUNNING]}),
+        )
+        mocked.get(
+            batch_url(stream_runner.host),
+            status=200,
+            body=json.dumps({"count": 1, "results": [JOB_1_SUCCESSFUL]}),
+        )
+
+        # Connect first so the job isn't finished by a fast early poll
+        monitor._notifier.start()
+        await _wait_for(lambda: fake_controller.subscriptions)
+        task = asyncio.create_task(stream_runner.monitor_job(job_url))
+        await _wait_for(lambda: monitor.get_stats()["api_calls"] == 1)
+
+        started = time.monotonic()
+        await fake_controller.job_status(909, "successful")
+        result = await asyncio.wait_for(task, timeout=5)
+
+    # Without the push the next poll would be refresh_delay away
+    assert time.monotonic() - started < stream_runner.refresh_delay
+    assert result["status"] == "successful"
+    assert fake_controller.subscriptions == [
+        {"groups": {"jobs": ["status_changed"]}}
+    ]
+    assert fake_controller.headers[0]["Authorization"] == "Bearer DUMMY"
+    stats = monitor.get_stats()
+    assert stats["status_stream_notifications"] == 1
+    assert stats["api_calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_running_status_is_ignored(stream_runner, fake_controller):
+    """Only completion statuses make the monitor poll a job."""
+    monitor = stream_runner._job_monitor
+    monitor._jobs["jobs/909"] = {
+        "url": "api/v2/jobs/909/",
+        "numeric_id": "909",
+        "future": asyncio.Future(),
+        "polls": 1,
+        "next_poll": time.monotonic() + 30,
+    }
+    monitor._notifier.start()
+    await _wait_for(lambda: monitor._notifier.connected)
+
+    await fake_controller.job_status(909, "running")
+    await fake_controller.job_status(910, "successful")
+    await asyncio.sleep(0.1)
+
+    assert monitor._jobs["jobs/909"]["next_poll"] > time.monotonic() + 20
+    assert monitor._notifier.notifications == 1
+    monitor._jobs["jobs/909"]["future"].cancel()
+
+
+@pytest.mark.asyncio
+async def test_stream_loss_falls_back_to_polling(
+    stream_runner, fake_controller
+):
+    """When the stream drops running jobs go back to fast polling."""
+    monitor = stream_runner._job_monitor
+    monitor._jobs["jobs/909"] = {
+        "url": "api/v2/jobs/909/",
+        "numeric_id": "909",
+        "future": asyncio.Future(),
+        "polls": 3,
+        "next_poll": time.monotonic() + 30,
+    }
+    monitor._notifier.start()
+    await _wait_for(lambda: monitor._notifier.connected)
+
+    for client in fake_controller.clients:
+        await client.close()
+    await _wait_for(lambda: not monitor._notifier.connected)
+
+    job_info = monitor._jobs["jobs/909"]
+    assert job_info["polls"] == 0
+    assert job_info["next_poll"] <= time.monotonic() + 1.0
+    assert not monitor.get_stats()["status_stream_connected"]
+    job_info["future"].cancel()
+
+
+@pytest.mark.asyncio
+async def test_rejected_connection_is_not_used(stream_runner, fake_controller):
+    """A connection the controller doesn't accept never counts as up."""
+    fake_controller.accept = False
+    notifier = stream_runner._job_monitor._notifier
+    notifier.start()
+    await _wait_for(lambda: fake_controller.headers)
+    await asyncio.sleep(0.1)
+
+    assert not notifier.connected
+    assert fake_controller.subscriptions == []
+
+
+def test_notifier_url_and_auth():
+    from ansible_rulebook.job_template_runner import JobTemplateRunner
+
+    runner = JobTemplateRunner(
+        host="https://gateway.example.com/api/controller/",
+        username="admin",
+        password="secret",
+    )
+    notifier = runner._job_monitor._notifier
+    assert notifier._url() == (
+        "wss://gateway.example.com/api/controller/websocket/"
+    )
+    assert notifier._headers()["Authorization"].startswith("Basic ")
+
+    runner = JobTemplateRunner(host="http://controller.example.com")
+    assert runner._job_monitor._notifier._url() == (
+        "ws://controller.example.com/websocket/"
+    )
+    assert runner._job_monitor._notifier._sslcontext() is None
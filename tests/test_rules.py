@@ -28,6 +28,7 @@ from ansible_rulebook.collection import (
     apply_plugin_routing,
 )
 from ansible_rulebook.exception import (
+    PartitionKeyMissingException,
     RulenameDuplicateException,
     RulenameEmptyException,
     RulesetNameDuplicateException,
@@ -191,6 +192,21 @@ async def test_missing_ruleset_names():
     assert str(exc_info.value) == "Ruleset name not provided"
 
 
+@pytest.mark.asyncio
+async def test_missing_partition_key():
+    os.chdir(HERE)
+    with open("rules/test_missing_partition_key.yml") as f:
+        data = yaml.safe_load(f.read())
+
+    with pytest.raises(PartitionKeyMissingException) as exc_info:
+        parse_rule_sets(data)
+
+    assert str(exc_info.value) == (
+        "Ruleset ruleset1 with partitioned execution strategy needs a "
+        "partition_key"
+    )
+
+
 @pytest.mark.asyncio
 async def test_rule_name_substitution_duplicates():
     os.chdir(HERE)
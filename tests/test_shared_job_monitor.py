@@ -584,6 +584,7 @@ async def test_shared_monitor_chunked_batch_polling(new_job_template_runner):
         "ansible_rulebook.shared_job_monitor.settings"
     ) as mock_settings:
         mock_settings.max_batch_job_polling_size = 2
+        mock_settings.max_concurrent_job_polls = 1
 
         with aioresponses() as mocked:
             # Chunk 1: jobs 123, 124
@@ -717,3 +718,129 @@ async def test_batch_poll_page_size_matches_chunk_size(
             for job_info in jobs_dict.values():
                 if not job_info["future"].done():
                     job_info["future"].cancel()
+
+
+@pytest.mark.asyncio
+async def test_batch_poll_chunks_run_concurrently(new_job_template_runner):
+    """Chunks are polled in parallel, bounded by max_concurrent_job_polls."""
+    from unittest.mock import patch
+
+    monitor = new_job_template_runner._job_monitor
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_get_page(href_slug, params):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"count": 0, "results": []}
+
+    new_job_template_runner._get_page_no_retry = mock_get_page
+    jobs = {
+        f"jobs/{i}": {
+            "url": f"https://example.com/api/v2/jobs/{i}/",  # noqa
+            "numeric_id": str(i),
+            "future": asyncio.Future(),
+        }
+        for i in range(10)
+    }
+
+    with patch(
+        "ansible_rulebook.shared_job_monitor.settings"
+    ) as mock_settings:
+        mock_settings.max_batch_job_polling_size = 1
+        mock_settings.max_concurrent_job_polls = 3
+        await monitor._batch_poll_jobs(jobs, "api/v2/jobs/", "jobs")
+
+    assert max_in_flight == 3
+    assert monitor.get_stats()["api_calls"] == 10
+
+
+@pytest.mark.asyncio
+async def test_batch_poll_chunk_error_is_raised(new_job_template_runner):
+    """A failing chunk is reported after the other chunks finish."""
+    from unittest.mock import patch
+
+    from ansible_rulebook.exception import ControllerApiException
+
+    monitor = new_job_template_runner._job_monitor
+    polled = []
+
+    async def mock_get_page(href_slug, params):
+        polled.append(params["id__in"])
+        if params["id__in"] == "0":
+            raise ControllerApiException("boom")
+        await asyncio.sleep(0.01)
+        return {"count": 0, "results": []}
+
+    new_job_template_runner._get_page_no_retry = mock_get_page
+    jobs = {
+        f"jobs/{i}": {
+            "url": f"https://example.com/api/v2/jobs/{i}/",  # noqa
+            "numeric_id": str(i),
+            "future": asyncio.Future(),
+        }
+        for i in range(3)
+    }
+
+    with patch(
+        "ansible_rulebook.shared_job_monitor.settings"
+    ) as mock_settings:
+        mock_settings.max_batch_job_polling_size = 1
+        mock_settings.max_concurrent_job_polls = 5
+        with pytest.raises(ControllerApiException):
+            await monitor._batch_poll_jobs(jobs, "api/v2/jobs/", "jobs")
+
+    assert sorted(polled) == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_poll_schedule_backs_off(new_job_template_runner):
+    """Each poll of a running job waits longer, up to refresh_delay."""
+    from unittest.mock import patch
+
+    from ansible_rulebook import shared_job_monitor
+
+    new_job_template_runner.refresh_delay = 10.0
+    monitor = new_job_template_runner._job_monitor
+    job_info = {"polls": 0, "next_poll": 0.0}
+
+    delays = []
+    with (
+        patch.object(shared_job_monitor.time, "monotonic", return_value=0.0),
+        patch.object(shared_job_monitor.random, "uniform", return_value=0.0),
+    ):
+        for _ in range(5):
+            monitor._schedule_next_polls([("jobs/1", job_info)])
+            delays.append(job_info["next_poll"])
+
+    assert delays == [2.0, 4.0, 8.0, 10.0, 10.0]
+
+
+@pytest.mark.asyncio
+async def test_new_job_is_first_polled_quickly(new_job_template_runner):
+    """A new job is polled after FIRST_POLL_DELAY, not refresh_delay."""
+    from unittest.mock import patch
+
+    new_job_template_runner.refresh_delay = 30.0
+
+    with (
+        patch("ansible_rulebook.shared_job_monitor.FIRST_POLL_DELAY", 0.05),
+        aioresponses() as mocked,
+    ):
+        mocked.get(
+            batch_url(new_job_template_runner.host),
+            status=200,
+            body=json.dumps({"count": 1, "results": [JOB_1_SUCCESSFUL]}),
+        )
+        result = await asyncio.wait_for(
+            new_job_template_runner.monitor_job(JOB_1_SLUG), timeout=2
+        )
+
+    assert result["status"] == "successful"
+    stats = new_job_template_runner._job_monitor.get_stats()
+    assert stats["api_calls"] == 1
+    assert stats["poll_loops"] == 1
+    assert stats["max_loop_latency"] >= stats["avg_loop_latency"] > 0
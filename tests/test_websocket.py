@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 import websockets
 
+from ansible_rulebook.audit_spool import AuditSpool
 from ansible_rulebook.conf import settings
 from ansible_rulebook.websocket import (
     request_workload,
@@ -228,6 +229,61 @@ async def test_send_event_log_to_websocket():
         assert data_sent == ['{"a": 1}', '{"b": 1}']
 
 
+@pytest.mark.asyncio
+async def test_send_event_log_with_event_references(monkeypatch):
+    prepare_settings()
+    monkeypatch.setattr(settings, "audit_event_references", True)
+    monkeypatch.setattr(settings, "audit_event_cache_size", 1)
+    first = {"i": 1, "meta": {"uuid": "u1"}}
+    second = {"i": 2, "meta": {"uuid": "u2"}}
+    queue = asyncio.Queue()
+    queue.put_nowait({"type": "Job", "matching_events": {"m": first}})
+    queue.put_nowait({"type": "Action", "matching_events": {"m": first}})
+    queue.put_nowait(
+        {"type": "Action", "matching_events": {"m_0": second, "m_1": {}}}
+    )
+    queue.put_nowait({"type": "Action", "matching_events": {"m": first}})
+    queue.put_nowait(dict(type="Exit"))
+
+    data_sent = []
+
+    with patch("ansible_rulebook.websocket.websockets.connect") as mo:
+        mock_object = AsyncMock()
+        mo.return_value = mock_object
+        mo.return_value.__aenter__.return_value = mock_object
+        mo.return_value.send.side_effect = lambda data: data_sent.append(
+            json.loads(data)
+        )
+        await send_event_log_to_websocket(queue)
+
+    assert data_sent == [
+        {"type": "Event", "uuid": "u1", "event": first},
+        {
+            "type": "Job",
+            "matching_events": {},
+            "matching_event_uuids": {"m": "u1"},
+        },
+        {
+            "type": "Action",
+            "matching_events": {},
+            "matching_event_uuids": {"m": "u1"},
+        },
+        {"type": "Event", "uuid": "u2", "event": second},
+        {
+            "type": "Action",
+            "matching_events": {"m_1": {}},
+            "matching_event_uuids": {"m_0": "u2"},
+        },
+        # Only one event is remembered as sent
+        {"type": "Event", "uuid": "u1", "event": first},
+        {
+            "type": "Action",
+            "matching_events": {},
+            "matching_event_uuids": {"m": "u1"},
+        },
+    ]
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "exception_class",
@@ -303,3 +359,47 @@ async def test_send_event_log_to_websocket_1011_retries_and_recovers(
     assert len(data_sent) == 2
     assert data_sent[0] == {"a": 1}
     assert data_sent[1] == {"b": 2}
+
+
+@pytest.mark.asyncio
+@mock.patch("ansible_rulebook.websocket.websockets.connect")
+async def test_send_event_log_replays_spool_on_reconnect(
+    socket_mock: AsyncMock, monkeypatch, tmp_path
+):
+    prepare_settings()
+    monkeypatch.setattr(settings, "audit_spool_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "identifier", "activation-1")
+    previous_run = AuditSpool(str(tmp_path / "activation-1"), 1024 * 1024)
+    previous_run.append({"a": 0})
+    previous_run.close()
+
+    queue = asyncio.Queue()
+    queue.put_nowait({"a": 1})
+    queue.put_nowait({"a": 2})
+    queue.put_nowait({"a": 3})
+    queue.put_nowait(dict(type="Exit"))
+
+    data_sent = []
+
+    mock_object = AsyncMock()
+    socket_mock.return_value = mock_object
+    socket_mock.return_value.__aenter__.return_value = mock_object
+
+    rcvd = mock.Mock()
+    rcvd.code = 1011
+    call_count = 0
+
+    async def send_side_effect(payload):
+        nonlocal call_count
+        call_count += 1
+        if call_count == 2:
+            raise websockets.exceptions.ConnectionClosedError(
+                rcvd=rcvd, sent=None
+            )
+        data_sent.append(json.loads(payload))
+
+    socket_mock.return_value.send.side_effect = send_side_effect
+
+    await send_event_log_to_websocket(queue)
+    assert data_sent == [{"a": 0}, {"a": 1}, {"a": 2}, {"a": 3}]
+    assert os.listdir(tmp_path / "activation-1") == []
@@ -0,0 +1,101 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+
+import pytest
+
+from ansible_rulebook.action.coalescer import (
+    LaunchCoalescer,
+    coalesce_key,
+    strip_eda_vars,
+)
+
+
+def _recorder():
+    limits = []
+
+    async def launch(limit):
+        limits.append(limit)
+        return f"job-{len(limits)}"
+
+    return limits, launch
+
+
+@pytest.mark.asyncio
+async def test_join_merges_hosts_within_window():
+    coalescer = LaunchCoalescer()
+    limits, launch = _recorder()
+
+    results = await asyncio.gather(
+        coalescer.join("k", ["h1"], launch, 0.05),
+        coalescer.join("k", ["h2", "h1"], launch, 0.05),
+        coalescer.join("k", ["h3"], launch, 0.05),
+    )
+
+    assert results == ["job-1", "job-1", "job-1"]
+    assert limits == ["h1,h2,h3"]
+
+
+@pytest.mark.asyncio
+async def test_join_without_hosts_runs_on_all_hosts():
+    coalescer = LaunchCoalescer()
+    limits, launch = _recorder()
+
+    await asyncio.gather(
+        coalescer.join("k", ["h1"], launch, 0.01),
+        coalescer.join("k", [], launch, 0.01),
+    )
+
+    assert limits == [""]
+
+
+@pytest.mark.asyncio
+async def test_join_keeps_keys_and_windows_apart():
+    coalescer = LaunchCoalescer()
+    limits, launch = _recorder()
+
+    await asyncio.gather(
+        coalescer.join("a", ["h1"], launch, 0.01),
+        coalescer.join("b", ["h2"], launch, 0.01),
+    )
+    await coalescer.join("a", ["h3"], launch, 0.01)
+
+    assert sorted(limits) == ["h1", "h2", "h3"]
+
+
+@pytest.mark.asyncio
+async def test_join_shares_errors_and_survives_cancel():
+    coalescer = LaunchCoalescer()
+
+    async def launch(limit):
+        raise RuntimeError(limit)
+
+    first = asyncio.create_task(coalescer.join("k", ["h1"], launch, 0.05))
+    second = asyncio.create_task(coalescer.join("k", ["h2"], launch, 0.05))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    with pytest.raises(RuntimeError, match="h1,h2"):
+        await second
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_coalesce_key():
+    assert coalesce_key("jt", {"a": 1, "b": 2}) == coalesce_key(
+        "jt", {"b": 2, "a": 1}
+    )
+    assert coalesce_key("jt", {"a": 1}) != coalesce_key("jt", {"a": 2})
+    assert strip_eda_vars({"ansible_eda": {"event": 1}, "x": 1}) == {"x": 1}
+    assert strip_eda_vars(None) == {}
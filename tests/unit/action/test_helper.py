@@ -347,7 +347,7 @@ async def test_update_action_state_with_persistent_info(metadata, control):
         helper.update_action_state(info)
 
         mock_update.assert_called_once_with(
-            "rs1", "matching-uuid-123", 0, info
+            "rs1", "matching-uuid-123", 0, info, flush=True
         )
 
 
@@ -397,3 +397,127 @@ async def test_run_job_template_negative_retries():
             await RunJobTemplate(metadata, control, **action_args)()
 
             _validate(queue, True)
+
+
+@pytest.mark.asyncio
+async def test_run_job_template_coalesce_window():
+    """Matches within the window share one launch limited to all hosts."""
+    queue = asyncio.Queue()
+    metadata = Metadata(
+        rule="r1",
+        rule_set="rs1",
+        rule_uuid="u1",
+        rule_set_uuid="u2",
+        rule_run_at="abc",
+    )
+    controller_job = {
+        "status": "successful",
+        "rc": 0,
+        "artifacts": {},
+        "created": "abc",
+        "id": 10,
+    }
+    actions = []
+    for host in ["h1", "h2", "h3"]:
+        control = Control(
+            queue=queue,
+            inventory="abc",
+            hosts=[host],
+            variables={"event": {"host": host}},
+            project_data_file="",
+        )
+        actions.append(
+            RunJobTemplate(
+                metadata,
+                control,
+                name="fred",
+                organization="Default",
+                coalesce_window=0.05,
+            )
+        )
+    with patch(
+        "ansible_rulebook.action.run_job_template."
+        "job_template_runner.launch_job_template",
+        return_value="https://www.example.com",
+    ) as launch_mock:
+        with patch(
+            "ansible_rulebook.action.run_job_template."
+            "job_template_runner.monitor_job",
+            return_value=controller_job,
+        ):
+            await asyncio.gather(*[action() for action in actions])
+
+    launch_mock.assert_called_once()
+    assert launch_mock.call_args.args[2]["limit"] == "h1,h2,h3"
+
+    records = []
+    while not queue.empty():
+        event = queue.get_nowait()
+        if event["type"] == "Action":
+            records.append(event)
+    assert len(records) == 3
+    assert {record["controller_job_id"] for record in records} == {10}
+    assert len({record["job_id"] for record in records}) == 3
+
+
+@pytest.mark.asyncio
+async def test_run_job_template_coalesced_facts_set_once():
+    """Only the match that launched the shared job sets its facts."""
+    queue = asyncio.Queue()
+    metadata = Metadata(
+        rule="r1",
+        rule_set="rs1",
+        rule_uuid="u1",
+        rule_set_uuid="u2",
+        rule_run_at="abc",
+    )
+    controller_job = {
+        "status": "successful",
+        "rc": 0,
+        "artifacts": {"fact": 1},
+        "created": "abc",
+        "id": 10,
+    }
+    actions = [
+        RunJobTemplate(
+            metadata,
+            Control(
+                queue=queue,
+                inventory="abc",
+                hosts=[host],
+                variables={"event": {"host": host}},
+                project_data_file="",
+            ),
+            name="fred",
+            organization="Default",
+            coalesce_window=0.05,
+            set_facts=True,
+            ruleset=ruleset,
+        )
+        for host, ruleset in [("h1", "rs1"), ("h2", "rs1"), ("h3", "rs2")]
+    ]
+    with (
+        patch(
+            "ansible_rulebook.action.run_job_template."
+            "job_template_runner.launch_job_template",
+            return_value="https://www.example.com",
+        ) as launch_mock,
+        patch(
+            "ansible_rulebook.action.run_job_template."
+            "job_template_runner.monitor_job",
+            return_value=controller_job,
+        ),
+        patch(
+            "ansible_rulebook.action.run_job_template.lang.assert_fact"
+        ) as assert_fact,
+    ):
+        await asyncio.gather(*[action() for action in actions])
+
+    # Facts for another ruleset aren't coalesced
+    assert sorted(
+        call.args[2]["limit"] for call in launch_mock.call_args_list
+    ) == ["h1,h2", "h3"]
+    assert sorted(call.args[0] for call in assert_fact.call_args_list) == [
+        "rs1",
+        "rs2",
+    ]
@@ -19,6 +19,7 @@ import pytest
 from freezegun import freeze_time
 
 from ansible_rulebook import terminal
+from ansible_rulebook.action.coalescer import launch_coalescer
 from ansible_rulebook.action.control import Control
 from ansible_rulebook.action.metadata import Metadata
 from ansible_rulebook.action.run_playbook import RunPlaybook
@@ -206,3 +207,238 @@ async def test_run_playbook_fail():
         await RunPlaybook(metadata, control, **action_args)()
 
     _validate(queue, metadata, "failed", 2)
+
+
+@pytest.mark.asyncio
+async def test_run_playbook_coalesce_window():
+    """Coalesced matches run the playbook once and share its result."""
+    os.chdir(HERE)
+    queue = asyncio.Queue()
+    metadata = Metadata(
+        rule="r1",
+        rule_set="rs1",
+        rule_uuid=RULE_UUID,
+        rule_set_uuid=RULE_SET_UUID,
+        rule_run_at=RULE_RUN_AT,
+    )
+    limits = []
+
+    async def run_runner(self, host_limit):
+        limits.append(host_limit)
+        return {
+            "job_id": self.job_id,
+            "rc": 0,
+            "status": "successful",
+            "artifacts": {},
+        }
+
+    actions = [
+        RunPlaybook(
+            metadata,
+            Control(
+                queue=queue,
+                inventory=INVENTORY_FILE,
+                hosts=[host],
+                variables={"event": {"a": 1}},
+                project_data_file="",
+            ),
+            name="./playbooks/rule_name.yml",
+            coalesce_window=0.05,
+        )
+        for host in ["h1", "h2"]
+    ]
+    opened = asyncio.Event()
+    join = launch_coalescer.join
+
+    async def join_batch(*args, **kwargs):
+        opened.set()
+        return await join(*args, **kwargs)
+
+    with (
+        patch.object(RunPlaybook, "_run_runner", run_runner),
+        patch.object(launch_coalescer, "join", join_batch),
+    ):
+        # The second action starts once the first one opened the batch
+        first = asyncio.create_task(actions[0]())
+        await opened.wait()
+        await asyncio.gather(first, actions[1]())
+
+    assert limits == ["h1,h2"]
+    records = []
+    while not queue.empty():
+        event = queue.get_nowait()
+        if event["type"] == "Action":
+            records.append(event)
+    assert [record["status"] for record in records] == ["successful"] * 2
+    coalesced = [record for record in records if "coalesced_job_id" in record]
+    assert len(coalesced) == 1
+    assert coalesced[0]["coalesced_job_id"] == actions[0].job_id
+
+
+def _coalesced_actions(queue, **action_args):
+    metadata = Metadata(
+        rule="r1",
+        rule_set="rs1",
+        rule_uuid=RULE_UUID,
+        rule_set_uuid=RULE_SET_UUID,
+        rule_run_at=RULE_RUN_AT,
+    )
+    return [
+        RunPlaybook(
+            metadata,
+            Control(
+                queue=queue,
+                inventory=INVENTORY_FILE,
+                hosts=[host],
+                variables={"event": {"a": 1}},
+                project_data_file="",
+            ),
+            name="./playbooks/rule_name.yml",
+            coalesce_window=0.05,
+            **action_args,
+        )
+        for host in ["h1", "h2"]
+    ]
+
+
+async def _start_in_order(actions):
+    """Start the second action once the first one opened the batch."""
+    opened = asyncio.Event()
+    join = launch_coalescer.join
+
+    async def join_batch(*args, **kwargs):
+        opened.set()
+        return await join(*args, **kwargs)
+
+    with patch.object(launch_coalescer, "join", join_batch):
+        first = asyncio.create_task(actions[0]())
+        await opened.wait()
+    return first, asyncio.create_task(actions[1]())
+
+
+@pytest.mark.asyncio
+async def test_run_playbook_coalesced_facts_set_once():
+    """Only the match that launched the shared run sets its facts."""
+    os.chdir(HERE)
+
+    async def run_runner(self, host_limit):
+        return {
+            "job_id": self.job_id,
+            "rc": 0,
+            "status": "successful",
+            "artifacts": {"fact": 1},
+        }
+
+    actions = _coalesced_actions(asyncio.Queue(), set_facts=True)
+    with (
+        patch.object(RunPlaybook, "_run_runner", run_runner),
+        patch(
+            "ansible_rulebook.action.run_playbook.lang.assert_fact"
+        ) as assert_fact,
+    ):
+        await asyncio.gather(*await _start_in_order(actions))
+
+    assert_fact.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_playbook_coalesced_run_outlives_first_match():
+    """The private data dir of the shared run is kept until it ends."""
+    os.chdir(HERE)
+    started = asyncio.Event()
+    private_data_dirs = []
+
+    async def run_runner(self, host_limit):
+        private_data_dirs.append(self.private_data_dir)
+        started.set()
+        await asyncio.sleep(0.01)
+        assert os.path.exists(self.private_data_dir)
+        return {
+            "job_id": self.job_id,
+            "rc": 0,
+            "status": "successful",
+            "artifacts": {},
+        }
+
+    actions = _coalesced_actions(asyncio.Queue())
+    with patch.object(RunPlaybook, "_run_runner", run_runner):
+        first, second = await _start_in_order(actions)
+        await started.wait()
+        first.cancel()
+        await second
+
+    assert private_data_dirs == [actions[0].private_data_dir]
+    await asyncio.sleep(0)
+    assert not os.path.exists(private_data_dirs[0])
+
+
+@pytest.mark.asyncio
+async def test_run_playbook_summary_event_forwarding():
+    os.chdir(HERE)
+    queue = asyncio.Queue()
+    metadata = Metadata(
+        rule="r1",
+        rule_set="rs1",
+        rule_uuid=RULE_UUID,
+        rule_set_uuid=RULE_SET_UUID,
+        rule_run_at=RULE_RUN_AT,
+    )
+    control = Control(
+        queue=queue,
+        inventory=INVENTORY_FILE,
+        hosts=["all"],
+        variables={"event": {"a": 1}},
+        project_data_file="",
+    )
+    action_args = {
+        "name": "./playbooks/fail.yml",
+        "event_forwarding": "summary",
+    }
+
+    await RunPlaybook(metadata, control, **action_args)()
+
+    records = []
+    while not queue.empty():
+        records.append(queue.get_nowait())
+    ansible_events = [
+        record["event"]["event"]
+        for record in records
+        if record["type"] == "AnsibleEvent"
+    ]
+    assert ansible_events == ["playbook_on_start", "playbook_on_stats"]
+    action = [record for record in records if record["type"] == "Action"][0]
+    assert action["status"] == "failed"
+    assert action["dropped_events"]["total"] > 0
+    assert "runner_on_failed" in action["dropped_events"]["hosts"]["localhost"]
+
+
+@pytest.mark.asyncio
+async def test_run_playbook_memory_artifacts(tmp_path, monkeypatch, caplog):
+    os.chdir(HERE)
+    monkeypatch.setattr(settings, "runner_artifacts", "memory")
+    monkeypatch.setattr(settings, "runner_artifact_dir", str(tmp_path))
+    queue = asyncio.Queue()
+    metadata = Metadata(
+        rule="r1",
+        rule_set="rs1",
+        rule_uuid=RULE_UUID,
+        rule_set_uuid=RULE_SET_UUID,
+        rule_run_at=RULE_RUN_AT,
+    )
+    control = Control(
+        queue=queue,
+        inventory=INVENTORY_FILE,
+        hosts=["all"],
+        variables={"event": {"a": 1}},
+        project_data_file="",
+    )
+
+    action = RunPlaybook(metadata, control, name="./playbooks/fail.yml")
+    await action()
+
+    assert action.run_result["rc"] == 2
+    assert action.run_result["status"] == "failed"
+    assert "failed=1" in action.run_result["error"]
+    assert "failed=1" in caplog.text
+    # The per run artifact dir is gone
+    assert os.listdir(tmp_path) == []
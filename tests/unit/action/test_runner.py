@@ -0,0 +1,123 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from ansible_rulebook.action.runner import Runner
+from ansible_rulebook.conf import settings
+
+
+def _runner(event_forwarding=None):
+    return Runner("/tmp", "all", 0, "job", False, None, {}, event_forwarding)
+
+
+def _event(name, host=None):
+    event = {"event": name, "event_data": {}}
+    if host:
+        event["event_data"]["host"] = host
+    return event
+
+
+EVENTS = [
+    _event("playbook_on_start"),
+    _event("playbook_on_task_start"),
+    _event("runner_on_ok", "h1"),
+    _event("runner_on_failed", "h2"),
+    _event("runner_on_unreachable", "h3"),
+    _event("runner_on_ok", "h1"),
+    _event("playbook_on_stats"),
+]
+
+
+@pytest.mark.parametrize(
+    "policy,forwarded",
+    [
+        ("all", [e["event"] for e in EVENTS]),
+        ("summary", ["playbook_on_start", "playbook_on_stats"]),
+        (
+            "failures",
+            [
+                "playbook_on_start",
+                "runner_on_failed",
+                "runner_on_unreachable",
+                "playbook_on_stats",
+            ],
+        ),
+    ],
+)
+def test_forwarding_policy(policy, forwarded):
+    runner = _runner(policy)
+    result = [e["event"] for e in EVENTS if runner._should_forward(e)]
+
+    assert result == forwarded
+    dropped = runner.get_dropped_events()
+    assert dropped.get("total", 0) == len(EVENTS) - len(forwarded)
+    if policy == "failures":
+        assert dropped["hosts"] == {"h1": {"runner_on_ok": 2}}
+
+
+def test_sampled_forwarding(monkeypatch):
+    monkeypatch.setattr(settings, "runner_event_sample_rate", 3)
+    runner = _runner("sampled")
+    forwarded = [
+        runner._should_forward(_event("runner_on_ok", "h1")) for _ in range(9)
+    ]
+
+    assert forwarded.count(True) == 3
+    assert runner.get_dropped_events()["hosts"]["h1"]["runner_on_ok"] == 6
+
+
+def test_forwarding_defaults_to_setting(monkeypatch):
+    monkeypatch.setattr(settings, "runner_event_forwarding", "summary")
+    assert _runner().event_forwarding == "summary"
+    assert _runner("failures").event_forwarding == "failures"
+
+    monkeypatch.setattr(settings, "runner_event_forwarding", "bogus")
+    assert _runner().event_forwarding == "all"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_keeps_artifact_dir_until_it_returns(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "runner_artifact_dir", str(tmp_path))
+    started = threading.Event()
+    seen = []
+
+    def fake_run(cancel_callback, artifact_dir, **_kwargs):
+        started.set()
+        while not cancel_callback():
+            time.sleep(0.01)
+        # ansible-runner still writes its artifacts while stopping
+        time.sleep(0.1)
+        seen.append(os.path.isdir(artifact_dir))
+
+    runner = Runner(
+        str(tmp_path), "all", 0, "job", False, AsyncMock(), {}, None
+    )
+    with patch("ansible_rulebook.action.runner.ansible_runner.run", fake_run):
+        task = asyncio.create_task(runner())
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert seen == [True]
+    assert os.listdir(tmp_path) == []
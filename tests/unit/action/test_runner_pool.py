@@ -0,0 +1,107 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import threading
+
+import pytest
+
+from ansible_rulebook.action.runner_pool import RunnerPool
+from ansible_rulebook.conf import settings
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(settings, "runner_pool_size", 2)
+    pool = RunnerPool()
+    yield pool
+    if pool._executor:
+        pool._executor.shutdown(wait=True)
+
+
+async def _wait_for(predicate, timeout=5.0):
+    async def _poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(_poll(), timeout=timeout)
+
+
+@pytest.mark.asyncio
+async def test_run_is_bounded_by_pool_size(pool):
+    release = threading.Event()
+    threads = set()
+
+    def job():
+        threads.add(threading.current_thread().name)
+        release.wait(5)
+        return 1
+
+    tasks = [asyncio.create_task(pool.run(job)) for _ in range(3)]
+    await _wait_for(lambda: pool.get_stats()["active"] == 2)
+    await _wait_for(lambda: pool.get_stats()["waiting"] == 1)
+    assert pool.get_stats()["utilization"] == 1.0
+
+    release.set()
+    assert await asyncio.gather(*tasks) == [1, 1, 1]
+
+    stats = pool.get_stats()
+    assert stats["runs"] == 3
+    assert stats["max_active"] == 2
+    assert stats["active"] == 0
+    assert all(name.startswith("ansible-runner") for name in threads)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_keeps_slot_until_done(pool, monkeypatch):
+    monkeypatch.setattr(settings, "runner_pool_size", 1)
+    release = threading.Event()
+
+    task = asyncio.create_task(pool.run(lambda: release.wait(5)))
+    await _wait_for(lambda: pool.get_stats()["active"] == 1)
+    task.cancel()
+    second = asyncio.create_task(pool.run(lambda: "second"))
+    await asyncio.sleep(0.05)
+    # The cancelled caller waits for its run to return
+    assert not task.done()
+    assert not second.done()
+
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert await second == "second"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_run_is_told_to_stop(pool):
+    stop = threading.Event()
+
+    task = asyncio.create_task(pool.run(lambda: stop.wait(5), stop.set))
+    await _wait_for(lambda: pool.get_stats()["active"] == 1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, 1)
+    assert stop.is_set()
+    await _wait_for(lambda: pool.get_stats()["active"] == 0)
+
+
+@pytest.mark.asyncio
+async def test_queues_are_reused(pool):
+    queue = pool.get_queue()
+    pool.put_queue(queue)
+    assert pool.get_queue() is queue
+
+    queue.sync_q.put("left over")
+    pool.put_queue(queue)
+    assert queue.closed
+    assert pool.get_queue() is not queue
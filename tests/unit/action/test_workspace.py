@@ -0,0 +1,141 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+import shutil
+import tarfile
+
+import pytest
+
+from ansible_rulebook.action.workspace import WorkspaceCache
+from ansible_rulebook.conf import settings
+from ansible_rulebook.exception import (
+    InventoryNotFound,
+    ProjectExtractException,
+)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(settings, "project_cache_size", 8)
+    cache = WorkspaceCache()
+    yield cache
+    if cache._root:
+        shutil.rmtree(cache._root, ignore_errors=True)
+
+
+@pytest.fixture
+def project(tmp_path):
+    project = tmp_path / "project"
+    (project / "roles" / "web").mkdir(parents=True)
+    (project / "site.yml").write_text("- hosts: all\n")
+    (project / "roles" / "web" / "main.yml").write_text("---\n")
+    return project
+
+
+def _dest(tmp_path, name):
+    dest = tmp_path / name
+    dest.mkdir()
+    return dest
+
+
+@pytest.mark.asyncio
+async def test_directory_is_copied_once(cache, project, tmp_path):
+    first = _dest(tmp_path, "run1")
+    second = _dest(tmp_path, "run2")
+
+    await cache.populate(str(first), str(project))
+    await cache.populate(str(second), str(project))
+
+    assert (second / "roles" / "web" / "main.yml").read_text() == "---\n"
+    assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 1}
+    staged = os.path.join(next(iter(cache._entries.values())), "site.yml")
+    if os.stat(staged).st_dev == os.stat(second).st_dev:
+        assert os.path.samefile(staged, second / "site.yml")
+
+
+@pytest.mark.asyncio
+async def test_changed_directory_is_copied_again(
+    cache, project, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "project_cache_size", 1)
+    await cache.populate(str(_dest(tmp_path, "run1")), str(project))
+    old_staged = next(iter(cache._entries.values()))
+
+    (project / "site.yml").write_text("- hosts: web\n")
+    run2 = _dest(tmp_path, "run2")
+    await cache.populate(str(run2), str(project))
+
+    assert (run2 / "site.yml").read_text() == "- hosts: web\n"
+    assert cache.get_stats()["misses"] == 2
+    assert cache.get_stats()["entries"] == 1
+    assert not os.path.exists(old_staged)
+
+
+@pytest.mark.asyncio
+async def test_tarball_is_extracted_once(cache, project, tmp_path):
+    tarball = tmp_path / "project.tar.gz"
+    with tarfile.open(tarball, "w:gz") as tar:
+        tar.add(project, arcname=".")
+
+    for name in ["run1", "run2", "run3"]:
+        dest = _dest(tmp_path, name)
+        await cache.populate(str(dest), str(tarball), extract=True)
+        assert (dest / "site.yml").exists()
+
+    assert cache.get_stats() == {"entries": 1, "hits": 2, "misses": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_is_not_cached(cache, project, tmp_path):
+    tarball = tmp_path / "project.tar.gz"
+    with tarfile.open(tarball, "w:gz") as tar:
+        tar.add(project, arcname=".")
+    data = tarball.read_bytes()
+    tarball.write_bytes(data[: len(data) // 2])
+
+    for name in ["run1", "run2"]:
+        with pytest.raises(ProjectExtractException):
+            await cache.populate(
+                str(_dest(tmp_path, name)), str(tarball), extract=True
+            )
+
+    assert cache.get_stats() == {"entries": 0, "hits": 0, "misses": 2}
+    assert os.listdir(cache._root) == []
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_copies(cache, project, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "project_cache_size", 0)
+    dest = _dest(tmp_path, "run1")
+
+    await cache.populate(str(dest), str(project))
+
+    assert (dest / "site.yml").exists()
+    assert cache.get_stats() == {"entries": 0, "hits": 0, "misses": 0}
+
+
+@pytest.mark.asyncio
+async def test_create_inventory(cache, tmp_path):
+    inventory = tmp_path / "inventory.yml"
+    inventory.write_text("all:\n  hosts:\n    localhost:\n")
+    inventory_dir = _dest(tmp_path, "inventory")
+
+    path = await cache.create_inventory(str(inventory_dir), str(inventory))
+
+    assert path == str(inventory_dir / "inventory.yml")
+    assert os.path.exists(path)
+    with pytest.raises(InventoryNotFound):
+        await cache.create_inventory(
+            str(inventory_dir), str(tmp_path / "missing.yml")
+        )
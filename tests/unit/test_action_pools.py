@@ -0,0 +1,206 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from ansible_rulebook import rule_set_runner
+from ansible_rulebook.action_pools import (
+    DEFAULT_POOL,
+    ActionPool,
+    ActionPools,
+    parse_action_pools,
+)
+from ansible_rulebook.conf import settings
+from ansible_rulebook.plan_queue import ActionPlanQueue
+from ansible_rulebook.rule_set_runner import _pooled_actions
+from ansible_rulebook.rules_parser import parse_rule_sets
+
+
+def test_parse_action_pools():
+    assert parse_action_pools("") == {}
+    assert parse_action_pools(
+        " run_playbook=5, Demo: rules:run_job_template=2 ,"
+    ) == {
+        (None, "run_playbook"): 5,
+        ("Demo: rules", "run_job_template"): 2,
+    }
+
+
+@pytest.mark.parametrize(
+    "value", ["run_playbook", "run_playbook=0", "run_playbook=x", "=2"]
+)
+def test_parse_action_pools_invalid(value):
+    with pytest.raises(ValueError):
+        parse_action_pools(value)
+
+
+@pytest.mark.asyncio
+async def test_actions_get_their_pool():
+    pools = ActionPools()
+    assert pools.get("rs", "run_playbook") is None
+
+    default = ActionPool(DEFAULT_POOL, 3)
+    pools.configure(
+        default,
+        parse_action_pools("run_playbook=1,rs2:run_playbook=2"),
+    )
+    playbooks = pools.get("rs1", "run_playbook")
+
+    assert playbooks.name == "run_playbook"
+    assert playbooks.size == 1
+    assert pools.get("rs3", "run_playbook") is playbooks
+    assert pools.get("rs2", "run_playbook").name == "rs2:run_playbook"
+    assert pools.get("rs1", "run_job_template") is default
+    assert pools.for_actions(
+        "rs1", ["run_playbook", "run_module", "run_job_template"]
+    ) == [playbooks, default]
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_actions():
+    pool = ActionPool("run_playbook", 1)
+    release = asyncio.Event()
+
+    async def action():
+        async with pool:
+            await release.wait()
+
+    tasks = [asyncio.create_task(action()) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    stats = pool.get_stats()
+    assert stats["active"] == 1
+    assert stats["waiting"] == 1
+    assert pool.exhausted
+
+    release.set()
+    await asyncio.gather(*tasks)
+    stats = pool.get_stats()
+    assert stats["runs"] == 2
+    assert stats["max_active"] == 1
+    assert not pool.exhausted
+
+
+@pytest.mark.asyncio
+async def test_free_slot_waits_without_taking_it():
+    pool = ActionPool("run_playbook", 1)
+    await pool.free_slot()
+
+    async with pool:
+        waiter = asyncio.create_task(pool.free_slot())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+    await asyncio.wait_for(waiter, 1)
+    assert pool.available == 1
+
+
+def _actions_ruleset(*actions):
+    return parse_rule_sets(
+        [
+            {
+                "name": "rs",
+                "hosts": "all",
+                "sources": [{"range": {"limit": 1}}],
+                "rules": [
+                    {"name": f"r{i}", "condition": "event.i == 1", **action}
+                    for i, action in enumerate(actions)
+                ],
+            }
+        ]
+    )[0]
+
+
+def test_inline_actions_take_a_slot_when_locked_or_persisted(monkeypatch):
+    monkeypatch.setattr(settings, "persistence_enabled", False)
+    inline = _actions_ruleset({"action": {"debug": None}})
+    locked = _actions_ruleset(
+        {"action": {"debug": None}},
+        {"action": {"post_event": {"event": {}, "lock": "x"}}},
+    )
+
+    assert _pooled_actions(inline) == []
+    assert _pooled_actions(locked) == ["post_event"]
+
+    monkeypatch.setattr(settings, "persistence_enabled", True)
+    assert _pooled_actions(inline) == ["debug"]
+
+
+def _match(rule, action, priority=0):
+    return Mock(
+        rule=rule,
+        priority=priority,
+        actions=[Mock(action=action, action_args={})],
+        rule_engine_results=Mock(matching_uuid=None),
+    )
+
+
+@pytest.mark.asyncio
+async def test_full_pool_does_not_hold_up_other_matches(monkeypatch):
+    pools = ActionPools()
+    pools.configure(
+        ActionPool(DEFAULT_POOL, 2), parse_action_pools("run_playbook=1")
+    )
+    monkeypatch.setattr(rule_set_runner, "action_pools", pools)
+    rule_set = parse_rule_sets(
+        [
+            {
+                "name": "rs",
+                "hosts": "all",
+                "execution_strategy": "parallel",
+                "sources": [{"range": {"limit": 1}}],
+                "rules": [
+                    {
+                        "name": "r1",
+                        "condition": "event.i == 1",
+                        "action": {"run_playbook": {"name": "x.yml"}},
+                    }
+                ],
+            }
+        ]
+    )[0]
+    queue = ActionPlanQueue()
+    queue_plan = Mock(plan=Mock(queue=queue))
+    queue_plan.ruleset.name = "rs"
+    runner = rule_set_runner.RuleSetRunner(
+        asyncio.Queue(), queue_plan, None, {}, rule_set
+    )
+
+    playbooks = pools.get("rs", "run_playbook")
+    async with playbooks:
+        queue.put_nowait(_match("playbook", "run_playbook", 5))
+        queue.put_nowait(_match("debug", "debug"))
+        queue.put_nowait(_match("template", "run_job_template"))
+
+        assert (
+            await asyncio.wait_for(runner._next_action_item(), 1)
+        ).rule == ("debug")
+        assert (
+            await asyncio.wait_for(runner._next_action_item(), 1)
+        ).rule == ("template")
+
+        waiter = asyncio.create_task(runner._next_action_item())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        # A match queued while the others wait is dispatched right away
+        queue.put_nowait(_match("late", "run_job_template"))
+        assert (await asyncio.wait_for(waiter, 1)).rule == "late"
+        waiter = asyncio.create_task(runner._next_action_item())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+    assert (await asyncio.wait_for(waiter, 1)).rule == "playbook"
+    assert queue.empty()
@@ -0,0 +1,113 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import pytest
+
+from ansible_rulebook.admission import AdmissionIndex
+from ansible_rulebook.json_generator import visit_ruleset
+from ansible_rulebook.rules_parser import parse_rule_sets
+
+
+def _index(*conditions, variables=None):
+    rules = [
+        {"name": f"r{i}", "condition": condition, "action": {"debug": None}}
+        for i, condition in enumerate(conditions)
+    ]
+    ruleset = parse_rule_sets(
+        [
+            {
+                "name": "rs",
+                "hosts": "all",
+                "sources": [{"range": {"limit": 1}}],
+                "rules": rules,
+            }
+        ]
+    )[0]
+    ast = visit_ruleset(ruleset, variables or {})
+    return AdmissionIndex.from_ruleset_ast(ast["RuleSet"])
+
+
+@pytest.mark.parametrize(
+    "conditions,admitted,dropped",
+    [
+        (
+            ["event.i == 1"],
+            [{"i": 1}, {"i": 1.0}, {"i": "1"}, {"i": [1]}],
+            [{"i": 2}, {"j": 1}, {}],
+        ),
+        (
+            ['event.type in ["a", "b"]', "event.x is defined"],
+            [{"type": "a"}, {"x": None}, {"type": "c", "x": 1}],
+            [{"type": "c"}, {"y": 1}],
+        ),
+        (
+            ['event.meta.host == "h1"'],
+            [{"meta": {"host": "h1"}}, {"meta": ["h2"]}],
+            [{"meta": {"host": "h2"}}, {"meta": {}}],
+        ),
+        (
+            ["event.a == 1 or event.b > 2"],
+            [{"a": 1}, {"b": 0}],
+            [{"a": 2}, {"c": 3}],
+        ),
+        (
+            ["event.a == 1 and event.b == 2"],
+            [{"a": 1, "b": 2}],
+            [{"a": 1}, {"a": 1, "b": 3}],
+        ),
+        (
+            [{"all": ["event.i == 1", "event.j == events.m_0.i"]}],
+            [{"i": 1}, {"j": 5}],
+            [{"i": 2}, {"k": 1}],
+        ),
+        (
+            ["event.i == 1", 'event.i == "a"'],
+            [{"i": 1}, {"i": 2}, {"i": "b"}],
+            [{"j": 1}],
+        ),
+    ],
+)
+def test_admission(conditions, admitted, dropped):
+    index = _index(*conditions)
+
+    assert index.enabled
+    for event in admitted:
+        assert index.admits(event), event
+    for event in dropped:
+        assert not index.admits(event), event
+    assert index.dropped == len(dropped)
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        ["event.i == 1", "event.i != 1"],
+        ["event.a == 1 or event.b is not defined"],
+        ["event.i == null"],
+        [{"not_all": ["event.i == 1", "not event.j"]}],
+        ['event["a b"] == 1'],
+    ],
+)
+def test_admits_everything_when_unknown(conditions):
+    index = _index(*conditions)
+
+    assert not index.enabled
+    assert index.admits({"unrelated": True})
+    assert index.dropped == 0
+
+
+def test_variables_are_literals():
+    index = _index("event.i == vars.expected", variables={"expected": 5})
+
+    assert index.admits({"i": 5})
+    assert not index.admits({"i": 4})
@@ -0,0 +1,117 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+
+from ansible_rulebook.audit_spool import HEADER, AuditSpool
+from ansible_rulebook.envelope import EventEnvelope
+
+
+def _drain(spool, limit=100):
+    records = []
+    while True:
+        batch = spool.read(limit)
+        if not batch:
+            return records
+        records.extend(batch)
+        spool.consume(len(batch))
+
+
+def test_records_are_read_in_order_across_segments(tmp_path):
+    spool = AuditSpool(str(tmp_path), 1024 * 1024, segment_bytes=64)
+    for i in range(10):
+        assert spool.append({"type": "Action", "i": i})
+
+    assert len(os.listdir(tmp_path)) > 1
+    assert spool
+    assert _drain(spool, limit=3) == [
+        {"type": "Action", "i": i} for i in range(10)
+    ]
+    assert not spool
+    assert spool.size == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_unconsumed_records_are_read_again(tmp_path):
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    for i in range(3):
+        spool.append({"i": i})
+
+    assert spool.read(2) == [{"i": 0}, {"i": 1}]
+    spool.consume()
+    assert spool.read(2) == [{"i": 1}, {"i": 2}]
+    spool.consume(2)
+    assert spool.read(2) == []
+
+    spool.append(EventEnvelope({"i": 3}))
+    assert spool.read(2) == [{"i": 3}]
+
+
+def test_full_spool_refuses_records(tmp_path):
+    record = {"i": 0}
+    frame_size = HEADER.size + len('{"i": 0}')
+    spool = AuditSpool(str(tmp_path), 2 * frame_size)
+
+    assert spool.append(record)
+    assert spool.append(record)
+    assert not spool.append(record)
+
+    # Space is freed when all the records of a segment were sent
+    assert spool.read(1) == [record]
+    spool.consume()
+    assert not spool.append(record)
+    assert _drain(spool) == [record]
+    assert spool.append(record)
+
+
+def test_records_of_a_previous_run_are_read_first(tmp_path):
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    spool.append({"run": 1})
+    spool.close()
+
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    spool.append({"run": 2})
+    assert len(os.listdir(tmp_path)) == 2
+    assert _drain(spool) == [{"run": 1}, {"run": 2}]
+    assert os.listdir(tmp_path) == []
+
+
+def test_corrupt_segment_is_skipped(tmp_path, caplog):
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    for i in range(3):
+        spool.append({"i": i})
+    spool.close()
+    (segment,) = os.listdir(tmp_path)
+    with open(tmp_path / segment, "r+b") as f:
+        # Change the payload of the second record
+        f.seek(2 * HEADER.size + len('{"i": 0}') + len('{"i": '))
+        f.write(b"7")
+
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    spool.append({"i": 3})
+    assert _drain(spool) == [{"i": 0}, {"i": 3}]
+    assert "is corrupt at offset" in caplog.text
+
+
+def test_truncated_segment_is_skipped(tmp_path):
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    spool.append({"i": 0})
+    spool.append({"i": 1})
+    spool.close()
+    (segment,) = os.listdir(tmp_path)
+    size = os.path.getsize(tmp_path / segment)
+    os.truncate(tmp_path / segment, size - 2)
+
+    spool = AuditSpool(str(tmp_path), 1024 * 1024)
+    assert _drain(spool) == [{"i": 0}]
+    assert os.listdir(tmp_path) == []
@@ -17,6 +17,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from ansible_rulebook.action_pools import ActionPool
 from ansible_rulebook.app import NullQueue
 from ansible_rulebook.back_pressure import BackPressureManager
 from ansible_rulebook.exception import (
@@ -263,6 +264,32 @@ class TestBackPressureManager:
             await manager.apply_actions_back_pressure()
             await release_task
 
+    @pytest.mark.asyncio
+    async def test_actions_back_pressure_only_for_exhausted_pools(self):
+        """Test only the pools of the ruleset hold back its events."""
+        playbooks = ActionPool("run_playbook", 1)
+        templates = ActionPool("run_job_template", 1)
+        manager = BackPressureManager(action_pools=[templates])
+
+        await playbooks.semaphore.acquire()
+        with patch("ansible_rulebook.back_pressure.settings") as mock_settings:
+            mock_settings.max_back_pressure_timeout = 10
+
+            await manager.apply_actions_back_pressure()
+
+            manager.action_pools.append(playbooks)
+
+            async def release_slot():
+                await asyncio.sleep(0.1)
+                playbooks.semaphore.release()
+
+            release_task = asyncio.create_task(release_slot())
+            await manager.apply_actions_back_pressure()
+            await release_task
+
+        assert playbooks.get_stats()["back_pressure_count"] == 1
+        assert templates.get_stats()["back_pressure_count"] == 0
+
     # ========================================================================
     # Combined Back Pressure Tests
     # ========================================================================
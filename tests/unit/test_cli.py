@@ -1,4 +1,5 @@
 import re
+import subprocess
 import sys
 import tempfile
 from pathlib import Path
@@ -6,9 +7,11 @@ from unittest.mock import patch
 
 import pytest
 
-from ansible_rulebook.cli import main
+from ansible_rulebook.cli import get_parser, main
 from ansible_rulebook.util import (
     check_jvm,
+    get_java_properties,
+    get_java_version,
     get_version,
     validate_file_path,
     validate_url,
@@ -81,6 +84,49 @@ def test_check_jvm_java_version(mock, mocked_version):
     assert result is None
 
 
+@patch("ansible_rulebook.util.run_java_settings")
+def test_java_properties_probed_once(mock, monkeypatch):
+    monkeypatch.setenv("JAVA_HOME", "/opt/java")
+    mock.return_value = subprocess.CompletedProcess(
+        args=[],
+        returncode=0,
+        stderr="Property settings:\n    java.home = /opt/java\n"
+        "    java.version = 17.0.2\n    java.version.date = 2022-01-18\n",
+    )
+    get_java_properties.cache_clear()
+    try:
+        assert get_java_version() == "17.0.2"
+        assert get_java_version() == "17.0.2"
+    finally:
+        get_java_properties.cache_clear()
+
+    mock.assert_called_once_with("/opt/java/bin/java")
+
+
+@patch("ansible_rulebook.util.get_version", return_value="version info")
+def test_version_is_only_probed_when_asked(mock, capsys):
+    parser = get_parser()
+    mock.assert_not_called()
+
+    with pytest.raises(SystemExit) as excinfo:
+        parser.parse_args(["--version"])
+
+    assert excinfo.value.code == 0
+    assert capsys.readouterr().out == "version info\n"
+
+
+@patch("ansible_rulebook.cli.app.run")
+def test_main_profile_startup(mock, capsys):
+    args = ["-r", "rulebook.yml", "--profile-startup"]
+    with patch.object(sys, "argv", args):
+        assert main(args) == 0
+
+    err = capsys.readouterr().err
+    assert "Startup profile:" in err
+    for phase in ("parse arguments", "check jvm", "import aiohttp", "total"):
+        assert phase in err
+
+
 def test_main_no_args():
     with patch.object(sys, "argv", ["ansible-rulebook"]):
         with pytest.raises(SystemExit) as excinfo:
@@ -135,8 +135,19 @@ class TestSettings:
 
         assert test_settings.max_concurrent_actions == 0
         assert test_settings.max_actions_semaphore is None
+        assert test_settings.action_pools == ""
+        assert test_settings.action_plan_queue_size == 0
+        assert test_settings.action_priority_aging == 60
+        assert test_settings.jvm_heap_percent == 0
+        assert test_settings.audit_spool_dir == ""
+        assert test_settings.audit_spool_size == 256
+        assert test_settings.event_admission is False
+        assert test_settings.event_projection is False
+        assert test_settings.event_projection_size == 10000
         assert test_settings.max_actions_timeout == 3600
         assert test_settings.max_batch_job_polling_size == 25
+        assert test_settings.max_concurrent_job_polls == 5
+        assert test_settings.runner_pool_size == 25
 
 
 class TestConvertType:
@@ -387,10 +398,38 @@ class TestUpdateFromEnv:
             "persistence_enabled",
             "persistence_id",
             "max_concurrent_actions",
+            "action_pools",
+            "action_plan_queue_size",
+            "action_priority_aging",
             "max_actions_timeout",
             "max_back_pressure_timeout",
             "max_reporting_queue_size",
             "max_batch_job_polling_size",
+            "max_concurrent_job_polls",
+            "controller_job_status_stream",
+            "controller_cache_ttl",
+            "controller_cache_size",
+            "project_cache_size",
+            "runner_pool_size",
+            "runner_event_forwarding",
+            "runner_event_sample_rate",
+            "runner_artifacts",
+            "runner_artifact_dir",
+            "fact_cache_dir",
+            "fact_cache_ttl",
+            "fact_gathering_forks",
+            "action_state_flush_interval",
+            "session_stats_interval",
+            "jvm_startup_cache_dir",
+            "jvm_heap_percent",
+            "jvm_gc",
+            "event_admission",
+            "event_projection",
+            "event_projection_size",
+            "audit_event_references",
+            "audit_event_cache_size",
+            "audit_spool_dir",
+            "audit_spool_size",
             "eda_labels",
         }
 
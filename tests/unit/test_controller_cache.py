@@ -0,0 +1,167 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Unit tests for ansible_rulebook.controller_cache module."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ansible_rulebook import controller_cache
+from ansible_rulebook.conf import settings
+from ansible_rulebook.controller_cache import ControllerMetadataCache
+
+
+def _loader(value, calls, delay=0.0):
+    async def _load():
+        calls.append(value)
+        await asyncio.sleep(delay)
+        return value
+
+    return _load
+
+
+@pytest.mark.asyncio
+async def test_value_is_cached_until_ttl_expires(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 60)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    with patch.object(controller_cache.time, "monotonic", return_value=0):
+        assert await cache.get_or_load("k", _loader({"id": 1}, calls)) == {
+            "id": 1
+        }
+        assert await cache.get_or_load("k", _loader({"id": 2}, calls)) == {
+            "id": 1
+        }
+    with patch.object(controller_cache.time, "monotonic", return_value=61):
+        assert await cache.get_or_load("k", _loader({"id": 2}, calls)) == {
+            "id": 2
+        }
+
+    assert len(calls) == 2
+    assert cache.get_stats() == {"entries": 1, "hits": 1, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_ttl_zero_disables_cache(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 0)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    await cache.get_or_load("k", _loader(1, calls))
+    await cache.get_or_load("k", _loader(1, calls))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_negative_results_use_short_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 600)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    with patch.object(controller_cache.time, "monotonic", return_value=0):
+        assert await cache.get_or_load("k", _loader(None, calls)) is None
+        assert await cache.get_or_load("k", _loader(None, calls)) is None
+    negative_expiry = controller_cache.NEGATIVE_CACHE_TTL + 1
+    with patch.object(
+        controller_cache.time, "monotonic", return_value=negative_expiry
+    ):
+        assert await cache.get_or_load("k", _loader({"id": 1}, calls))
+
+    assert calls == [None, {"id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_empty_values_not_cached_when_disallowed(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 60)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    await cache.get_or_load("k", _loader({}, calls), cache_empty=False)
+    await cache.get_or_load("k", _loader({}, calls), cache_empty=False)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_size_bound_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 60)
+    monkeypatch.setattr(settings, "controller_cache_size", 2)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    await cache.get_or_load("a", _loader("a", calls))
+    await cache.get_or_load("b", _loader("b", calls))
+    await cache.get_or_load("a", _loader("a", calls))
+    await cache.get_or_load("c", _loader("c", calls))
+    await cache.get_or_load("a", _loader("a", calls))
+    await cache.get_or_load("b", _loader("b", calls))
+
+    assert calls == ["a", "b", "c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_load(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 0)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    results = await asyncio.gather(
+        *[
+            cache.get_or_load("k", _loader({"id": 1}, calls, 0.01))
+            for _ in range(50)
+        ]
+    )
+
+    assert calls == [{"id": 1}]
+    assert all(r == {"id": 1} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_load_error_is_shared_and_not_cached(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 60)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    async def _failing():
+        calls.append("fail")
+        await asyncio.sleep(0.01)
+        raise RuntimeError("Kaboom")
+
+    results = await asyncio.gather(
+        cache.get_or_load("k", _failing),
+        cache.get_or_load("k", _failing),
+        return_exceptions=True,
+    )
+    assert calls == ["fail"]
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    assert await cache.get_or_load("k", _loader(1, calls)) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate(monkeypatch):
+    monkeypatch.setattr(settings, "controller_cache_ttl", 60)
+    cache = ControllerMetadataCache()
+    calls = []
+
+    await cache.get_or_load("k", _loader(1, calls))
+    cache.invalidate("k")
+    cache.invalidate("missing")
+    await cache.get_or_load("k", _loader(2, calls))
+
+    assert calls == [1, 2]
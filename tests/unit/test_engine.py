@@ -24,11 +24,14 @@ from freezegun import freeze_time
 from ansible_rulebook.engine import (
     FilteredQueue,
     RulebookFileChangeHandler,
+    _RunningRuleset,
     all_source_queues,
     broadcast,
     heartbeat_task,
     meta_info_filter,
     monitor_rulebook,
+    reload_rulesets,
+    ruleset_digest,
     run_rulesets,
     start_source,
 )
@@ -41,9 +44,12 @@ from ansible_rulebook.exception import (
 )
 from ansible_rulebook.messages import Shutdown
 from ansible_rulebook.rule_types import (
+    Action,
+    Condition,
     EventSource,
     EventSourceFilter,
     ExecutionStrategy,
+    Rule,
     RuleSet,
     RuleSetQueue,
 )
@@ -223,6 +229,34 @@ class TestHeartbeatTask:
                 assert mock_send_stats.call_count >= 2  # At least one cycle
                 mock_session_stats.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_heartbeat_task_skips_stopped_rulesets(self):
+        """Test rulesets stopped during a heartbeat get no stats."""
+        # The running rulesets by name
+        rule_set_names = {"ruleset1": Mock(), "ruleset2": Mock()}
+
+        async def send_stats(event_log, stats):
+            # A hot reload stops ruleset2 while ruleset1 is reported
+            rule_set_names.pop("ruleset2", None)
+
+        with (
+            patch(
+                "ansible_rulebook.engine.send_session_stats",
+                side_effect=send_stats,
+            ),
+            patch(
+                "ansible_rulebook.engine.session_stats", return_value={}
+            ) as mock_session_stats,
+        ):
+            task = asyncio.create_task(
+                heartbeat_task(asyncio.Queue(), rule_set_names, 1)
+            )
+            await asyncio.sleep(0.1)
+            assert not task.done()
+            task.cancel()
+
+        mock_session_stats.assert_called_once_with("ruleset1")
+
     @pytest.mark.asyncio
     async def test_heartbeat_task_cancellation(self):
         """Test heartbeat task handles cancellation gracefully."""
@@ -971,3 +1005,156 @@ class TestRunRulesets:
 
                             # Facts should not be collected
                             mock_collect_facts.assert_not_called()
+
+
+def _ruleset(name, msg="hello", limit=5, uuid="1"):
+    return RuleSet(
+        name=name,
+        hosts=["all"],
+        sources=[
+            EventSource(
+                name="range",
+                source_name="range",
+                source_args={"limit": limit},
+                source_filters=[],
+            )
+        ],
+        rules=[
+            Rule(
+                name="r1",
+                condition=Condition("all", ["event.i == 1"]),
+                actions=[Action("debug", {"msg": msg}, uuid)],
+                enabled=True,
+                uuid=uuid,
+            )
+        ],
+        execution_strategy=ExecutionStrategy.SEQUENTIAL,
+        gather_facts=False,
+        uuid=uuid,
+    )
+
+
+class TestReloadRulesets:
+    """Test the incremental hot reload of rulesets."""
+
+    def test_ruleset_digest_ignores_uuids(self):
+        assert ruleset_digest(_ruleset("rs", uuid="1")) == ruleset_digest(
+            _ruleset("rs", uuid="2")
+        )
+        assert ruleset_digest(_ruleset("rs")) != ruleset_digest(
+            _ruleset("rs", msg="changed")
+        )
+
+    @pytest.mark.asyncio
+    async def test_reload_rulesets(self):
+        """Test only changed and removed rulesets are stopped."""
+        running = {}
+        stopped_while_running = []
+
+        async def forever(name=None):
+            try:
+                await asyncio.sleep(60)
+            finally:
+                if name in running:
+                    stopped_while_running.append(name)
+
+        queues = {}
+        for name in ["unchanged", "rules", "sources", "removed"]:
+            queues[name] = RuleSetQueue(_ruleset(name), asyncio.Queue(), {})
+            running[name] = _RunningRuleset(
+                queues[name],
+                asyncio.create_task(forever(name)),
+                ruleset_digest(queues[name].ruleset),
+            )
+        old_tasks = {name: entry.task for name, entry in running.items()}
+
+        reloader = Mock(variables_changed=False)
+        reloader.load = AsyncMock(
+            return_value=[
+                _ruleset("unchanged", uuid="2"),
+                _ruleset("rules", msg="changed"),
+                _ruleset("sources", limit=10),
+                _ruleset("added"),
+            ]
+        )
+        reloader.stop_sources = AsyncMock()
+        reloader.start_sources.side_effect = lambda rs: RuleSetQueue(
+            rs, asyncio.Queue(), {}
+        )
+
+        async def restart_ruleset(ruleset_queue):
+            return _RunningRuleset(
+                ruleset_queue,
+                asyncio.create_task(forever()),
+                ruleset_digest(ruleset_queue.ruleset),
+            )
+
+        await reload_rulesets(reloader, running, restart_ruleset)
+
+        assert sorted(running) == ["added", "rules", "sources", "unchanged"]
+        assert running["unchanged"].task is old_tasks["unchanged"]
+        assert not old_tasks["unchanged"].done()
+        for name in ["rules", "sources", "removed"]:
+            assert old_tasks[name].cancelled()
+        # Rules changed, the sources keep feeding the same queue
+        assert (
+            running["rules"].ruleset_queue.source_queue
+            is queues["rules"].source_queue
+        )
+        assert sorted(
+            call.args[0] for call in reloader.stop_sources.call_args_list
+        ) == ["removed", "sources"]
+        assert sorted(
+            call.args[0].name for call in reloader.start_sources.call_args_list
+        ) == ["added", "sources"]
+        # The sessions ended after the rulesets left running
+        assert stopped_while_running == []
+
+        for entry in running.values():
+            entry.task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_reload_rulesets_variables_changed(self):
+        """Test every ruleset restarts with its sources on new variables."""
+
+        async def forever():
+            await asyncio.sleep(60)
+
+        queue = RuleSetQueue(_ruleset("rs"), asyncio.Queue(), {})
+        old_task = asyncio.create_task(forever())
+        running = {
+            "rs": _RunningRuleset(
+                queue, old_task, ruleset_digest(queue.ruleset)
+            )
+        }
+        reloader = Mock(variables_changed=True)
+        reloader.load = AsyncMock(return_value=[_ruleset("rs", uuid="2")])
+        reloader.stop_sources = AsyncMock()
+        reloader.start_sources.side_effect = lambda rs: RuleSetQueue(
+            rs, asyncio.Queue(), {}
+        )
+        restart_ruleset = AsyncMock(
+            side_effect=lambda ruleset_queue: _RunningRuleset(
+                ruleset_queue, asyncio.create_task(forever()), ""
+            )
+        )
+
+        await reload_rulesets(reloader, running, restart_ruleset)
+
+        assert old_task.cancelled()
+        reloader.stop_sources.assert_called_once_with("rs")
+        reloader.start_sources.assert_called_once()
+        restart_ruleset.assert_called_once()
+        running["rs"].task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_reload_rulesets_invalid_rulebook(self):
+        """Test the running rulesets are kept if the rulebook is invalid."""
+        reloader = Mock()
+        reloader.load = AsyncMock(side_effect=Exception("bad rulebook"))
+        running = {"rs": Mock()}
+
+        await reload_rulesets(reloader, running, AsyncMock())
+
+        assert list(running) == ["rs"]
+        reloader.start_sources.assert_not_called()
@@ -0,0 +1,71 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import json
+from unittest.mock import patch
+
+import yaml
+
+from ansible_rulebook.envelope import EventEnvelope, dumps, encode
+
+
+def test_encoding_is_cached():
+    event = EventEnvelope({"i": 1, "meta": {"uuid": "u1"}})
+    expected = json.dumps(dict(event))
+
+    with patch(
+        "ansible_rulebook.envelope.json.dumps", wraps=json.dumps
+    ) as mock_dumps:
+        assert encode(event) == expected
+        encode(event)
+        event["j"] = 2
+        assert json.loads(encode(event)) == {
+            "i": 1,
+            "j": 2,
+            "meta": {"uuid": "u1"},
+        }
+
+    assert mock_dumps.call_count == 2
+    assert encode({"i": 1}) == {"i": 1}
+    assert EventEnvelope.wrap(event) is event
+
+
+def test_dumps_splices_events():
+    events = {
+        "m_0": EventEnvelope({"msg": 'a "quoted" é value'}),
+        "m_1": EventEnvelope({"i": [1, 2]}),
+    }
+    record = {
+        "type": "Action",
+        "matching_events": events,
+        "event": events["m_1"],
+        "status": "successful",
+    }
+    expected = json.dumps(
+        {
+            "type": "Action",
+            "matching_events": {k: dict(v) for k, v in events.items()},
+            "event": {"i": [1, 2]},
+            "status": "successful",
+        }
+    )
+
+    assert dumps(record) == expected
+    assert dumps({"type": "EmptyEvent"}) == '{"type": "EmptyEvent"}'
+
+
+def test_yaml_dump_as_mapping():
+    event = EventEnvelope({"i": 1})
+
+    assert yaml.dump({"event": event}) == "event:\n  i: 1\n"
+    assert yaml.safe_dump(event) == "i: 1\n"
@@ -0,0 +1,125 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ansible_rulebook.conf import settings
+from ansible_rulebook.engine import gather_facts
+from ansible_rulebook.fact_cache import FactCache
+
+
+def _facts(host, value="v1"):
+    return {"meta": {"hosts": host}, "ansible_os_family": value}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "fact_cache_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "fact_cache_ttl", 3600)
+    with patch.object(
+        FactCache, "_inventory_hosts", return_value={"h1", "h2"}
+    ):
+        yield tmp_path
+
+
+def test_store_and_load(cache_dir):
+    cache = FactCache("inventory.yml")
+    cache.store([_facts("h1"), _facts("h2"), _facts("gone")])
+
+    loaded = FactCache("inventory.yml").load()
+
+    assert sorted(f["meta"]["hosts"] for f in loaded) == ["h1", "h2"]
+
+
+def test_stale_hosts(cache_dir):
+    cache = FactCache("inventory.yml")
+    cache.store([_facts("h1"), _facts("h2")])
+    cache._gathered_at["h1"] = time.time() - 7200
+
+    assert cache.stale_hosts() == ["h1"]
+
+
+def test_load_ignores_broken_files(cache_dir):
+    (cache_dir / "broken.json").write_text("{")
+
+    assert FactCache("inventory.yml").load() == []
+
+
+@pytest.mark.asyncio
+async def test_gather_facts_uses_cache(cache_dir):
+    with patch(
+        "ansible_rulebook.engine.collect_ansible_facts",
+        return_value=[_facts("h1"), _facts("h2")],
+    ) as mock_collect:
+        hosts_facts, cache = await gather_facts("inventory.yml")
+        assert len(hosts_facts) == 2
+        assert cache is not None
+
+        hosts_facts, _ = await gather_facts("inventory.yml")
+        assert len(hosts_facts) == 2
+
+    mock_collect.assert_called_once_with("inventory.yml")
+
+
+@pytest.mark.asyncio
+async def test_refresh_replaces_stale_facts(cache_dir):
+    cache = FactCache("inventory.yml")
+    cache.store([_facts("h1"), _facts("h2")])
+    cache._gathered_at["h2"] = 0
+
+    with patch(
+        "ansible_rulebook.fact_cache.collect_ansible_facts",
+        return_value=[_facts("h2", "v2")],
+    ) as mock_collect:
+        with patch(
+            "ansible_rulebook.fact_cache.replace_facts"
+        ) as mock_replace:
+            task = asyncio.create_task(cache.refresh(lambda: ["ruleset"]))
+            while not mock_replace.called:
+                await asyncio.sleep(0.01)
+            task.cancel()
+
+    mock_collect.assert_called_once_with("inventory.yml", ["h2"], True)
+    mock_replace.assert_called_once_with("ruleset", [_facts("h2", "v2")])
+    assert cache.stale_hosts() == []
+    loaded = FactCache("inventory.yml").load()
+    assert _facts("h2", "v2") in loaded
+
+
+@pytest.mark.asyncio
+async def test_refresh_continues_after_failed_ruleset(cache_dir):
+    cache = FactCache("inventory.yml")
+    cache._hosts = {"h1"}
+
+    with patch(
+        "ansible_rulebook.fact_cache.collect_ansible_facts",
+        return_value=[_facts("h1")],
+    ):
+        with patch(
+            "ansible_rulebook.fact_cache.replace_facts",
+            side_effect=[RuntimeError("stopped"), None],
+        ) as mock_replace:
+            task = asyncio.create_task(cache.refresh(lambda: ["rs1", "rs2"]))
+            for _ in range(100):
+                if mock_replace.call_count == 2 or task.done():
+                    break
+                await asyncio.sleep(0.01)
+            assert not task.done()
+            task.cancel()
+
+    mock_replace.assert_called_with("rs2", [_facts("h1")])
+    assert cache.stale_hosts() == []
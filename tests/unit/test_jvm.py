@@ -0,0 +1,133 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ansible_rulebook import jvm
+from ansible_rulebook.conf import settings
+from ansible_rulebook.jvm import (
+    JvmProfile,
+    cgroup_memory_limit,
+    resource_profile,
+    start_jvm,
+)
+
+GiB = 1024 * 1024 * 1024
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        ("max\n", None),
+        ("1073741824\n", GiB),
+        ("9223372036854771712\n", None),
+        (None, None),
+    ],
+)
+def test_cgroup_memory_limit(tmp_path, monkeypatch, content, expected):
+    path = tmp_path / "memory.max"
+    if content is not None:
+        path.write_text(content)
+    monkeypatch.setattr(jvm, "CGROUP_MEMORY_FILES", (str(path),))
+
+    assert cgroup_memory_limit() == expected
+
+
+@pytest.mark.parametrize(
+    "limit,rule_count,expected",
+    [
+        (None, 10, JvmProfile(None, [])),
+        (GiB, 10, JvmProfile("512M", ["-XX:+UseSerialGC"])),
+        (4 * GiB, 10, JvmProfile("2048M", ["-XX:+UseG1GC"])),
+        (
+            GiB,
+            200,
+            JvmProfile("512M", ["-Xms256M", "-XX:+UseG1GC"]),
+        ),
+        (64 * 1024 * 1024, 10, JvmProfile("64M", ["-XX:+UseSerialGC"])),
+    ],
+)
+def test_resource_profile(monkeypatch, limit, rule_count, expected):
+    monkeypatch.delenv("DROOLS_JPY_JVM_MAXMEM", raising=False)
+    monkeypatch.setattr(settings, "jvm_heap_percent", 50)
+    monkeypatch.setattr(settings, "jvm_gc", "auto")
+
+    with patch("ansible_rulebook.jvm.cgroup_memory_limit", return_value=limit):
+        assert resource_profile(rule_count) == expected
+
+
+def test_resource_profile_default_keeps_drools_jpy_heap(monkeypatch):
+    monkeypatch.delenv("DROOLS_JPY_JVM_MAXMEM", raising=False)
+    monkeypatch.setattr(settings, "jvm_heap_percent", 0)
+    monkeypatch.setattr(settings, "jvm_gc", "auto")
+
+    with patch("ansible_rulebook.jvm.cgroup_memory_limit", return_value=GiB):
+        assert resource_profile(10) == JvmProfile(None, [])
+
+
+def test_resource_profile_keeps_user_settings(monkeypatch):
+    monkeypatch.setenv("DROOLS_JPY_JVM_MAXMEM", "2G")
+    monkeypatch.setattr(settings, "jvm_gc", "parallel")
+
+    with patch("ansible_rulebook.jvm.cgroup_memory_limit", return_value=GiB):
+        assert resource_profile(10) == JvmProfile(None, ["-XX:+UseParallelGC"])
+
+
+def test_start_jvm_uses_startup_cache(tmp_path, monkeypatch):
+    archive = tmp_path / "drools.jsa"
+    archive.write_bytes(b"")
+    monkeypatch.setattr(settings, "jvm_startup_cache_dir", str(tmp_path))
+    monkeypatch.setenv("JAVA_TOOL_OPTIONS", "-Xss1M")
+    monkeypatch.delenv("DROOLS_JPY_JVM_MAXMEM", raising=False)
+    environments = []
+
+    def create_engine():
+        environments.append(
+            (
+                os.environ.get("DROOLS_JPY_JVM_MAXMEM"),
+                os.environ.get("JAVA_TOOL_OPTIONS"),
+            )
+        )
+
+    with patch("ansible_rulebook.jvm.RulesetCollection") as collection:
+        collection.engine = None
+        collection.create_engine.side_effect = create_engine
+        with patch(
+            "ansible_rulebook.jvm.startup_cache_path",
+            return_value=str(archive),
+        ):
+            with patch(
+                "ansible_rulebook.jvm.resource_profile",
+                return_value=JvmProfile("512M", ["-XX:+UseSerialGC"]),
+            ):
+                start_jvm([])
+
+    assert environments == [
+        (
+            "512M",
+            f"-XX:+UseSerialGC -XX:SharedArchiveFile={archive} -Xss1M",
+        )
+    ]
+    assert os.environ["JAVA_TOOL_OPTIONS"] == "-Xss1M"
+    assert "DROOLS_JPY_JVM_MAXMEM" not in os.environ
+
+
+def test_start_jvm_once():
+    with patch("ansible_rulebook.jvm.RulesetCollection") as collection:
+        collection.engine = object()
+        start_jvm([])
+
+    collection.create_engine.assert_not_called()
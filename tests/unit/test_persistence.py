@@ -15,7 +15,11 @@
 """Unit tests for ansible_rulebook.persistence module."""
 
 import argparse
+import asyncio
 import json
+import signal
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -26,6 +30,54 @@ from ansible_rulebook.conf import settings
 SSL_PASS = "test_ssl_password"
 TEST_PASSWORD = "test_password"
 
+# Starts a job template action and gets killed before the write behind
+# flush, the action info is written to a json file standing in for the
+# persistence store
+CRASH_SCRIPT = """
+import asyncio
+import json
+import os
+import signal
+import sys
+
+from ansible_rulebook import persistence
+from ansible_rulebook.conf import settings
+
+
+class Store:
+    def add_action_info(self, rule_set, matching_uuid, index, data):
+        rows = {}
+        if os.path.exists(sys.argv[1]):
+            with open(sys.argv[1]) as f:
+                rows = json.load(f)
+        rows[f"{rule_set}/{matching_uuid}/{index}"] = data
+        with open(sys.argv[1], "w") as f:
+            json.dump(rows, f)
+
+    update_action_info = add_action_info
+
+
+async def main():
+    persistence.update_action_info(
+        "rs1", "uuid-123", 0, {"status": "started"}, create=True
+    )
+    persistence.update_action_info(
+        "rs1",
+        "uuid-123",
+        0,
+        {"job_url": "https://controller/api/v2/jobs/1/"},
+        flush=True,
+    )
+    persistence.update_action_info("rs1", "uuid-123", 0, {"status": "x"})
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+persistence.lang = Store()
+settings.persistence_enabled = True
+settings.action_state_flush_interval = 60000
+asyncio.run(main())
+"""
+
 
 @pytest.fixture
 def mock_lang():
@@ -126,9 +178,9 @@ class TestEnablePersistence:
     ):
         """Test enabling persistence with encryption keys configured."""
         postgres_variables["drools_primary_encryption_secret"] = "primary_key"
-        postgres_variables[
-            "drools_secondary_encryption_secret"
-        ] = "secondary_key"
+        postgres_variables["drools_secondary_encryption_secret"] = (
+            "secondary_key"
+        )
 
         persistence.enable_persistence(parsed_args, postgres_variables)
 
@@ -318,6 +370,143 @@ class TestGetActionAPriori:
         assert "Error parsing prior action data" in caplog.text
 
 
+@pytest.fixture
+def write_behind(reset_settings, monkeypatch):
+    """Enable persistence with a short write behind interval."""
+    settings.persistence_enabled = True
+    monkeypatch.setattr(settings, "action_state_flush_interval", 20)
+    persistence._action_states.clear()
+    yield
+    persistence._action_states.clear()
+
+
+class TestActionStateWriteBehind:
+    """Tests for the write behind of action states."""
+
+    @pytest.mark.asyncio
+    async def test_transitions_are_written_once(self, mock_lang, write_behind):
+        """Test several transitions within the interval become one write."""
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "started"}, create=True
+        )
+        mock_lang.add_action_info.assert_called_once_with(
+            "test_ruleset", "uuid-123", 0, json.dumps({"status": "started"})
+        )
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"job_id": "12345"}
+        )
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "running"}
+        )
+
+        mock_lang.update_action_info.assert_not_called()
+        assert persistence.get_action_a_priori(
+            "test_ruleset", "uuid-123", 0
+        ) == {"status": "running", "job_id": "12345"}
+        mock_lang.action_info_exists.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        mock_lang.update_action_info.assert_called_once_with(
+            "test_ruleset",
+            "uuid-123",
+            0,
+            json.dumps({"status": "running", "job_id": "12345"}),
+        )
+        mock_lang.add_action_info.assert_called_once()
+        mock_lang.get_action_info.assert_not_called()
+        mock_lang.update_action_info.reset_mock()
+
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "successful"}
+        )
+        persistence.flush_action_info("test_ruleset")
+        mock_lang.update_action_info.assert_called_once_with(
+            "test_ruleset",
+            "uuid-123",
+            0,
+            json.dumps({"status": "successful", "job_id": "12345"}),
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush_on_session_end(self, mock_lang, write_behind):
+        """Test pending states of a ruleset are written when flushed."""
+        for rule_set in ["rs1", "rs2"]:
+            persistence.update_action_info(
+                rule_set, "uuid-123", 0, {"status": "started"}, create=True
+            )
+            persistence.update_action_info(
+                rule_set, "uuid-123", 0, {"status": "running"}
+            )
+
+        persistence.flush_action_info("rs1")
+
+        mock_lang.update_action_info.assert_called_once_with(
+            "rs1", "uuid-123", 0, json.dumps({"status": "running"})
+        )
+
+    @pytest.mark.asyncio
+    async def test_deleted_matching_is_not_written(
+        self, mock_lang, write_behind
+    ):
+        """Test an action finishing within the interval isn't updated."""
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "started"}, create=True
+        )
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "successful"}
+        )
+        persistence.delete_action_info("test_ruleset", "uuid-123")
+        persistence.flush_action_info()
+
+        mock_lang.update_action_info.assert_not_called()
+        mock_lang.delete_action_info.assert_called_once_with(
+            "test_ruleset", "uuid-123"
+        )
+
+    @pytest.mark.asyncio
+    async def test_write_through_without_interval(
+        self, mock_lang, write_behind, monkeypatch
+    ):
+        """Test an interval of 0 writes every transition right away."""
+        monkeypatch.setattr(settings, "action_state_flush_interval", 0)
+        mock_lang.get_action_info.return_value = json.dumps(
+            {"status": "started"}
+        )
+
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "started"}, create=True
+        )
+        persistence.update_action_info(
+            "test_ruleset", "uuid-123", 0, {"status": "running"}
+        )
+
+        mock_lang.add_action_info.assert_called_once()
+        mock_lang.update_action_info.assert_called_once()
+
+    def test_started_action_survives_a_crash(
+        self, mock_lang, write_behind, tmp_path
+    ):
+        """Test a crash before the flush keeps what recovery needs."""
+        path = tmp_path / "action_info.json"
+        result = subprocess.run(
+            [sys.executable, "-c", CRASH_SCRIPT, str(path)], timeout=120
+        )
+        assert result.returncode == -signal.SIGKILL
+
+        rows = json.loads(path.read_text())
+        mock_lang.action_info_exists.side_effect = lambda *key: (
+            "/".join(map(str, key)) in rows
+        )
+        mock_lang.get_action_info.side_effect = lambda *key: rows.get(
+            "/".join(map(str, key))
+        )
+        assert persistence.get_action_a_priori("rs1", "uuid-123", 0) == {
+            "status": "started",
+            "job_url": "https://controller/api/v2/jobs/1/",
+        }
+
+
 class TestEnableLeader:
     """Tests for enable_leader function."""
 
@@ -0,0 +1,193 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from typing import NamedTuple
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ansible_rulebook.plan_queue import ActionPlanQueue
+from ansible_rulebook.rules_parser import parse_rule_sets
+
+
+class Match(NamedTuple):
+    rule: str
+    priority: int = 0
+    rule_engine_results: Mock = Mock(matching_uuid=None)
+
+
+def _persisted(rule, priority=0):
+    return Match(rule, priority, Mock(matching_uuid=f"uuid-{rule}"))
+
+
+def _drain(queue):
+    rules = []
+    while not queue.empty():
+        rules.append(queue.get_nowait().rule)
+    return rules
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_first():
+    queue = ActionPlanQueue()
+    for match in [Match("a"), Match("b", 5), Match("c"), Match("d", 5)]:
+        queue.put_nowait(match)
+
+    assert queue.qsize() == 4
+    assert queue.peek().rule == "b"
+    assert await queue.get() == Match("b", 5)
+    assert _drain(queue) == ["d", "a", "c"]
+
+    stats = queue.get_stats()
+    assert list(stats) == [5, 0]
+    assert stats[0]["max_depth"] == 2
+    assert stats[0]["dispatched"] == 2
+    assert stats[5]["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_waiting_matches_age():
+    queue = ActionPlanQueue(aging=10)
+    with patch("ansible_rulebook.plan_queue.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        queue.put_nowait(Match("low"))
+        monotonic.return_value = 5
+        queue.put_nowait(Match("high", 1))
+        assert _drain(queue) == ["high", "low"]
+
+        monotonic.return_value = 100
+        queue.put_nowait(Match("low"))
+        monotonic.return_value = 125
+        queue.put_nowait(Match("high", 1))
+        assert _drain(queue) == ["low", "high"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_lowest_priority():
+    queue = ActionPlanQueue(limit=2)
+    queue.put_nowait(Match("a"))
+    queue.put_nowait(Match("b"))
+    queue.put_nowait(Match("c"))
+    queue.put_nowait(Match("d", 1))
+
+    assert _drain(queue) == ["d", "a"]
+    assert queue.get_stats()[0]["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_full_queue_keeps_persisted_matches():
+    queue = ActionPlanQueue(limit=2)
+    queue.put_nowait(_persisted("a"))
+    queue.put_nowait(Match("b"))
+    queue.put_nowait(_persisted("c"))
+    queue.put_nowait(_persisted("d"))
+    queue.put_nowait(Match("e", 1))
+
+    assert _drain(queue) == ["a", "c", "d"]
+    assert queue.get_stats()[0]["dropped"] == 1
+    assert queue.get_stats()[1]["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_waits_for_a_match():
+    queue = ActionPlanQueue()
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    assert not getter.done()
+
+    queue.put_nowait(Match("a"))
+    assert (await asyncio.wait_for(getter, 1)).rule == "a"
+
+
+@pytest.mark.asyncio
+async def test_wait_for_room():
+    queue = ActionPlanQueue(limit=2)
+    for rule in "abc":
+        queue.put_nowait(_persisted(rule))
+
+    waiter = asyncio.create_task(queue.wait_for_room())
+    queue.get_nowait()
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    queue.get_nowait()
+    await asyncio.wait_for(waiter, 1)
+
+
+@pytest.mark.asyncio
+async def test_wait_below():
+    queue = ActionPlanQueue()
+    for rule in "abc":
+        queue.put_nowait(Match(rule))
+
+    waiter = asyncio.create_task(queue.wait_below(1))
+    await asyncio.sleep(0)
+    queue.get_nowait()
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.get_nowait()
+    await asyncio.wait_for(waiter, 1)
+
+
+@pytest.mark.asyncio
+async def test_take_first_accepted_match():
+    queue = ActionPlanQueue()
+    for match in [Match("a"), Match("b", 5), Match("c"), Match("d", 5)]:
+        queue.put_nowait(match)
+
+    assert queue.take(lambda match: match.rule in "cd").rule == "d"
+    assert queue.take(lambda match: match.rule == "c").rule == "c"
+    assert queue.take(lambda match: False) is None
+    assert _drain(queue) == ["b", "a"]
+    assert queue.get_stats()[0]["dispatched"] == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_above():
+    queue = ActionPlanQueue()
+    queue.put_nowait(Match("a"))
+    waiter = asyncio.create_task(queue.wait_above(1))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    queue.put_nowait(Match("b"))
+    await asyncio.wait_for(waiter, 1)
+
+
+def test_rule_priority_is_parsed():
+    ruleset = parse_rule_sets(
+        [
+            {
+                "name": "rs",
+                "hosts": "all",
+                "sources": [{"range": {"limit": 1}}],
+                "rules": [
+                    {
+                        "name": "r1",
+                        "condition": "event.i == 1",
+                        "priority": 10,
+                        "action": {"debug": None},
+                    },
+                    {
+                        "name": "r2",
+                        "condition": "event.i == 2",
+                        "action": {"debug": None},
+                    },
+                ],
+            }
+        ]
+    )[0]
+
+    assert [rule.priority for rule in ruleset.rules] == [10, 0]
@@ -0,0 +1,176 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import patch
+
+import pytest
+
+from ansible_rulebook.json_generator import visit_ruleset
+from ansible_rulebook.projection import (
+    EventProjection,
+    parse_duration,
+    parse_path,
+)
+from ansible_rulebook.rules_parser import parse_rule_sets
+
+
+def _projection(*rules, limit=0, **ruleset):
+    ruleset = parse_rule_sets(
+        [
+            {
+                "name": "rs",
+                "hosts": "all",
+                "sources": [{"range": {"limit": 1}}],
+                "rules": [
+                    {"name": f"r{i}", "action": {"debug": None}, **rule}
+                    for i, rule in enumerate(rules)
+                ],
+                **ruleset,
+            }
+        ]
+    )[0]
+    ast = visit_ruleset(ruleset, {})
+    return EventProjection.from_ruleset_ast(ast["RuleSet"], limit)
+
+
+def _event(uuid, **attributes):
+    return {"meta": {"uuid": uuid, "source": {"name": "s"}}, **attributes}
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("a.b", ("a", "b")),
+        ("a[0].b", ("a",)),
+        ("['a b'].c", ("a b", "c")),
+        ('a["b"]', ("a", "b")),
+        ("[0]", None),
+    ],
+)
+def test_parse_path(path, expected):
+    assert parse_path(path) == expected
+
+
+def test_parse_duration():
+    assert parse_duration("5 minutes") == 300
+    assert parse_duration("1 hour") == 3600
+    assert parse_duration("soon") is None
+
+
+def test_projects_referenced_attributes():
+    projection = _projection(
+        {"condition": "event.payload.status == 'firing'"},
+        {"condition": "event.items[0].name == 'x'"},
+    )
+    event = _event(
+        "1",
+        payload={"status": "firing", "body": "x" * 100},
+        items=[{"name": "x"}],
+        raw="y" * 100,
+    )
+
+    assert projection.project(event) == _event(
+        "1", payload={"status": "firing"}, items=[{"name": "x"}]
+    )
+    assert projection.retention == 0
+
+
+def test_unchanged_events_are_posted_as_is():
+    projection = _projection({"condition": "event.i == 1"})
+    event = _event("1", i=1)
+
+    assert projection.project(event) is event
+    assert projection.project({"i": 1, "j": 2}) == {"i": 1, "j": 2}
+
+
+def test_rehydrates_the_posted_event():
+    projection = _projection({"condition": "event.i == 1"})
+    event = _event("1", i=1, payload="x")
+    projected = projection.project(event)
+
+    assert projection.rehydrate({"m": projected}) == {"m": event}
+    assert projection.rehydrate({"m": {"i": 1}}) == {"m": {"i": 1}}
+    assert len(projection) == 0
+
+
+def test_retains_events_of_multi_event_rules():
+    projection = _projection(
+        {"condition": {"all": ["event.i == 1", "event.j == events.m_0.k"]}},
+        {"condition": "event.x == 1"},
+        default_events_ttl="10 minutes",
+    )
+    first = _event("1", i=1, k=2, payload="x")
+    other = _event("2", y=1, payload="x")
+    second = _event("3", j=2, payload="x")
+
+    assert projection.project(first) == _event("1", i=1, k=2)
+    projection.project(other)
+    projected = projection.project(second)
+
+    assert projection.retention == 600
+    assert len(projection) == 2
+    assert projection.rehydrate(
+        {"m_0": _event("1", i=1, k=2), "m_1": projected}
+    ) == {"m_0": first, "m_1": second}
+    assert len(projection) == 0
+
+
+def test_retained_events_expire():
+    projection = _projection(
+        {
+            "condition": "event.i == 1",
+            "throttle": {
+                "once_after": "5 minutes",
+                "group_by_attributes": ["event.meta.hosts", "event.host"],
+            },
+        }
+    )
+    assert projection.retention == 2 * 60 * 60
+    assert "host" in projection.tree
+
+    with patch("ansible_rulebook.projection.time.monotonic", return_value=0):
+        projection.project(_event("1", i=1, payload="x"))
+    with patch(
+        "ansible_rulebook.projection.time.monotonic", return_value=7201
+    ):
+        projection.project(_event("2", i=1, payload="x"))
+
+    assert len(projection) == 1
+
+
+def test_oldest_retained_events_are_evicted():
+    projection = _projection(
+        {"condition": {"all": ["event.i == 1", "event.j == 2"]}}, limit=2
+    )
+    events = [_event(str(uuid), i=1, payload="x") for uuid in range(3)]
+    projected = [projection.project(event) for event in events]
+
+    assert len(projection) == 2
+    assert projection.get_stats() == {
+        "retained": 2,
+        "max_retained": 2,
+        "evicted": 1,
+    }
+    assert projection.rehydrate({"m_0": projected[0]}) == {"m_0": projected[0]}
+    assert projection.rehydrate({"m_0": projected[1]}) == {"m_0": events[1]}
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        "event.i == events.m_0",
+        "event[0] == 1",
+    ],
+)
+def test_whole_events_are_posted(condition):
+    assert _projection({"condition": condition}) is None
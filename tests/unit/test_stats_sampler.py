@@ -0,0 +1,95 @@
+#  Copyright 2026 Red Hat, Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from ansible_rulebook.admission import AdmissionIndex
+from ansible_rulebook.conf import settings
+from ansible_rulebook.stats_sampler import SessionStatsSampler
+
+
+def _stats(triggered, clock=0):
+    return {
+        "ruleSetName": "rs1",
+        "rulesTriggered": triggered,
+        "lastClockTime": clock,
+    }
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_within_interval(monkeypatch):
+    monkeypatch.setattr(settings, "session_stats_interval", 60000)
+    sampler = SessionStatsSampler()
+    event_log = asyncio.Queue()
+
+    with patch(
+        "ansible_rulebook.stats_sampler.session_stats",
+        side_effect=[_stats(1), _stats(2)],
+    ) as mock_stats:
+        for _ in range(5):
+            await sampler.send_changed(event_log, "rs1")
+
+    mock_stats.assert_called_once_with("rs1")
+    assert event_log.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_stats_are_not_sent(monkeypatch):
+    monkeypatch.setattr(settings, "session_stats_interval", 0)
+    sampler = SessionStatsSampler()
+    event_log = asyncio.Queue()
+
+    with patch(
+        "ansible_rulebook.stats_sampler.session_stats",
+        side_effect=[_stats(1, 10), _stats(1, 20), _stats(2, 30)],
+    ):
+        for _ in range(3):
+            await sampler.send_changed(event_log, "rs1")
+
+    sent = [event_log.get_nowait()["stats"] for _ in range(event_log.qsize())]
+    assert [stats["rulesTriggered"] for stats in sent] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_stats_are_shared(monkeypatch):
+    monkeypatch.setattr(settings, "session_stats_interval", 60000)
+    sampler = SessionStatsSampler()
+    event_log = asyncio.Queue()
+
+    stats = sampler.record("rs1", _stats(3))
+    sampler.mark_sent("rs1", stats)
+    with patch("ansible_rulebook.stats_sampler.session_stats") as mock_stats:
+        await sampler.send_changed(event_log, "rs1")
+
+    mock_stats.assert_not_called()
+    assert event_log.empty()
+
+
+def test_dropped_events_are_counted():
+    sampler = SessionStatsSampler()
+    admission = AdmissionIndex([])
+    admission.dropped = 2
+    sampler.watch("rs1", admission)
+
+    stats = sampler.record(
+        "rs1", {"eventsProcessed": 3, "eventsSuppressed": 1}
+    )
+
+    assert stats == {"eventsProcessed": 5, "eventsSuppressed": 3}
+    sampler.forget("rs1")
+    assert sampler.adjust("rs1", {"eventsProcessed": 3}) == {
+        "eventsProcessed": 3
+    }
@@ -14,9 +14,11 @@
 import importlib.metadata
 import logging
 import subprocess
+from collections import ChainMap
 from unittest.mock import patch
 
 import pytest
+from jinja2.exceptions import UndefinedError
 
 from ansible_rulebook.conf import settings
 from ansible_rulebook.exception import (
@@ -33,6 +35,7 @@ from ansible_rulebook.util import (
     mask_sensitive_variable_values,
     startup_logging,
     strtobool,
+    substitute_variables,
     validate_file_path,
 )
 from ansible_rulebook.vault import Vault
@@ -460,3 +463,20 @@ def test_validate_file_path_oserror(tmp_path, monkeypatch):
 
     with pytest.raises(ValueError, match="Invalid test file path"):
         validate_file_path(str(test_file), "Test file")
+
+
+def test_substitute_variables_with_scope():
+    variables = {"hosts": ["h1", "h2"], "event": {"i": 0}}
+    scope = ChainMap({}, variables)
+    scope["event"] = {"i": 1}
+
+    assert substitute_variables(
+        {
+            "msg": "{{ event.i }} of {{ hosts | length }}",
+            "n": "{{ range(2) }}",
+        },
+        scope,
+    ) == {"msg": "1 of 2", "n": range(0, 2)}
+    assert variables == {"hosts": ["h1", "h2"], "event": {"i": 0}}
+    with pytest.raises(UndefinedError):
+        substitute_variables("{{ missing.x }}", scope)